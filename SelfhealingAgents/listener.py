@@ -1,5 +1,6 @@
 import os
 from pathlib import Path
+from typing import Optional
 from dotenv import load_dotenv, find_dotenv
 
 from robot import result, running
@@ -8,7 +9,10 @@ from robot.api.interfaces import ListenerV3
 
 from SelfhealingAgents.utils.cfg import Cfg
 from SelfhealingAgents.self_healing_system.self_healing_engine import SelfHealingEngine
+from SelfhealingAgents.self_healing_system.event_loop_runner import EventLoopRunner
+from SelfhealingAgents.self_healing_system.llm.request_scheduler import RequestScheduler
 from SelfhealingAgents.self_healing_system.reports.report_generator import ReportGenerator
+from SelfhealingAgents.self_healing_system.reports.report_shards import append_report_shard, report_shard_path
 from SelfhealingAgents.self_healing_system.schemas.internal_state.listener_state import ListenerState
 from SelfhealingAgents.self_healing_system.reports.report_info_persistence import (
     save_report_info,
@@ -31,8 +35,12 @@ class SelfhealingAgents(ListenerV3):
         ROBOT_LISTENER_API_VERSION (int): The Robot Framework listener API version (3).
         ROBOT_LIBRARY_LISTENER (SelfHealing-Agents): Reference to the listener instance (set to self).
         _state (ListenerState): The internal state object shared with the self-healing engine.
+        _event_loop_runner (EventLoopRunner): The event loop the healing pipeline runs on during the whole run.
         _self_healing_engine (SelfHealingEngine): The self-healing engine instance.
-        _report_generator (ReportGenerator): The report generator instance.
+        _report_generator (Optional[ReportGenerator]): The report generator instance, or None if the
+            healing events are written to a report shard.
+        _report_shard (Optional[Path]): Shard file of this worker, if report shards are enabled.
+        _flushed_reports (int): Number of healing events already written to the report shard.
         _closed (bool): Whether the listener has been closed.
     """
     ROBOT_LIBRARY_SCOPE = "GLOBAL"
@@ -48,8 +56,18 @@ class SelfhealingAgents(ListenerV3):
         self._cfg: Cfg = Cfg()
         self.ROBOT_LIBRARY_LISTENER: SelfhealingAgents = self
         self._state: ListenerState = ListenerState(cfg=self._cfg)  # type: ignore
-        self._self_healing_engine: SelfHealingEngine = SelfHealingEngine(self._state)
-        self._report_generator: ReportGenerator = ReportGenerator(base_dir=self._cfg.report_directory)
+        self._event_loop_runner: EventLoopRunner = EventLoopRunner()
+        self._self_healing_engine: SelfHealingEngine = SelfHealingEngine(
+            self._state, event_loop_runner=self._event_loop_runner
+        )
+        # Parallel workers must not reset the shared report directory, their shards are merged afterwards
+        self._report_shard: Optional[Path] = (
+            report_shard_path(self._cfg.report_shard_directory) if self._cfg.report_shard_directory else None
+        )
+        self._report_generator: Optional[ReportGenerator] = (
+            ReportGenerator(base_dir=self._cfg.report_directory) if self._report_shard is None else None
+        )
+        self._flushed_reports: int = 0
         self._closed: bool = False
         rf_logger.info(
             f"SelfhealingAgents initialized; healing="
@@ -115,6 +133,19 @@ class SelfhealingAgents(ListenerV3):
         """
         self._self_healing_engine.start_test(data, result_)
 
+    def start_keyword(
+            self, data: running.Keyword, result_: result.Keyword
+    ) -> None:
+        """Handles the start of a keyword execution.
+
+        Invoked by Robot Framework when a keyword starts. Delegates to the self-healing engine.
+
+        Args:
+            data: The running keyword data.
+            result_: The result object for the keyword.
+        """
+        self._self_healing_engine.start_keyword(data, result_)
+
     def end_keyword(
             self, data: running.Keyword, result_: result.Keyword
     ) -> None:
@@ -140,6 +171,8 @@ class SelfhealingAgents(ListenerV3):
             result_: The result object for the test case.
         """
         self._self_healing_engine.end_test(data, result_)
+        if self._report_shard is not None:
+            self._flush_report_shard()
 
     def close(self) -> None:
         """Handles the closure of the test suite or all suites when scope is 'GLOBAL'.
@@ -148,16 +181,26 @@ class SelfhealingAgents(ListenerV3):
         - On the first run (no JSON exists yet), we create the JSON from the current report_info.
         - On the rerun (JSON exists), we load previous report_info, append the current run's
           entries, and use the combined list for report generation.
+        When report shards are enabled, the remaining healing events and the memo statistics are written
+        to the shard of this worker instead, and reports are generated when the shards are merged.
         """
         if self._closed:
             return
         self._closed = True
+        self._self_healing_engine.close()
+        self._close_event_loop()
+
+        if self._report_shard is not None:
+            self._flush_report_shard(memo_stats=self._state.memo_stats)
+            return
 
         # case 1: No rerun activated
         if not self._state.cfg.is_rerun_activated:
             if self._state.report_info:
                 try:
-                    self._report_generator.generate_reports(self._state.report_info)
+                    self._report_generator.generate_reports(
+                        self._state.report_info, memo_stats=self._state.memo_stats
+                    )
                 except Exception as e:
                     rf_logger.warn(f"Report generation failed: {e}")
             return
@@ -178,7 +221,9 @@ class SelfhealingAgents(ListenerV3):
                     )
                 if self._state.report_info:
                     try:
-                        self._report_generator.generate_reports(self._state.report_info)
+                        self._report_generator.generate_reports(
+                            self._state.report_info, memo_stats=self._state.memo_stats
+                        )
                     except Exception as e:
                         rf_logger.warn(f"Report generation failed on initial run: {e}")
             else:
@@ -197,7 +242,9 @@ class SelfhealingAgents(ListenerV3):
                 save_report_info(ordered, json_path)
                 if ordered:
                     try:
-                        self._report_generator.generate_reports(ordered)
+                        self._report_generator.generate_reports(
+                            ordered, memo_stats=self._state.memo_stats
+                        )
                     except Exception as e:
                         rf_logger.warn(f"Report generation failed on rerun: {e}")
                 try:
@@ -206,4 +253,30 @@ class SelfhealingAgents(ListenerV3):
                 except Exception as e:
                     rf_logger.warn(f"Failed to remove temporary report_info file {json_path}: {e}")
         except Exception as e:
-            rf_logger.warn(f"Error handling report_info persistence: {e}")
\ No newline at end of file
+            rf_logger.warn(f"Error handling report_info persistence: {e}")
+
+    def _flush_report_shard(self, **kwargs) -> None:
+        """Appends the healing events recorded since the last flush to the report shard of this worker.
+
+        Args:
+            **kwargs: Passed on to append_report_shard, e.g. the memo statistics at the end of the run.
+        """
+        report_info = list(self._state.report_info or [])
+        try:
+            append_report_shard(self._report_shard, report_info[self._flushed_reports:], **kwargs)
+            self._flushed_reports = len(report_info)
+        except Exception as e:
+            rf_logger.warn(f"Writing the report shard {self._report_shard} failed: {e}")
+
+    def _close_event_loop(self) -> None:
+        """Closes the event loop of the healing pipeline with its HTTP client and pooled agents.
+
+        The request schedulers are dropped as well, so that a later run in the same process starts with
+        fresh ones.
+        """
+        try:
+            self._event_loop_runner.close()
+        except Exception as e:
+            rf_logger.warn(f"Closing the event loop failed: {e}")
+        finally:
+            RequestScheduler.reset()
@@ -0,0 +1,98 @@
+"""Merges the report shards of parallel workers into one set of SelfhealingReports.
+
+With REPORT_SHARD_DIRECTORY set, every worker process, e.g. of pabot, streams its healing events to its
+own shard file instead of generating the reports. The shards are merged once after all workers finished,
+either from the command line:
+
+    python -m SelfhealingAgents.merge_reports [shard_directory] [--report-directory DIR] [--keep-shards]
+
+or as a pre-rebot modifier when the outputs are combined:
+
+    rebot --prerebotmodifier SelfhealingAgents.merge_reports.MergeReports:shard_directory output*.xml
+"""
+import argparse
+from typing import List, Optional
+
+from dotenv import find_dotenv, load_dotenv
+from robot.api import SuiteVisitor
+
+from SelfhealingAgents.utils.cfg import Cfg
+from SelfhealingAgents.self_healing_system.reports.report_shards import merge_report_shards
+
+
+class MergeReports(SuiteVisitor):
+    """Pre-rebot modifier that merges the report shards before rebot processes the combined outputs.
+
+    Attributes:
+        _shard_dir (Optional[str]): Directory of the shard files, REPORT_SHARD_DIRECTORY if not given.
+        _report_directory (Optional[str]): Directory of the merged reports, REPORT_DIRECTORY if not given.
+        _merged (bool): Whether the shards have been merged.
+    """
+    def __init__(self, shard_dir: Optional[str] = None, report_directory: Optional[str] = None) -> None:
+        """Initializes the MergeReports modifier.
+
+        Args:
+            shard_dir: Directory of the shard files, REPORT_SHARD_DIRECTORY if not given.
+            report_directory: Directory of the merged reports, REPORT_DIRECTORY if not given.
+        """
+        self._shard_dir: Optional[str] = shard_dir
+        self._report_directory: Optional[str] = report_directory
+        self._merged: bool = False
+
+    def start_suite(self, suite) -> bool:
+        """Merges the shards when the root suite is visited, without modifying the results."""
+        if not self._merged:
+            self._merged = True
+            _merge(self._shard_dir, self._report_directory, keep_shards=False)
+        return False
+
+
+def _merge(shard_dir: Optional[str], report_directory: Optional[str], *, keep_shards: bool) -> int:
+    """Merges the shards, taking directories that are not given from the configuration.
+
+    Args:
+        shard_dir: Directory of the shard files.
+        report_directory: Directory of the merged reports.
+        keep_shards: Whether the shard files are kept after merging.
+
+    Returns:
+        The number of healing events in the merged reports.
+
+    Raises:
+        ValueError: If no shard directory is given or configured.
+    """
+    load_dotenv(find_dotenv(usecwd=True), override=False)
+    cfg: Cfg = Cfg()
+    shard_dir = shard_dir or cfg.report_shard_directory
+    if not shard_dir:
+        raise ValueError("No shard directory given and REPORT_SHARD_DIRECTORY is not set.")
+    return merge_report_shards(
+        shard_dir, report_directory or cfg.report_directory, remove_shards=not keep_shards
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command line entry point of the report merge."""
+    parser = argparse.ArgumentParser(
+        prog="python -m SelfhealingAgents.merge_reports",
+        description="Merge the SelfhealingAgents report shards of parallel workers.",
+    )
+    parser.add_argument(
+        "shard_dir", nargs="?", help="Directory of the shard files. Defaults to REPORT_SHARD_DIRECTORY."
+    )
+    parser.add_argument(
+        "--report-directory", help="Directory of the merged reports. Defaults to REPORT_DIRECTORY."
+    )
+    parser.add_argument(
+        "--keep-shards", action="store_true", help="Keep the shard files after merging."
+    )
+    args = parser.parse_args(argv)
+    try:
+        count: int = _merge(args.shard_dir, args.report_directory, keep_shards=args.keep_shards)
+    except ValueError as e:
+        parser.error(str(e))
+    print(f"Merged {count} healing events into SelfhealingReports.")
+
+
+if __name__ == "__main__":
+    main()
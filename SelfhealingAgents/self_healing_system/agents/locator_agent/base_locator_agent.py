@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Final, Optional
 
 from pydantic_ai import Agent, ModelRetry, RunContext
 from pydantic_ai.agent import AgentRunResult
@@ -10,6 +10,9 @@ from SelfhealingAgents.self_healing_system.agents.prompts.locator.prompts_locato
     PromptsLocatorGenerationAgent,
     PromptsLocatorSelectionAgent,
 )
+from SelfhealingAgents.self_healing_system.context_retrieving.dom_snapshot import (
+    DomSnapshot,
+)
 from SelfhealingAgents.self_healing_system.context_retrieving.library_dom_utils.base_dom_utils import (
     BaseDomUtils,
 )
@@ -17,11 +20,70 @@ from SelfhealingAgents.self_healing_system.llm.client_model import get_client_mo
 from SelfhealingAgents.self_healing_system.schemas.api.locator_healing import (
     LocatorHealingResponse,
 )
+from SelfhealingAgents.self_healing_system.schemas.internal_state.locator_status import (
+    LocatorStatus,
+)
 from SelfhealingAgents.self_healing_system.schemas.internal_state.prompt_payload import (
     PromptPayload,
 )
 from SelfhealingAgents.utils.cfg import Cfg
-from SelfhealingAgents.utils.logging import log
+from SelfhealingAgents.utils.logging import log, log_usage
+
+
+# Keywords whose locator must resolve to a clickable element
+_CLICKABLE_KEYWORDS: Final[tuple[str, ...]] = (
+    "click",
+    "click with options",
+    "select options by",
+    "deselect options",
+    "tap",
+    "check checkbox",
+    "uncheck checkbox",
+    "checkbox",
+    "double click",
+    "get list items",
+    "get selected list",
+    "list selection",
+    "list should have",
+    "mouse down",
+    "contain button",
+    "contain link",
+    "contain list",
+    "contain checkbox",
+    "contain radio button",
+    "radio button should",
+    "select checkbox",
+    "select all from list",
+    "select from list by",
+    "select radio button",
+    "unselect from list by",
+    "unselect radio button",
+    "unselect checkbox",
+)
+
+# Keywords that type into or upload to their element
+_TEXT_INPUT_KEYWORDS: Final[tuple[str, ...]] = (
+    "fill text",
+    "fill secret",
+    "type text",
+    "type secret",
+    "input text",
+    "input password",
+    "clear text",
+    "press keys",
+    "upload file",
+    "choose file",
+)
+
+# Keywords that assert, wait for or read their element, for which a missing element may be expected
+_PASSIVE_KEYWORD_PARTS: Final[tuple[str, ...]] = (
+    "should",
+    "wait",
+    "get ",
+    "count",
+    "contain",
+    "state",
+)
 
 
 class BaseLocatorAgent(ABC):
@@ -89,6 +151,20 @@ class BaseLocatorAgent(ABC):
                 output_type=str,
             )
 
+    @property
+    def dom_utility(self) -> BaseDomUtils:
+        """The DOM utility used to validate locators."""
+        return self._dom_utility
+
+    @dom_utility.setter
+    def dom_utility(self, dom_utility: BaseDomUtils) -> None:
+        """Replaces the DOM utility, e.g. when a pooled agent is reused for another healing attempt.
+
+        Args:
+            dom_utility (BaseDomUtils): DOM utility instance for validation.
+        """
+        self._dom_utility = dom_utility
+
     def _setup_output_validation(self) -> None:
         """Sets up output validation for the generation agent.
 
@@ -122,42 +198,19 @@ class BaseLocatorAgent(ABC):
                     raise ModelRetry("No fixed locators found in the response.")
 
                 suggestions = [self._process_locator(x) for x in fixed_locators]
-                suggestions = self._sort_locators(suggestions)
 
                 # Filter out non-clickable locators if deps.ct
                 keyword_name = ctx.deps.keyword_name
-                clickable_keywords = [
-                    "click",
-                    "click with options",
-                    "select options by",
-                    "deselect options",
-                    "tap",
-                    "check checkbox",
-                    "uncheck checkbox",
-                    "checkbox",
-                    "double click",
-                    "get list items",
-                    "get selected list",
-                    "list selection",
-                    "list should have",
-                    "mouse down",
-                    "contain button",
-                    "contain link",
-                    "contain list",
-                    "contain checkbox",
-                    "contain radio button",
-                    "radio button should",
-                    "select checkbox",
-                    "select all from list",
-                    "select from list by",
-                    "select radio button",
-                    "unselect from list by",
-                    "unselect radio button",
-                    "unselect checkbox",
-                ]
-                if keyword_name and any(
-                    keyword in keyword_name.lower() for keyword in clickable_keywords
-                ):
+                filter_clickable = self.is_clickable_keyword(keyword_name)
+
+                # Validate against the captured DOM first, the live page only if needed
+                statuses = self._validate_locators(
+                    suggestions,
+                    dom_snapshot=ctx.deps.dom_snapshot,
+                    check_clickable=filter_clickable,
+                )
+                suggestions = self._sort_locators(suggestions, statuses)
+                if filter_clickable:
                     rf_logger.info(
                         f"Filtering clickable locators for keyword '{keyword_name}'",
                         also_console=True,
@@ -166,11 +219,16 @@ class BaseLocatorAgent(ABC):
                         f"Locators before filtering: {suggestions}",
                         also_console=True,
                     )
-                    suggestions = self._filter_clickable_locators(suggestions)
+                    suggestions = self._filter_clickable_locators(
+                        suggestions, statuses
+                    )
                     rf_logger.info(
                         f"Locators after filtering: {suggestions}",
                         also_console=True,
                     )
+                suggestions = self._confirm_locators_live(
+                    suggestions, statuses, filter_clickable=filter_clickable
+                )
 
                 if suggestions:
                     return LocatorHealingResponse(suggestions=suggestions)
@@ -221,6 +279,7 @@ class BaseLocatorAgent(ABC):
             usage_limits=self._usage_limits,
             model_settings={"temperature": self._cfg.locator_agent_temperature},
         )
+        log_usage("Locator generation agent", response.usage())
         if not isinstance(response.output, LocatorHealingResponse):
             raise ModelRetry(
                 "Locator healing response is not of type LocatorHealingResponse."
@@ -248,9 +307,16 @@ class BaseLocatorAgent(ABC):
 
             metadata_list = []
 
-            proposals = self._dom_utility.get_locator_proposals(
-                failed_locator, keyword_name
+            dom_snapshot = ctx.deps.dom_snapshot
+            proposals = (
+                dom_snapshot.locator_proposals.get((failed_locator, keyword_name))
+                if dom_snapshot is not None
+                else None
             )
+            if proposals is None:
+                proposals = self._dom_utility.get_locator_proposals(
+                    failed_locator, keyword_name, dom_snapshot=dom_snapshot
+                )
 
             if not proposals:
                 raise ModelRetry("No locator proposals could be generated from DOM")
@@ -258,42 +324,14 @@ class BaseLocatorAgent(ABC):
             # Process locators for library compatibility
             processed_proposals = [self._process_locator(loc) for loc in proposals]
 
-            # Sort and filter locators
-            sorted_proposals = self._sort_locators(processed_proposals)
+            # Validate all locators at once, then sort and filter them
+            statuses = self._validate_locators(
+                processed_proposals, include_metadata=True
+            )
+            sorted_proposals = self._sort_locators(processed_proposals, statuses)
 
             # Filter clickable locators if needed for click-related keywords
-            clickable_keywords = [
-                "click",
-                "click with options",
-                "select options by",
-                "deselect options",
-                "tap",
-                "check checkbox",
-                "uncheck checkbox",
-                "checkbox",
-                "double click",
-                "get list items",
-                "get selected list",
-                "list selection",
-                "list should have",
-                "mouse down",
-                "contain button",
-                "contain link",
-                "contain list",
-                "contain checkbox",
-                "contain radio button",
-                "radio button should",
-                "select checkbox",
-                "select all from list",
-                "select from list by",
-                "select radio button",
-                "unselect from list by",
-                "unselect radio button",
-                "unselect checkbox",
-            ]
-            if keyword_name and any(
-                keyword in keyword_name.lower() for keyword in clickable_keywords
-            ):
+            if self.is_clickable_keyword(keyword_name):
                 rf_logger.info(
                     f"Filtering clickable locators for keyword '{keyword_name}'",
                     also_console=True,
@@ -302,15 +340,16 @@ class BaseLocatorAgent(ABC):
                     f"Locators before filtering: {sorted_proposals}",
                     also_console=True,
                 )
-                sorted_proposals = self._filter_clickable_locators(sorted_proposals)
+                sorted_proposals = self._filter_clickable_locators(
+                    sorted_proposals, statuses
+                )
                 rf_logger.info(
                     f"Locators after filtering: {sorted_proposals}",
                     also_console=True,
                 )
 
             for loc in sorted_proposals:
-                # Log each proposal for debugging
-                metadata = self._dom_utility.get_locator_metadata(loc)
+                metadata = statuses[loc].metadata
                 metadata_list.append(metadata[0] if metadata else {})
 
             response: AgentRunResult[str] = await self.selection_agent.run(
@@ -323,6 +362,7 @@ class BaseLocatorAgent(ABC):
                 usage_limits=self._usage_limits,
                 model_settings={"temperature": self._cfg.locator_agent_temperature},
             )
+            log_usage("Locator selection agent", response.usage())
 
             # Parse the selected locator from the response
             if isinstance(response.output, str):
@@ -361,72 +401,115 @@ class BaseLocatorAgent(ABC):
         """
         pass
 
-    def _is_locator_valid(self, locator: str) -> bool:
-        """Checks if the locator is valid and unique in the current context.
-
-        Args:
-            locator (str): The locator to validate.
-
-        Returns:
-            bool: True if the locator is valid and unique, False otherwise.
-        """
-        try:
-            return self._dom_utility.is_locator_valid(locator)
-        except Exception:
-            return False
-
-    def _is_locator_unique(self, locator: str) -> bool:
-        """Checks if the locator is unique in the current context.
+    def _validate_locators(
+        self,
+        locators: list[str],
+        *,
+        include_metadata: bool = False,
+        dom_snapshot: Optional[DomSnapshot] = None,
+        check_clickable: bool = True,
+    ) -> dict[str, LocatorStatus]:
+        """Validates all locators with a single bulk request to the DOM utility.
 
         Args:
-            locator (str): The locator to check.
+            locators (list[str]): List of locators to validate.
+            include_metadata (bool): Whether to collect element metadata as well.
+            dom_snapshot (Optional[DomSnapshot]): Snapshot of the current page. If given,
+                locators are validated offline against it where possible.
+            check_clickable (bool): Whether the clickability of the locators is needed.
 
         Returns:
-            bool: True if the locator is unique, False otherwise.
+            dict[str, LocatorStatus]: Status of each locator. Locators that could not be
+                validated are missing.
         """
         try:
-            return self._dom_utility.is_locator_unique(locator)
+            statuses = self._dom_utility.validate_locators(
+                locators,
+                include_metadata=include_metadata,
+                dom_snapshot=dom_snapshot,
+                check_clickable=check_clickable,
+            )
         except Exception:
-            return False
-
-    def _is_element_clickable(self, locator: str) -> bool:
-        """Checks if the element identified by the locator is clickable.
+            return {}
+        return {status.locator: status for status in statuses}
+
+    def _confirm_locators_live(
+        self,
+        locators: list[str],
+        statuses: dict[str, LocatorStatus],
+        *,
+        filter_clickable: bool = False,
+    ) -> list[str]:
+        """Confirms the ranked locators that were only validated offline against the live page.
+
+        The offline counts are lower bounds, since the snapshot is pruned, so every offline
+        status is confirmed with a single live validation of those locators. The locators are
+        then ranked again, and locators that could not be confirmed are dropped.
 
         Args:
-            locator (str): The locator to check.
+            locators (list[str]): Ranked list of locators, best first.
+            statuses (dict[str, LocatorStatus]): Validation result of the locators.
+            filter_clickable (bool): Whether only clickable locators are accepted.
 
         Returns:
-            bool: True if the element is clickable, False otherwise.
+            list[str]: The ranked locators, re-ranked against the live page if needed.
         """
-        try:
-            return self._dom_utility.is_element_clickable(locator)
-        except Exception:
-            return False
-
-    def _sort_locators(self, locators: list[str]) -> list[str]:
+        offline: list[str] = [loc for loc in locators if statuses[loc].offline]
+        if not offline:
+            return locators
+        live_statuses: dict[str, LocatorStatus] = {
+            **{loc: statuses[loc] for loc in locators if loc not in offline},
+            **self._validate_locators(offline),
+        }
+        confirmed: list[str] = self._sort_locators(
+            [loc for loc in locators if loc in live_statuses], live_statuses
+        )
+        if filter_clickable:
+            confirmed = self._filter_clickable_locators(confirmed, live_statuses)
+        return confirmed
+
+    def _sort_locators(
+        self,
+        locators: list[str],
+        statuses: Optional[dict[str, LocatorStatus]] = None,
+    ) -> list[str]:
         """Sorts locators based on their uniqueness and validity.
 
         Args:
             locators (list[str]): List of locators to sort.
+            statuses (Optional[dict[str, LocatorStatus]]): Bulk validation result of the
+                locators. Validated on demand if not given.
 
         Returns:
             list[str]: Sorted list of locators with unique locators first.
         """
-        valid_locators = [loc for loc in locators if self._is_locator_valid(loc)]
-        return sorted(
-            valid_locators, key=lambda x: self._is_locator_unique(x), reverse=True
-        )
-
-    def _filter_clickable_locators(self, locators: list[str]) -> list[str]:
+        if statuses is None:
+            statuses = self._validate_locators(locators)
+        valid_locators = [
+            loc for loc in locators if loc in statuses and statuses[loc].valid
+        ]
+        return sorted(valid_locators, key=lambda x: statuses[x].unique, reverse=True)
+
+    def _filter_clickable_locators(
+        self,
+        locators: list[str],
+        statuses: Optional[dict[str, LocatorStatus]] = None,
+    ) -> list[str]:
         """Filters locators to only include clickable ones.
 
         Args:
             locators (list[str]): List of locators to filter.
+            statuses (Optional[dict[str, LocatorStatus]]): Bulk validation result of the
+                locators. Validated on demand if not given.
 
         Returns:
             list[str]: List of locators that are clickable.
         """
-        return [loc for loc in locators if self._is_element_clickable(loc)]
+        if statuses is None:
+            statuses = self._validate_locators(locators)
+        return [
+            loc for loc in locators if loc in statuses and statuses[loc].clickable
+        ]
 
     @staticmethod
     @abstractmethod
@@ -440,3 +523,51 @@ class BaseLocatorAgent(ABC):
             bool: True if the error is due to a failed locator, False otherwise.
         """
         pass
+
+    @staticmethod
+    def is_clickable_keyword(keyword_name: str | None) -> bool:
+        """Checks if the keyword needs its locator to resolve to a clickable element.
+
+        Args:
+            keyword_name (str | None): The name of the keyword.
+
+        Returns:
+            bool: True if the keyword clicks, taps or selects the element, False otherwise.
+        """
+        return bool(keyword_name) and any(
+            keyword in keyword_name.lower() for keyword in _CLICKABLE_KEYWORDS
+        )
+
+    @staticmethod
+    def is_action_keyword(keyword_name: str | None) -> bool:
+        """Checks if the keyword acts on its element, as opposed to asserting, waiting for or reading it.
+
+        Args:
+            keyword_name (str | None): The name of the keyword.
+
+        Returns:
+            bool: True if the keyword clicks, selects or types into the element, False otherwise.
+        """
+        if not keyword_name:
+            return False
+        name: str = keyword_name.lower()
+        if any(part in name for part in _PASSIVE_KEYWORD_PARTS):
+            return False
+        return BaseLocatorAgent.is_clickable_keyword(name) or any(
+            keyword in name for keyword in _TEXT_INPUT_KEYWORDS
+        )
+
+    @staticmethod
+    def is_unambiguous_locator_error(message: str) -> bool:
+        """Checks if the error message unambiguously reports a locator that matches no element.
+
+        Such failures are routed to the locator agent without asking the orchestrator LLM. Library
+        flavors override this method with the error messages of their library.
+
+        Args:
+            message (str): The error message to check.
+
+        Returns:
+            bool: True if the error certainly is due to a failed locator, False if it is ambiguous.
+        """
+        return False
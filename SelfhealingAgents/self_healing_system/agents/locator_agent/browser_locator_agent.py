@@ -34,20 +34,6 @@ class BrowserLocatorAgent(BaseLocatorAgent):
         """
         return convert_locator_to_browser(locator)
 
-    def _is_locator_valid(self, locator: str) -> bool:
-        """Validates a locator using Browser library DOM utilities.
-
-        Args:
-            locator (str): The locator string to validate.
-
-        Returns:
-            bool: True if the locator is valid and unique, False otherwise. Returns True if DOM utility is not available.
-        """
-        try:
-            return self._dom_utility.is_locator_valid(locator)
-        except Exception:
-            return False
-
     @staticmethod
     def is_failed_locator_error(message: str) -> bool:
         """Checks if the error message is due to a failed locator.
@@ -62,3 +48,18 @@ class BrowserLocatorAgent(BaseLocatorAgent):
             "waiting for locator" in message
             and "waiting for element to be" not in message
         ) or "Element is not an" in message
+
+    @staticmethod
+    def is_unambiguous_locator_error(message: str) -> bool:
+        """Checks if the error message unambiguously reports a locator that matches no element.
+
+        Timeouts while waiting for a locator are unambiguous, whereas elements of an unexpected
+        type may as well be caused by the test itself.
+
+        Args:
+            message (str): The error message to check.
+
+        Returns:
+            bool: True if the error certainly is due to a failed locator, False if it is ambiguous.
+        """
+        return "waiting for locator" in message and "waiting for element to be" not in message
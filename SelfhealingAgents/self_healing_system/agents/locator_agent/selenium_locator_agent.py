@@ -35,36 +35,41 @@ class SeleniumLocatorAgent(BaseLocatorAgent):
         """
         return self._convert_locator_to_selenium(locator)
 
-    def _is_locator_valid(self, locator: str) -> bool:
-        """Validates a locator using Selenium library DOM utilities.
+    @staticmethod
+    def is_failed_locator_error(message: str) -> bool:
+        """Checks if the error message is due to a failed locator.
 
         Args:
-            locator (str): The locator string to validate.
+            message (str): The error message to check.
 
         Returns:
-            bool: True if the locator is valid, False otherwise. Returns True if DOM utility is not available.
+            bool: True if the error is due to a failed locator, False otherwise.
         """
-        try:
-            return self._dom_utility.is_locator_valid(locator)
-        except Exception:
-            return False
+        return (
+            ("with locator" in message and "not found" in message)
+            or ("No element with locator" in message and "found" in message)
+            or ("No radio button with name" in message and "found" in message)
+            or ("Page should have contained" in message)
+            or ("invalid element state" in message)
+        )
 
     @staticmethod
-    def is_failed_locator_error(message: str) -> bool:
-        """Checks if the error message is due to a failed locator.
+    def is_unambiguous_locator_error(message: str) -> bool:
+        """Checks if the error message unambiguously reports a locator that matches no element.
+
+        Missing elements are unambiguous, whereas missing page content and invalid element states
+        may as well be caused by the application or the test itself.
 
         Args:
             message (str): The error message to check.
 
         Returns:
-            bool: True if the error is due to a failed locator, False otherwise.
+            bool: True if the error certainly is due to a failed locator, False if it is ambiguous.
         """
         return (
             ("with locator" in message and "not found" in message)
             or ("No element with locator" in message and "found" in message)
             or ("No radio button with name" in message and "found" in message)
-            or ("Page should have contained" in message)
-            or ("invalid element state" in message)
         )
 
     @staticmethod
@@ -1,6 +1,6 @@
 from pydantic_ai import Agent, ModelRetry, RunContext
 from pydantic_ai.agent import AgentRunResult
-from pydantic_ai.usage import UsageLimits
+from pydantic_ai.usage import RunUsage, UsageLimits
 from robot.api import logger as rf_logger
 
 from SelfhealingAgents.self_healing_system.agents.locator_agent.base_locator_agent import (
@@ -18,7 +18,7 @@ from SelfhealingAgents.self_healing_system.schemas.internal_state.prompt_payload
     PromptPayload,
 )
 from SelfhealingAgents.utils.cfg import Cfg
-from SelfhealingAgents.utils.logging import log
+from SelfhealingAgents.utils.logging import log, log_usage
 
 
 class OrchestratorAgent:
@@ -28,6 +28,8 @@ class OrchestratorAgent:
         _cfg (Cfg): Instance of Cfg config class containing user-defined app configuration.
         _locator_agent (BaseLocatorAgent): LocatorAgent instance for handling locator healing.
         _usage_limits (UsageLimits): Usage limits for the orchestrator agent.
+        _routing (str): Routing mode, 'llm' or 'rules'. With 'rules', unambiguous locator errors are
+            routed to the locator agent without an orchestrator LLM request.
         _agent (Agent[PromptPayload, str]): The underlying agent for orchestrating healing.
     """
 
@@ -44,6 +46,7 @@ class OrchestratorAgent:
         """
         self._cfg = cfg
         self._locator_agent: BaseLocatorAgent = locator_agent
+        self._routing: str = cfg.orchestrator_routing
         self._usage_limits: UsageLimits = UsageLimits(
             request_limit=cfg.request_limit, total_tokens_limit=cfg.total_tokens_limit
         )
@@ -74,15 +77,43 @@ class OrchestratorAgent:
         if not self._locator_agent.is_failed_locator_error(robot_ctx_payload.error_msg):
             return NoHealingNeededResponse(message=robot_ctx_payload.error_msg)
 
+        if self._routing == "rules" and self._locator_agent.is_unambiguous_locator_error(
+            robot_ctx_payload.error_msg
+        ):
+            return await self._route_to_locator_agent(robot_ctx_payload)
+
         response: AgentRunResult = await self._agent.run(
             PromptsOrchestrator.get_user_msg(robot_ctx_payload),
             deps=robot_ctx_payload,
             usage_limits=self._usage_limits,
             model_settings={"temperature": self._cfg.orchestrator_agent_temperature, "parallel_tool_calls": False},
         )
+        log_usage("Orchestrator agent", response.usage())
         self._catch_token_limit_exceedance(response.output)
         return response.output
 
+    @log
+    async def _route_to_locator_agent(
+        self, robot_ctx_payload: PromptPayload
+    ) -> str | LocatorHealingResponse:
+        """Invokes the locator agent directly, without an orchestrator LLM request.
+
+        Args:
+            robot_ctx_payload (PromptPayload): Contains context for the self-healing process of the LLM.
+
+        Returns:
+            str | LocatorHealingResponse: List of repaired locator suggestions or an error message.
+        """
+        ctx: RunContext[PromptPayload] = RunContext(
+            deps=robot_ctx_payload, model=self._agent.model, usage=RunUsage()
+        )
+        try:
+            return await self._locator_agent.heal_async(ctx)
+        except Exception as e:
+            response_output: str = f"error: Locator healing failed: {str(e)}"
+            self._catch_token_limit_exceedance(response_output)
+            return response_output
+
     @log
     async def _get_healed_locators(self, ctx: RunContext[PromptPayload]) -> str:
         """Gets a list of healed locator suggestions for a broken locator.
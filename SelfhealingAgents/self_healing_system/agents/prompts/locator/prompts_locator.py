@@ -4,6 +4,7 @@ from pydantic_ai import RunContext
 
 from SelfhealingAgents.self_healing_system.agents.prompts.base_prompt_agent import BasePromptAgent
 from SelfhealingAgents.self_healing_system.schemas.internal_state.prompt_payload import PromptPayload
+from SelfhealingAgents.self_healing_system.context_retrieving.dom_context_builder import DomContextBuilder
 from SelfhealingAgents.self_healing_system.context_retrieving.library_dom_utils.base_dom_utils import BaseDomUtils
 from SelfhealingAgents.self_healing_system.agents.prompts.locator.library_specific_additions import (
     get_system_msg_browser,
@@ -62,18 +63,62 @@ class PromptsLocatorGenerationAgent(BasePromptAgent):
     def get_user_msg(ctx: RunContext[PromptPayload]) -> str:
         """Assembles the user message (prompt) for locator generation based on context.
 
+        DOMs larger than the token budget of the payload are pruned to the fragments most relevant
+        to the failed locator. With the 'cache_friendly' prompt layout, the content is ordered from the
+        most to the least stable part, so that repeated failures in the same file and on the same page
+        share a long prompt prefix that providers can serve from their prompt cache. To keep that prefix
+        stable, the DOM is pruned independently of the failure with three quarters of the budget, and
+        the fragments relevant to the failed locator follow the failure details with the rest.
+
         Args:
             ctx (RunContext): PydanticAI context containing information about the keyword failure.
 
         Returns:
             str: The assembled user message for locator generation.
         """
+        dom_tree: str = ctx.deps.dom_tree
+        if ctx.deps.prompt_layout == "cache_friendly":
+            failure_context: str = ""
+            if ctx.deps.dom_snapshot is not None and ctx.deps.dom_token_budget:
+                dom_tree = DomContextBuilder.build(
+                    ctx.deps.dom_snapshot,
+                    failed_locator="",
+                    keyword_name="",
+                    token_budget=ctx.deps.dom_token_budget * 3 // 4,
+                )
+                if dom_tree != ctx.deps.dom_snapshot.simplified_dom:
+                    relevant_fragments: str = DomContextBuilder.build(
+                        ctx.deps.dom_snapshot,
+                        failed_locator=ctx.deps.failed_locator,
+                        keyword_name=ctx.deps.keyword_name,
+                        token_budget=ctx.deps.dom_token_budget // 4,
+                        anchor_locators=list(ctx.deps.tried_locator_memory),
+                    )
+                    failure_context = f"Dom fragments relevant to the failed locator: ```{relevant_fragments}```\n\n"
+            return (
+                f"Test-Suite or Resource-File in which the locator failed:\n{ctx.deps.file_usage_ctx}\n\n"
+                f"Dom Tree: ```{dom_tree}```\n\n"
+                f"Your suggested locators should be only of type: {ctx.deps.locator_type}. No other types are allowed. \n\n"
+                f"Keyword name: `{ctx.deps.keyword_name}`\n\n"
+                f"Failed locator: `{ctx.deps.failed_locator}`\n\n"
+                f"Error message: `{ctx.deps.error_msg}`\n\n"
+                f"{failure_context}"
+                f"Tried Locator Suggestion Memory:\n{ctx.deps.tried_locator_memory}\n\n"
+            )
+        if ctx.deps.dom_snapshot is not None and ctx.deps.dom_token_budget:
+            dom_tree = DomContextBuilder.build(
+                ctx.deps.dom_snapshot,
+                failed_locator=ctx.deps.failed_locator,
+                keyword_name=ctx.deps.keyword_name,
+                token_budget=ctx.deps.dom_token_budget,
+                anchor_locators=list(ctx.deps.tried_locator_memory),
+            )
         return (
             f"Your suggested locators should be only of type: {ctx.deps.locator_type}. No other types are allowed. \n\n"
             f"Error message: `{ctx.deps.error_msg}`\n\n"
             f"Failed locator: `{ctx.deps.failed_locator}`\n\n"
             f"Keyword name: `{ctx.deps.keyword_name}`\n\n"
-            f"Dom Tree: ```{ctx.deps.dom_tree}```\n\n"
+            f"Dom Tree: ```{dom_tree}```\n\n"
             f"Tried Locator Suggestion Memory:\n{ctx.deps.tried_locator_memory}\n\n"
             f"Test-Suite or Resource-File in which the locator failed:\n{ctx.deps.file_usage_ctx}\n\n"
         )
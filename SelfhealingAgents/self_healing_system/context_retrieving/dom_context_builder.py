@@ -0,0 +1,264 @@
+import logging
+import re
+from typing import Dict, Final, List, Set, Tuple
+
+from bs4 import BeautifulSoup, NavigableString, Tag
+
+from SelfhealingAgents.self_healing_system.context_retrieving.dom_snapshot import DomSnapshot
+
+
+# Rough number of characters per token of HTML for common tokenizers
+_CHARS_PER_TOKEN: Final[int] = 4
+_TOKEN_PATTERN: Final[re.Pattern] = re.compile(r"[a-z0-9]+")
+_CAMEL_CASE: Final[re.Pattern] = re.compile(r"([a-z0-9])([A-Z])")
+# Locator syntax that says nothing about the element
+_STOP_TOKENS: Final[frozenset[str]] = frozenset(
+    {
+        "css", "xpath", "id", "class", "text", "name", "contains", "normalize", "space", "and", "or",
+        "not", "nth", "child", "of", "type", "has", "is", "the", "div", "span",
+    }
+)
+_KEYWORD_ELEMENT_TYPES: Final[Tuple[Tuple[Tuple[str, ...], frozenset[str]], ...]] = (
+    (("fill", "type", "input", "clear", "press keys", "secret", "password"), frozenset({"input", "textarea"})),
+    (("select", "list", "options"), frozenset({"select", "option", "li"})),
+    (("checkbox", "radio"), frozenset({"input", "label"})),
+    (("click", "tap", "button", "link"), frozenset({"a", "button", "input", "label", "li"})),
+    (("text", "should", "get"), frozenset({"label", "span", "div", "p", "td", "h1", "h2", "h3"})),
+)
+# Elements keywords operate on, emitted when nothing on the page relates to the failure
+_INTERACTIVE_ELEMENT_TYPES: Final[frozenset[str]] = frozenset(
+    {"a", "button", "input", "textarea", "select", "option", "label"}
+)
+
+
+class DomContextBuilder:
+    """Builds the DOM part of the locator generation prompt within a token budget.
+
+    Every element of the simplified DOM is scored by its relevance to the failed locator: tokens
+    shared between the locator and the element's attribute values and own text, whether the element
+    type fits the keyword, and whether it lies in the region of previously tried locators. The most
+    relevant elements are emitted together with their ancestor path, widened to their parents while
+    the fragment stays small, until the budget is used up. If no element relates to the failure, the
+    interactive elements are emitted instead. DOMs that fit into the budget are sent unchanged.
+    """
+    @staticmethod
+    def build(
+        dom_snapshot: DomSnapshot,
+        *,
+        failed_locator: str,
+        keyword_name: str,
+        token_budget: int,
+        anchor_locators: List[str] | None = None,
+    ) -> str:
+        """Returns the DOM context for the prompt.
+
+        Args:
+            dom_snapshot (DomSnapshot): Snapshot of the page at the failure.
+            failed_locator (str): The locator that failed.
+            keyword_name (str): The name of the failed keyword.
+            token_budget (int): Approximate number of tokens the DOM context may use. 0 disables pruning.
+            anchor_locators (List[str] | None): Previously tried locators, whose elements mark the region
+                around the element that is looked for.
+
+        Returns:
+            str: The whole simplified DOM if it fits into the budget, the most relevant fragments otherwise.
+        """
+        simplified_dom: str = dom_snapshot.simplified_dom
+        budget: int = token_budget * _CHARS_PER_TOKEN
+        if token_budget <= 0 or len(simplified_dom) <= budget:
+            return simplified_dom
+
+        soup: BeautifulSoup = dom_snapshot.soup
+        elements: List[Tag] = soup.find_all(True)
+        positions: Dict[int, int] = {id(element): index for index, element in enumerate(elements)}
+        query_tokens: Set[str] = DomContextBuilder._tokens(failed_locator)
+        keyword_types: frozenset[str] = DomContextBuilder._keyword_element_types(keyword_name)
+        anchor_region: Set[int] = DomContextBuilder._anchor_region(soup, anchor_locators or [])
+
+        scored: List[Tuple[float, int, Tag]] = []
+        for element in elements:
+            overlap: int = len(query_tokens & DomContextBuilder._element_tokens(element))
+            score: float = 3.0 * overlap
+            if element.name in keyword_types:
+                score += 2.0 if overlap else 0.5
+            if id(element) in anchor_region:
+                score += 4.0
+            if score > 0:
+                scored.append((score, positions[id(element)], element))
+        if not scored:
+            scored = [
+                (1.0, positions[id(element)], element)
+                for element in elements
+                if element.name in _INTERACTIVE_ELEMENT_TYPES
+            ]
+        scored.sort(key=lambda item: (-item[0], item[1]))
+
+        max_fragment: int = max(budget // 4, 1)
+        roots: List[Tag] = []
+        fragments: Dict[int, str] = {}
+        used: int = 0
+        for _, _, element in scored:
+            # Identity checks, since Tag equality compares markup and identical rows would be skipped
+            if any(root is element or any(parent is root for parent in element.parents) for root in roots):
+                continue
+            root: Tag = DomContextBuilder._fragment_root(element, roots, max_fragment)
+            markup: str = str(root)
+            if len(markup) > max_fragment:
+                markup = DomContextBuilder._shallow_markup(root)
+            fragment: str = f"<!-- {DomContextBuilder._ancestor_path(root)} -->\n{markup}"
+            if used + len(fragment) > budget:
+                continue
+            roots.append(root)
+            fragments[positions[id(root)]] = fragment
+            used += len(fragment)
+
+        if not fragments:
+            return simplified_dom[:budget]
+        logging.getLogger("SelfhealingReports").info(
+            f"Pruned DOM context from {len(simplified_dom)} to {used} characters "
+            f"in {len(fragments)} fragments"
+        )
+        return "\n".join(fragments[position] for position in sorted(fragments))
+
+    @staticmethod
+    def _tokens(text: str) -> Set[str]:
+        """Splits a locator or attribute value into lower case word tokens.
+
+        Args:
+            text (str): The text to split.
+
+        Returns:
+            Set[str]: The tokens, without locator syntax and single characters.
+        """
+        words: List[str] = _TOKEN_PATTERN.findall(_CAMEL_CASE.sub(r"\1 \2", text).lower())
+        return {word for word in words if len(word) > 1 and word not in _STOP_TOKENS}
+
+    @staticmethod
+    def _element_tokens(element: Tag) -> Set[str]:
+        """Collects the tokens of the attribute values and the own text of an element.
+
+        Args:
+            element (Tag): The element.
+
+        Returns:
+            Set[str]: The tokens of the element.
+        """
+        values: List[str] = []
+        for value in element.attrs.values():
+            values.append(" ".join(value) if isinstance(value, list) else str(value))
+        values.extend(
+            str(child) for child in element.children if isinstance(child, NavigableString)
+        )
+        return DomContextBuilder._tokens(" ".join(values))
+
+    @staticmethod
+    def _keyword_element_types(keyword_name: str) -> frozenset[str]:
+        """Returns the element types the keyword usually operates on.
+
+        Args:
+            keyword_name (str): The name of the keyword.
+
+        Returns:
+            frozenset[str]: The tag names, empty if the keyword is not known.
+        """
+        name: str = (keyword_name or "").lower()
+        for keywords, element_types in _KEYWORD_ELEMENT_TYPES:
+            if any(keyword in name for keyword in keywords):
+                return element_types
+        return frozenset()
+
+    @staticmethod
+    def _anchor_region(soup: BeautifulSoup, anchor_locators: List[str]) -> Set[int]:
+        """Returns the elements around the elements of the anchor locators.
+
+        The region covers the parent of every anchor element and all its descendants. Only CSS
+        locators are resolved, other locators are ignored.
+
+        Args:
+            soup (BeautifulSoup): The parsed simplified DOM.
+            anchor_locators (List[str]): The anchor locators.
+
+        Returns:
+            Set[int]: Ids of the elements in the region.
+        """
+        region: Set[int] = set()
+        for locator in anchor_locators:
+            selector: str = re.sub(r"^css\s*[=:]\s*", "", locator.strip())
+            if selector.startswith(("/", "(", "xpath", "id=", "text=")):
+                continue
+            try:
+                anchor: Tag | None = soup.select_one(selector)
+            except Exception:
+                continue
+            if anchor is None:
+                continue
+            container: Tag = anchor.parent if isinstance(anchor.parent, Tag) else anchor
+            region.add(id(container))
+            region.update(id(element) for element in container.find_all(True))
+        return region
+
+    @staticmethod
+    def _fragment_root(element: Tag, roots: List[Tag], max_fragment: int) -> Tag:
+        """Widens an element to its parents while the fragment stays small.
+
+        Args:
+            element (Tag): The relevant element.
+            roots (List[Tag]): Roots of the fragments emitted so far, which must not be included twice.
+            max_fragment (int): Maximum number of characters of a fragment.
+
+        Returns:
+            Tag: The root of the fragment of the element.
+        """
+        root: Tag = element
+        for _ in range(2):
+            parent = root.parent
+            if not isinstance(parent, Tag) or parent.name in ("[document]", "html", "body"):
+                break
+            if any(ancestor is parent for emitted in roots for ancestor in emitted.parents):
+                break
+            if len(str(parent)) > max_fragment:
+                break
+            root = parent
+        return root
+
+    @staticmethod
+    def _shallow_markup(element: Tag) -> str:
+        """Renders an element with its own text only, for elements too large to be emitted whole.
+
+        Args:
+            element (Tag): The element.
+
+        Returns:
+            str: The markup of the element without its child elements.
+        """
+        attributes: str = "".join(
+            f' {name}="{" ".join(value) if isinstance(value, list) else value}"'
+            for name, value in element.attrs.items()
+        )
+        text: str = " ".join(
+            str(child).strip() for child in element.children if isinstance(child, NavigableString)
+        ).strip()
+        return f"<{element.name}{attributes}>{text}...</{element.name}>"
+
+    @staticmethod
+    def _ancestor_path(element: Tag) -> str:
+        """Describes the position of an element by the tag, id and classes of its ancestors.
+
+        Args:
+            element (Tag): The element.
+
+        Returns:
+            str: The ancestor path, outermost ancestor first.
+        """
+        path: List[str] = []
+        for ancestor in reversed(list(element.parents)):
+            if ancestor.name == "[document]":
+                continue
+            signature: str = ancestor.name
+            if ancestor.get("id"):
+                signature += f"#{ancestor['id']}"
+            classes = ancestor.get("class") or []
+            if classes:
+                signature += "." + ".".join(classes)
+            path.append(signature)
+        return " > ".join(path) or "root"
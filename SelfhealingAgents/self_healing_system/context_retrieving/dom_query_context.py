@@ -0,0 +1,322 @@
+import re
+import threading
+import weakref
+from collections import defaultdict
+from typing import ClassVar, Dict, List, Set, Tuple
+
+from bs4 import BeautifulSoup, NavigableString
+from bs4.element import CData, Comment, Declaration, Doctype, ProcessingInstruction
+from lxml import etree
+
+
+_CSS_IDENT: str = r"-?[_a-zA-Z][\w-]*"
+_CSS_VALUE: str = r'[^"\\\n\r\f]*'
+_CSS_COMPOUND: re.Pattern = re.compile(
+    rf"(?P<tag>[a-zA-Z][\w-]*)(?P<parts>(?:#{_CSS_IDENT}|\.{_CSS_IDENT}"
+    rf'|\[[_a-zA-Z][\w-]*="{_CSS_VALUE}"\]|:-soup-contains-own\("{_CSS_VALUE}"\))*)'
+)
+_CSS_PART: re.Pattern = re.compile(
+    rf"#(?P<id>{_CSS_IDENT})|\.(?P<cls>{_CSS_IDENT})"
+    rf'|\[(?P<attr>[_a-zA-Z][\w-]*)="(?P<value>{_CSS_VALUE})"\]'
+    rf'|:-soup-contains-own\("(?P<own_text>{_CSS_VALUE})"\)'
+)
+_XPATH_ATTRIBUTE: re.Pattern = re.compile(
+    r"//(?P<tag>[a-zA-Z_][\w.-]*)\[@(?P<attr>[a-zA-Z_][\w.-]*)="
+    r"(?:'(?P<single>[^']*)'|\"(?P<double>[^\"]*)\")\]"
+)
+_SPECIAL_STRINGS: Tuple[type, ...] = (Comment, Declaration, CData, ProcessingInstruction, Doctype)
+
+
+class DomQueryContext:
+    """Parse-once evaluation context for selector queries against a BeautifulSoup DOM.
+
+    Locator generation asks thousands of uniqueness questions against the same DOM during a
+    single healing attempt. This context converts the soup into an lxml tree only once and
+    reuses it for every XPath query, and memoizes the match count of every selector it was
+    asked about, as the same candidates are probed repeatedly. Simple selectors such as
+    `button#login`, `input[name="email"]` or `//input[@type='text']` are answered from
+    inverted indexes built in a single pass over the DOM instead of scanning the whole
+    tree; everything else falls back to real selector evaluation. Contexts are keyed to the identity of the soup object and
+    are dropped automatically when the soup is garbage collected, or explicitly through
+    `invalidate` when the soup is mutated.
+
+    Attributes:
+        _registry (ClassVar[Dict[int, DomQueryContext]]): Live contexts keyed by id of their soup.
+        _registry_lock (ClassVar[threading.Lock]): Guards the registry, which is shared by the main thread
+            and the background thread of speculative healing.
+        _soup_ref (weakref.ref): Weak reference to the soup this context evaluates against.
+        _xpath_tree (etree._Element | None): Lazily parsed lxml tree of the soup.
+        _xpath_tree_error (Exception | None): Error raised while parsing the lxml tree, if any.
+        _css_counts (Dict[str, int]): Memoized CSS selector match counts.
+        css_hits (int): Number of CSS count lookups answered from the memo.
+        css_misses (int): Number of CSS count lookups not answered from the memo.
+        _xpath_counts (Dict[str, int]): Memoized XPath match counts.
+        index_hits (int): Number of memo misses answered from the inverted indexes.
+        _css_index (Dict | None): Lazily built inverted indexes over the soup.
+        _xpath_index (Dict[Tuple[str, str, str], int] | None): Lazily built
+            (tag, attribute, value) counts over the lxml tree.
+    """
+    _registry: ClassVar[Dict[int, "DomQueryContext"]] = {}
+    _registry_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, soup: BeautifulSoup) -> None:
+        """Initializes the DomQueryContext for the given soup.
+
+        Args:
+            soup (BeautifulSoup): The BeautifulSoup object representing the DOM.
+        """
+        self._soup_ref: weakref.ref = weakref.ref(soup)
+        self._xpath_tree: etree._Element | None = None
+        self._xpath_tree_error: Exception | None = None
+        self._css_counts: Dict[str, int] = {}
+        self.css_hits: int = 0
+        self.css_misses: int = 0
+        self._xpath_counts: Dict[str, int] = {}
+        self.index_hits: int = 0
+        self._css_index: Dict | None = None
+        self._xpath_index: Dict[Tuple[str, str, str], int] | None = None
+
+    @classmethod
+    def for_soup(cls, soup: BeautifulSoup) -> "DomQueryContext":
+        """Returns the evaluation context of the given soup, creating it on first use.
+
+        Args:
+            soup (BeautifulSoup): The BeautifulSoup object representing the DOM.
+
+        Returns:
+            DomQueryContext: The context bound to the given soup.
+        """
+        key: int = id(soup)
+        with cls._registry_lock:
+            context: DomQueryContext | None = cls._registry.get(key)
+            if context is None or context._soup_ref() is not soup:
+                context = cls(soup)
+                cls._registry[key] = context
+                weakref.finalize(soup, cls._discard, key, context)
+        return context
+
+    @classmethod
+    def invalidate(cls, soup: BeautifulSoup) -> None:
+        """Drops the cached context of the given soup, e.g. after the DOM was mutated.
+
+        Args:
+            soup (BeautifulSoup): The BeautifulSoup object whose context should be dropped.
+        """
+        with cls._registry_lock:
+            cls._registry.pop(id(soup), None)
+
+    @classmethod
+    def _discard(cls, key: int, context: "DomQueryContext") -> None:
+        """Removes a context from the registry unless it was already replaced.
+
+        Args:
+            key (int): The registry key of the context.
+            context (DomQueryContext): The context to remove.
+        """
+        with cls._registry_lock:
+            if cls._registry.get(key) is context:
+                del cls._registry[key]
+
+    def css_count(self, selector: str) -> int:
+        """Returns the number of elements matching a CSS selector, evaluating it only once.
+
+        Args:
+            selector (str): The CSS selector to match.
+
+        Returns:
+            int: The number of matching elements, or 0 if the selector is invalid.
+        """
+        count: int | None = self._css_counts.get(selector)
+        if count is not None:
+            self.css_hits += 1
+            return count
+        self.css_misses += 1
+        count = self._indexed_css_count(selector)
+        if count is not None:
+            self.index_hits += 1
+        else:
+            soup: BeautifulSoup | None = self._soup_ref()
+            try:
+                count = len(soup.select(selector)) if soup is not None else 0
+            except Exception:
+                count = 0
+        self._css_counts[selector] = count
+        return count
+
+    def xpath_count(self, xpath: str) -> int:
+        """Returns the number of elements matching an XPath, evaluating it only once.
+
+        Args:
+            xpath (str): The XPath expression to match.
+
+        Returns:
+            int: The number of matching elements.
+
+        Raises:
+            Exception: If the DOM cannot be parsed or the XPath is invalid.
+        """
+        count: int | None = self._xpath_counts.get(xpath)
+        if count is not None:
+            return count
+        match: re.Match | None = _XPATH_ATTRIBUTE.fullmatch(xpath)
+        if match:
+            value: str = match["single"] if match["single"] is not None else match["double"]
+            count = self._get_xpath_index().get((match["tag"], match["attr"], value), 0)
+            self.index_hits += 1
+        else:
+            count = len(self.xpath_tree.xpath(xpath))
+        self._xpath_counts[xpath] = count
+        return count
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Returns the hit/miss counters of the CSS count memo.
+
+        Returns:
+            Dict[str, int]: Hits, misses and number of distinct selectors evaluated.
+        """
+        return {
+            "css_hits": self.css_hits,
+            "css_misses": self.css_misses,
+            "css_selectors": len(self._css_counts),
+            "xpath_selectors": len(self._xpath_counts),
+            "index_hits": self.index_hits,
+        }
+
+    def _indexed_css_count(self, selector: str) -> int | None:
+        """Answers a compound CSS selector from the inverted indexes, if possible.
+
+        Only compounds of a tag with id, class, `[attr="value"]` and `:-soup-contains-own`
+        parts whose values need no escaping are supported, so that the result is identical
+        to soupsieve's.
+
+        Args:
+            selector (str): The CSS selector to match.
+
+        Returns:
+            int | None: The number of matching elements, or None if the selector is not supported.
+        """
+        match: re.Match | None = _CSS_COMPOUND.fullmatch(selector)
+        if match is None:
+            return None
+        index: Dict | None = self._get_css_index()
+        if index is None:
+            return None
+        matches: Set[int] = index["tags"].get(match["tag"].lower(), set())
+        for part in _CSS_PART.finditer(match["parts"]):
+            if not matches:
+                break
+            if part["id"] is not None:
+                candidates = index["attributes"].get(("id", part["id"]), set())
+            elif part["cls"] is not None:
+                candidates = index["classes"].get(part["cls"], set())
+            elif part["attr"] is not None:
+                attr: str = part["attr"].lower()
+                value: str = part["value"].lower() if attr == "type" else part["value"]
+                candidates = index["attributes"].get((attr, value), set())
+            else:
+                candidates = set().union(
+                    *(
+                        elements
+                        for text, elements in index["own_texts"].items()
+                        if part["own_text"] in text
+                    )
+                )
+            matches = matches & candidates
+        return len(matches)
+
+    def _get_css_index(self) -> Dict | None:
+        """Builds the inverted indexes over the soup in a single pass on first use.
+
+        Returns:
+            Dict | None: Element positions keyed by tag, (attribute, value), class token and
+                own text, or None if the soup is gone or not an HTML document.
+        """
+        if self._css_index is not None:
+            return self._css_index
+        soup: BeautifulSoup | None = self._soup_ref()
+        if soup is None or soup.is_xml:
+            return None
+        tags: Dict[str, Set[int]] = defaultdict(set)
+        attributes: Dict[Tuple[str, str], Set[int]] = defaultdict(set)
+        classes: Dict[str, Set[int]] = defaultdict(set)
+        own_texts: Dict[str, Set[int]] = defaultdict(set)
+        for position, element in enumerate(soup.find_all(True)):
+            tags[element.name.lower()].add(position)
+            for attr, value in element.attrs.items():
+                if attr == "class":
+                    tokens: List[str] = value if isinstance(value, list) else value.split()
+                    for token in tokens:
+                        classes[token].add(position)
+                if isinstance(value, list):
+                    value = " ".join(value)
+                attributes[(attr, value.lower() if attr == "type" else value)].add(position)
+            if element.name != "iframe":
+                for child in element.contents:
+                    if isinstance(child, NavigableString) and not isinstance(child, _SPECIAL_STRINGS):
+                        own_texts[str(child)].add(position)
+        self._css_index = {
+            "tags": tags,
+            "attributes": attributes,
+            "classes": classes,
+            "own_texts": own_texts,
+        }
+        return self._css_index
+
+    def _get_xpath_index(self) -> Dict[Tuple[str, str, str], int]:
+        """Counts every (tag, attribute, value) triple of the lxml tree in a single pass.
+
+        Returns:
+            Dict[Tuple[str, str, str], int]: Number of elements per (tag, attribute, value).
+        """
+        if self._xpath_index is None:
+            counts: Dict[Tuple[str, str, str], int] = defaultdict(int)
+            for element in self.xpath_tree.iter():
+                if isinstance(element.tag, str):
+                    for attr, value in element.attrib.items():
+                        counts[(element.tag, attr, value)] += 1
+            self._xpath_index = counts
+        return self._xpath_index
+
+    @property
+    def xpath_tree(self) -> etree._Element:
+        """Returns the lxml tree of the soup, parsing it on first access.
+
+        Returns:
+            etree._Element: The root of the parsed lxml tree.
+
+        Raises:
+            Exception: If the soup could not be parsed into an lxml tree.
+        """
+        if self._xpath_tree is None and self._xpath_tree_error is None:
+            try:
+                self._xpath_tree = self._parse_xpath_tree()
+            except Exception as e:
+                self._xpath_tree_error = e
+        if self._xpath_tree_error is not None:
+            raise self._xpath_tree_error
+        return self._xpath_tree
+
+    def _parse_xpath_tree(self) -> etree._Element:
+        """Serializes the soup once and parses it into an lxml tree.
+
+        Returns:
+            etree._Element: The root of the parsed lxml tree.
+
+        Raises:
+            ValueError: If the soup is no longer alive or yields an empty document.
+        """
+        soup: BeautifulSoup | None = self._soup_ref()
+        if soup is None:
+            raise ValueError("DOM of this query context is no longer available.")
+        tree: etree._Element | None = None
+        if soup.is_xml:
+            try:
+                tree = etree.XML(str(soup.hierarchy), parser=etree.HTMLParser())
+            except Exception:
+                tree = None
+        if tree is None:
+            tree = etree.HTML(str(soup), parser=etree.HTMLParser())
+        if tree is None:
+            raise ValueError("DOM could not be parsed into an XPath tree.")
+        return tree
@@ -0,0 +1,62 @@
+from bs4 import BeautifulSoup
+
+from SelfhealingAgents.self_healing_system.context_retrieving.dom_query_context import DomQueryContext
+from SelfhealingAgents.self_healing_system.context_retrieving.dom_soap_utils import SoupDomUtils
+
+
+class DomSnapshot:
+    """Single capture of the page DOM that is shared across one healing attempt.
+
+    The page is fetched and simplified once when a failure is detected. The prompt context,
+    the locator agent and the proposal generators all read from this snapshot instead of
+    querying the browser and parsing the DOM again. The parsed soup and its query context
+    are only built when first needed.
+
+    Attributes:
+        raw_source (str | None): Page source as returned by the library, if available.
+        simplified_dom (str): Simplified DOM tree as a string, as used in the prompts.
+        locator_proposals (dict[tuple[str, str], list[str]]): Locator proposals already computed on this
+            snapshot, keyed by failed locator and keyword name.
+        _soup (BeautifulSoup | None): Lazily parsed tree of the simplified DOM.
+    """
+    def __init__(
+        self,
+        simplified_dom: str,
+        *,
+        raw_source: str | None = None,
+        soup: BeautifulSoup | None = None,
+    ) -> None:
+        """Initializes the DomSnapshot.
+
+        Args:
+            simplified_dom (str): Simplified DOM tree as a string.
+            raw_source (str | None): Page source as returned by the library, if available.
+            soup (BeautifulSoup | None): Already parsed tree of the simplified DOM, if available.
+        """
+        self.raw_source: str | None = raw_source
+        self.simplified_dom: str = simplified_dom
+        self._soup: BeautifulSoup | None = soup
+        self.locator_proposals: dict[tuple[str, str], list[str]] = {}
+
+    @property
+    def soup(self) -> BeautifulSoup:
+        """Returns the parsed tree of the simplified DOM, parsing it on first access.
+
+        Returns:
+            BeautifulSoup: The parsed simplified DOM.
+        """
+        if self._soup is None:
+            self._soup = SoupDomUtils.parse_simplified_dom(self.simplified_dom)
+        return self._soup
+
+    @property
+    def query_context(self) -> DomQueryContext:
+        """Returns the parse-once query context of the parsed simplified DOM.
+
+        Returns:
+            DomQueryContext: The query context bound to `soup`.
+        """
+        return DomQueryContext.for_soup(self.soup)
+
+    def __repr__(self) -> str:
+        return f"DomSnapshot(simplified_dom=<{len(self.simplified_dom)} chars>)"
@@ -1,13 +1,24 @@
 import re
-from typing import List
-from lxml import etree
-from bs4 import BeautifulSoup, Tag, ResultSet
+import threading
+from typing import ClassVar, FrozenSet, List, Tuple
+from bs4 import BeautifulSoup, NavigableString, Tag, ResultSet
 
 from SelfhealingAgents.utils.logging import log
+from SelfhealingAgents.self_healing_system.context_retrieving.dom_query_context import DomQueryContext
 
 
 class SoupDomUtils:
     """Utility class for operating on the DOM of a web page using BeautifulSoup."""
+    _DROPPED_TAGS: ClassVar[FrozenSet[str]] = frozenset(
+        {"script", "svg", "source", "animatetransform", "template", "head", "nav"}
+    )
+    _KEPT_ATTRIBUTES: ClassVar[FrozenSet[str]] = frozenset(
+        {"id", "class", "value", "name", "type", "placeholder", "role"}
+    )
+    _CLASSLESS_TAGS: ClassVar[FrozenSet[str]] = frozenset({"a", "section", "picture", "img"})
+    # Tree of the most recent simplify_dom call of each thread, so that threads never share a tree
+    _last_simplified_dom: ClassVar[threading.local] = threading.local()
+
     @staticmethod
     def clean_text_for_selector(text: str) -> str:
         """Sanitizes text for use in a CSS selector.
@@ -33,11 +44,7 @@ class SoupDomUtils:
         Returns:
             int: The number of elements matching the selector, or 0 if an error occurs.
         """
-        try:
-            elements: ResultSet = soup.select(selector)
-            return len(elements)
-        except Exception:
-            return 0
+        return DomQueryContext.for_soup(soup).css_count(selector)
 
     @staticmethod
     def is_selector_unique(soup: BeautifulSoup, selector: str) -> bool:
@@ -50,11 +57,7 @@ class SoupDomUtils:
         Returns:
             bool: True if exactly one element matches the selector, False otherwise.
         """
-        try:
-            elements: ResultSet = soup.select(selector)
-            return len(elements) == 1
-        except Exception:
-            return False
+        return DomQueryContext.for_soup(soup).css_count(selector) == 1
 
     @staticmethod
     def has_child_dialog_without_open(element: Tag) -> bool:
@@ -481,75 +484,106 @@ class SoupDomUtils:
         Returns:
             str | None: The simplified DOM tree as a string, or None if no <body> is present.
         """
-        soup: BeautifulSoup = BeautifulSoup(source, "html.parser")
-
-        for elem in soup.find_all("script"):
-            elem.decompose()
-
-        for elem in soup.find_all("svg"):
-            elem.decompose()
-
-        for elem in soup.find_all("source"):
-            elem.decompose()
+        simplified_dom, _ = SoupDomUtils.simplify_dom(source)
+        return simplified_dom
 
-        for elem in soup.find_all("animatetransform"):
-            elem.decompose()
-
-        # for elem in soup.find_all('footer'):
-        #     elem.decompose()
-
-        for elem in soup.find_all("template"):
-            elem.decompose()
-
-        for elem in soup.find_all("head"):
-            elem.decompose()
-
-        for elem in soup.find_all("nav"):
-            elem.decompose()
+    @staticmethod
+    def simplify_dom(source: str) -> Tuple[str, BeautifulSoup]:
+        """Simplifies the HTML source in a single traversal and returns its string and tree.
 
-        # Find all elements with 'display: none'
-        hidden_elements: ResultSet = soup.find_all(SoupDomUtils().has_display_none)
-        for element in hidden_elements:
-            element.decompose()
+        Subtrees of non-essential or hidden elements are dropped and attributes are reduced
+        to the whitelist while walking the parsed document once. Besides the simplified string,
+        the pruned <body> is returned as a reusable tree that is equivalent to parsing the
+        string again, so callers do not have to pay for a second parse.
 
-        # Find all elements with 'display: none'
-        hidden_elements = soup.find_all(attrs={"type": "hidden"})
-        for element in hidden_elements:
-            element.decompose()
+        Args:
+            source (str): The HTML source code as a string.
 
-        for a_tag in soup.find_all("a"):
-            del a_tag["href"]
-            del a_tag["class"]
+        Returns:
+            Tuple[str, BeautifulSoup]: The simplified DOM tree as a string and as a parsed tree.
+        """
+        soup: BeautifulSoup = BeautifulSoup(source, "html.parser")
+        stack: List[Tuple[Tag, bool]] = [(soup, False)]
+        pruned_nodes: List[Tuple[Tag, bool]] = []
+        while stack:
+            node, preserve_whitespace = stack.pop()
+            removed_child: bool = False
+            for child in list(node.contents):
+                if not isinstance(child, Tag):
+                    continue
+                if (
+                    child.name in SoupDomUtils._DROPPED_TAGS
+                    or SoupDomUtils.has_display_none(child)
+                    or child.get("type") == "hidden"
+                ):
+                    child.decompose()
+                    removed_child = True
+                    continue
+                strip_class: bool = child.name in SoupDomUtils._CLASSLESS_TAGS
+                child.attrs = {
+                    attr: value
+                    for attr, value in child.attrs.items()
+                    if attr in SoupDomUtils._KEPT_ATTRIBUTES
+                    and not (strip_class and attr == "class")
+                }
+                stack.append(
+                    (child, preserve_whitespace or child.name in ("pre", "textarea"))
+                )
+            if removed_child:
+                pruned_nodes.append((node, preserve_whitespace))
+
+        body: Tag | None = soup.body
+        simplified_dom: str = str(body)
+        for node, preserve_whitespace in pruned_nodes:
+            SoupDomUtils._merge_adjacent_strings(node, preserve_whitespace)
+        if body is None:
+            tree: BeautifulSoup = BeautifulSoup(simplified_dom, "html.parser")
+        else:
+            tree = BeautifulSoup("", "html.parser")
+            tree.append(body.extract())
+        SoupDomUtils._last_simplified_dom.value = (simplified_dom, tree)
+        return simplified_dom, tree
 
-        for tag in soup.find_all(style=True):
-            del tag["style"]
+    @staticmethod
+    def _merge_adjacent_strings(node: Tag, preserve_whitespace: bool) -> None:
+        """Merges text left adjacent by removed children, as parsing the output again would.
 
-        for section_tag in soup.find_all("section"):
-            del section_tag["class"]
+        Args:
+            node (Tag): The element whose children were pruned.
+            preserve_whitespace (bool): Whether the element is inside a <pre> or <textarea>.
+        """
+        run: List[NavigableString] = []
+        for child in list(node.contents) + [None]:
+            if type(child) is NavigableString:
+                run.append(child)
+                continue
+            if len(run) > 1 or (run and not preserve_whitespace and not run[0].strip(" \t\n\r\f")):
+                text: str = "".join(run)
+                if not preserve_whitespace and not text.strip(" \t\n\r\f"):
+                    text = "\n" if "\n" in text else " "
+                if text != run[0] or len(run) > 1:
+                    run[0].replace_with(NavigableString(text))
+                    for extra in run[1:]:
+                        extra.extract()
+            run = []
 
-        for picture_tag in soup.find_all("picture"):
-            del picture_tag["class"]
+    @staticmethod
+    def parse_simplified_dom(dom_tree: str) -> BeautifulSoup:
+        """Returns the parsed tree of a simplified DOM string.
 
-        for img_tag in soup.find_all("img"):
-            del img_tag["class"]
-            del img_tag["alt"]
-            del img_tag["src"]
+        Reuses the tree produced by the most recent `simplify_dom` call of the current
+        thread when the string matches, and parses the string otherwise.
 
-        attributes_to_keep: List[str] = [
-            "id",
-            "class",
-            "value",
-            "name",
-            "type",
-            "placeholder",
-            "role",
-        ]
-        for tag in soup.find_all(True):  # True finds all tags
-            for attr in list(tag.attrs):  # list() to avoid runtime error
-                if attr not in attributes_to_keep:
-                    del tag[attr]
+        Args:
+            dom_tree (str): The simplified DOM tree as a string.
 
-        return str(soup.body)
+        Returns:
+            BeautifulSoup: The parsed DOM tree.
+        """
+        last: Tuple[str, BeautifulSoup] | None = getattr(SoupDomUtils._last_simplified_dom, "value", None)
+        if last is not None and last[0] == dom_tree:
+            return last[1]
+        return BeautifulSoup(dom_tree, "html.parser")
 
     @staticmethod
     @log
@@ -843,18 +877,8 @@ class SoupDomUtils:
             bool: True if exactly one element matches the XPath, False otherwise.
         """
         try:
-            if soup.is_xml:
-                tree = etree.XML(str(soup.hierarchy), parser=etree.HTMLParser())
-            else:
-                tree = etree.HTML(str(soup), parser=etree.HTMLParser())
-        except Exception as e:
-            print(f"Error in is_xpath_unique: {e}\nXpath: {xpath}")
-            return False
-        try:
-            # Use the XPath to find matching elements
-            elements: List[etree._Element] = tree.xpath(xpath)
             # Return True if exactly one element matches
-            return len(elements) == 1
+            return DomQueryContext.for_soup(soup).xpath_count(xpath) == 1
         except Exception as e:
             print(f"Error in is_xpath_unique: {e}\nXpath: {xpath}")
             return False
@@ -871,21 +895,10 @@ class SoupDomUtils:
             bool: True if more than one element matches the XPath, False otherwise.
         """
         try:
-            # Parse the HTML content using lxml
-            tree = etree.HTML(str(soup), parser=etree.HTMLParser())
-        except:
-            try:
-                tree = etree.HTML(str(soup.hierarchy), parser=etree.HTMLParser())
-            except Exception as e:
-                print(f"Error in is_xpath_unique: {e}\nXpath: {xpath}")
-                return False
-        try:
-            # Use the XPath to find matching elements
-            elements: List[etree._Element] = tree.xpath(xpath)
             # Return True if more than one element matches
-            return len(elements) > 1
+            return DomQueryContext.for_soup(soup).xpath_count(xpath) > 1
         except Exception as e:
-            print(f"Error in is_xpath_multiple: {e}")
+            print(f"Error in is_xpath_multiple: {e}\nXpath: {xpath}")
             return False
 
     @staticmethod
@@ -0,0 +1,176 @@
+import re
+from pathlib import Path
+from typing import ClassVar, Dict, Final, List, Optional, Tuple
+
+from robot.api.parsing import File, get_model, get_resource_model
+
+
+# Rough number of characters per token of Robot Framework source for common tokenizers
+_CHARS_PER_TOKEN: Final[int] = 4
+_VARIABLE_REFERENCE: Final[re.Pattern] = re.compile(r"[$@&%]\{([^{}]+)\}")
+_BLOCK_SECTIONS: Final[Dict[str, str]] = {
+    "TestCaseSection": "*** Test Cases ***",
+    "TaskSection": "*** Tasks ***",
+    "KeywordSection": "*** Keywords ***",
+}
+
+
+class FileContextExtractor:
+    """Extracts the part of a Robot Framework source file that is relevant to a failed keyword.
+
+    Every source file is parsed once per run with the Robot Framework parsing API and kept with its
+    lines. For a failure, only the enclosing test, task or keyword is returned, together with the
+    definitions of the file-level variables it references. If that does not fit into the token cap,
+    the block is cut down to its header and the lines around the failed keyword.
+
+    Attributes:
+        _files (ClassVar[Dict[str, Tuple[float, File, List[str]]]]): Parsed files by path, with their
+            modification time and lines.
+    """
+    _files: ClassVar[Dict[str, Tuple[float, File, List[str]]]] = {}
+
+    @classmethod
+    def extract(cls, source: str | Path, lineno: Optional[int], *, token_cap: int) -> str:
+        """Returns the context of the keyword at a line of a source file.
+
+        Args:
+            source (str | Path): Path of the .robot or .resource file.
+            lineno (Optional[int]): Line of the failed keyword call.
+            token_cap (int): Approximate number of tokens the context may use. 0 returns the whole file.
+
+        Returns:
+            str: The relevant part of the file.
+
+        Raises:
+            FileNotFoundError: If the source file does not exist.
+        """
+        model, lines = cls._parse(Path(source))
+        if token_cap <= 0:
+            return "".join(lines)
+        budget: int = token_cap * _CHARS_PER_TOKEN
+
+        block = cls._enclosing_block(model, lineno)
+        if block is None:
+            start, end = max((lineno or 1) - 10, 1), (lineno or 1) + 10
+            return cls._fit(lines, start, min(end, len(lines)), lineno, budget)
+
+        section_name, block_start, block_end = block
+        while block_end > block_start and not lines[block_end - 1].strip():
+            block_end -= 1
+        block_text: str = "".join(lines[block_start - 1 : block_end])
+        variables: str = cls._referenced_variables(model, lines, block_text)
+        header: str = f"{variables}{section_name}\n"
+        return header + cls._fit(lines, block_start, block_end, lineno, budget - len(header))
+
+    @classmethod
+    def _parse(cls, source: Path) -> Tuple[File, List[str]]:
+        """Parses a source file, unless it was already parsed in its current version.
+
+        Args:
+            source (Path): Path of the source file.
+
+        Returns:
+            Tuple[File, List[str]]: The parsed model and the lines of the file.
+
+        Raises:
+            FileNotFoundError: If the source file does not exist.
+        """
+        if not source.exists():
+            raise FileNotFoundError(f"Source file for LLM context not found: {source}")
+        key: str = str(source.resolve())
+        mtime: float = source.stat().st_mtime
+        cached = cls._files.get(key)
+        if cached is None or cached[0] != mtime:
+            text: str = source.read_text(encoding="utf-8", errors="ignore")
+            parse = get_resource_model if source.suffix.lower() == ".resource" else get_model
+            cached = (mtime, parse(source), text.splitlines(keepends=True))
+            cls._files[key] = cached
+        return cached[1], cached[2]
+
+    @staticmethod
+    def _enclosing_block(model: File, lineno: Optional[int]) -> Optional[Tuple[str, int, int]]:
+        """Finds the test, task or keyword that contains a line.
+
+        Args:
+            model (File): The parsed source file.
+            lineno (Optional[int]): The line.
+
+        Returns:
+            Optional[Tuple[str, int, int]]: Section header, first and last line of the block, or None if
+                the line is not inside a test, task or keyword.
+        """
+        if not lineno:
+            return None
+        for section in model.sections:
+            section_name: Optional[str] = _BLOCK_SECTIONS.get(type(section).__name__)
+            if section_name is None:
+                continue
+            for block in section.body:
+                if getattr(block, "name", None) and block.lineno <= lineno <= block.end_lineno:
+                    return section_name, block.lineno, block.end_lineno
+        return None
+
+    @staticmethod
+    def _referenced_variables(model: File, lines: List[str], block_text: str) -> str:
+        """Returns the Variables section entries that a block references.
+
+        Args:
+            model (File): The parsed source file.
+            lines (List[str]): The lines of the source file.
+            block_text (str): The text of the block.
+
+        Returns:
+            str: A Variables section with the referenced definitions, or an empty string if there are none.
+        """
+        def normalize(name: str) -> str:
+            return name.lower().replace(" ", "").replace("_", "")
+
+        referenced = {normalize(name) for name in _VARIABLE_REFERENCE.findall(block_text)}
+        definitions: List[str] = []
+        for section in model.sections:
+            if type(section).__name__ != "VariableSection":
+                continue
+            for variable in section.body:
+                name: Optional[str] = getattr(variable, "name", None)
+                if name and normalize(name[2:-1]) in referenced:
+                    definitions.extend(lines[variable.lineno - 1 : variable.end_lineno])
+        if not definitions:
+            return ""
+        return "*** Variables ***\n" + "".join(definitions) + "\n"
+
+    @staticmethod
+    def _fit(lines: List[str], start: int, end: int, lineno: Optional[int], budget: int) -> str:
+        """Returns lines of the file, cut down to the header and the lines around `lineno` if needed.
+
+        Args:
+            lines (List[str]): The lines of the source file.
+            start (int): First line, 1-based.
+            end (int): Last line, 1-based and inclusive.
+            lineno (Optional[int]): The line of the failed keyword.
+            budget (int): Maximum number of characters.
+
+        Returns:
+            str: The lines that fit into the budget.
+        """
+        text: str = "".join(lines[start - 1 : end])
+        if len(text) <= budget:
+            return text
+        center: int = min(max(lineno or start, start), end)
+        first, last = center, center
+        used: int = len(lines[center - 1]) + (len(lines[start - 1]) if center > start else 0)
+        while True:
+            grown: bool = False
+            if first - 1 > start and used + len(lines[first - 2]) <= budget:
+                first -= 1
+                used += len(lines[first - 1])
+                grown = True
+            if last + 1 <= end and used + len(lines[last]) <= budget:
+                last += 1
+                used += len(lines[last - 1])
+                grown = True
+            if not grown:
+                break
+        head: str = lines[start - 1] if first > start else ""
+        gap: str = "    ...\n" if first > start + 1 else ""
+        tail: str = "    ...\n" if last < end else ""
+        return head + gap + "".join(lines[first - 1 : last]) + tail
@@ -1,7 +1,9 @@
 from robot.libraries.BuiltIn import BuiltIn
 
 from SelfhealingAgents.utils.logging import log
+from SelfhealingAgents.self_healing_system.context_retrieving.dom_snapshot import DomSnapshot
 from SelfhealingAgents.self_healing_system.context_retrieving.library_dom_utils.base_dom_utils import BaseDomUtils
+from SelfhealingAgents.self_healing_system.schemas.internal_state.locator_status import LocatorStatus
 
 
 class AppiumDomUtils(BaseDomUtils):
@@ -98,15 +100,84 @@ class AppiumDomUtils(BaseDomUtils):
         """
         return "appium"
 
+    def is_element_clickable(self, locator: str) -> bool:
+        """Checks if the element identified by the locator is clickable.
+
+        Mobile elements report clickability through their 'clickable' attribute.
+
+        Args:
+            locator (str): The locator to check.
+
+        Returns:
+            bool: True if the element is clickable, False otherwise.
+        """
+        if self._library_instance is None:
+            return False
+        try:
+            elements = getattr(self._library_instance, "get_webelements")(locator)
+            return bool(elements) and elements[0].get_attribute("clickable") == "true"
+        except Exception:
+            return False
+
+    def _validate_locators_live(
+        self, locators: list[str], *, include_metadata: bool = False
+    ) -> list[LocatorStatus]:
+        """Validates many locators with a single element lookup per locator.
+
+        AppiumLibrary offers no way to resolve several locators in one request, so each
+        locator is looked up once and count, clickability and metadata are all read from
+        the returned elements.
+
+        Args:
+            locators (list[str]): The locators to validate.
+            include_metadata (bool): Whether to collect element metadata as well.
+
+        Returns:
+            list[LocatorStatus]: One status per locator, in the order of `locators`.
+        """
+        if self._library_instance is None or not hasattr(
+            self._library_instance, "get_webelements"
+        ):
+            return super()._validate_locators_live(locators, include_metadata=include_metadata)
+
+        statuses: list[LocatorStatus] = []
+        for locator in locators:
+            try:
+                elements = getattr(self._library_instance, "get_webelements")(locator)
+            except Exception:
+                elements = []
+            status: LocatorStatus = LocatorStatus(
+                locator=locator,
+                count=len(elements),
+                valid=len(elements) > 0,
+                unique=len(elements) == 1,
+            )
+            if elements:
+                try:
+                    status.clickable = elements[0].get_attribute("clickable") == "true"
+                except Exception:
+                    pass
+                if include_metadata:
+                    status.metadata = [
+                        self._get_element_metadata(element) for element in elements
+                    ]
+            statuses.append(status)
+        return statuses
+
     @log
     def get_locator_proposals(
-        self, failed_locator: str, keyword_name: str
+        self,
+        failed_locator: str,
+        keyword_name: str,
+        *,
+        dom_snapshot: DomSnapshot | None = None,
     ) -> list[str]:
         """Generates locator proposals for the given failed locator and keyword.
 
         Args:
             failed_locator (str): The locator that failed.
             keyword_name (str): The name of the keyword being executed.
+            dom_snapshot (DomSnapshot | None): Snapshot of the current page, if already captured.
 
         Returns:
             List[str]: A list of proposed locator strings.
@@ -132,106 +203,113 @@ class AppiumDomUtils(BaseDomUtils):
             else:
                 return []
 
-            metadata_list = []
+            return [self._get_element_metadata(element) for element in elements]
 
-            for element in elements:
-                metadata = {}
+        except Exception:
+            return []
 
-                # Get basic element properties for mobile elements
-                try:
-                    metadata["tag"] = (
-                        element.tag_name.lower() if hasattr(element, "tag_name") else ""
-                    )
-                except Exception:
-                    metadata["tag"] = ""
+    @staticmethod
+    def _get_element_metadata(element) -> dict:
+        """Collects the metadata of a single mobile element.
 
-                try:
-                    metadata["resource_id"] = element.get_attribute("resource-id") or ""
-                except Exception:
-                    metadata["resource_id"] = ""
+        Args:
+            element: The element to describe.
 
-                try:
-                    metadata["class"] = element.get_attribute("class") or ""
-                except Exception:
-                    metadata["class"] = ""
+        Returns:
+            Dict: The element metadata.
+        """
+        metadata = {}
 
-                try:
-                    metadata["text"] = element.text or ""
-                except Exception:
-                    metadata["text"] = ""
+        # Get basic element properties for mobile elements
+        try:
+            metadata["tag"] = (
+                element.tag_name.lower() if hasattr(element, "tag_name") else ""
+            )
+        except Exception:
+            metadata["tag"] = ""
 
-                try:
-                    metadata["content_desc"] = (
-                        element.get_attribute("content-desc") or ""
-                    )
-                except Exception:
-                    metadata["content_desc"] = ""
+        try:
+            metadata["resource_id"] = element.get_attribute("resource-id") or ""
+        except Exception:
+            metadata["resource_id"] = ""
 
-                try:
-                    metadata["name"] = element.get_attribute("name") or ""
-                except Exception:
-                    metadata["name"] = ""
+        try:
+            metadata["class"] = element.get_attribute("class") or ""
+        except Exception:
+            metadata["class"] = ""
 
-                try:
-                    metadata["value"] = element.get_attribute("value") or ""
-                except Exception:
-                    metadata["value"] = ""
+        try:
+            metadata["text"] = element.text or ""
+        except Exception:
+            metadata["text"] = ""
 
-                try:
-                    metadata["package"] = element.get_attribute("package") or ""
-                except Exception:
-                    metadata["package"] = ""
+        try:
+            metadata["content_desc"] = (
+                element.get_attribute("content-desc") or ""
+            )
+        except Exception:
+            metadata["content_desc"] = ""
 
-                try:
-                    metadata["checkable"] = element.get_attribute("checkable") == "true"
-                except Exception:
-                    metadata["checkable"] = False
+        try:
+            metadata["name"] = element.get_attribute("name") or ""
+        except Exception:
+            metadata["name"] = ""
 
-                try:
-                    metadata["checked"] = element.get_attribute("checked") == "true"
-                except Exception:
-                    metadata["checked"] = False
+        try:
+            metadata["value"] = element.get_attribute("value") or ""
+        except Exception:
+            metadata["value"] = ""
 
-                try:
-                    metadata["clickable"] = element.get_attribute("clickable") == "true"
-                except Exception:
-                    metadata["clickable"] = False
+        try:
+            metadata["package"] = element.get_attribute("package") or ""
+        except Exception:
+            metadata["package"] = ""
 
-                try:
-                    metadata["enabled"] = element.get_attribute("enabled") == "true"
-                except Exception:
-                    metadata["enabled"] = False
+        try:
+            metadata["checkable"] = element.get_attribute("checkable") == "true"
+        except Exception:
+            metadata["checkable"] = False
 
-                try:
-                    metadata["focusable"] = element.get_attribute("focusable") == "true"
-                except Exception:
-                    metadata["focusable"] = False
+        try:
+            metadata["checked"] = element.get_attribute("checked") == "true"
+        except Exception:
+            metadata["checked"] = False
 
-                try:
-                    metadata["focused"] = element.get_attribute("focused") == "true"
-                except Exception:
-                    metadata["focused"] = False
+        try:
+            metadata["clickable"] = element.get_attribute("clickable") == "true"
+        except Exception:
+            metadata["clickable"] = False
 
-                try:
-                    metadata["scrollable"] = (
-                        element.get_attribute("scrollable") == "true"
-                    )
-                except Exception:
-                    metadata["scrollable"] = False
+        try:
+            metadata["enabled"] = element.get_attribute("enabled") == "true"
+        except Exception:
+            metadata["enabled"] = False
 
-                try:
-                    metadata["selected"] = element.get_attribute("selected") == "true"
-                except Exception:
-                    metadata["selected"] = False
+        try:
+            metadata["focusable"] = element.get_attribute("focusable") == "true"
+        except Exception:
+            metadata["focusable"] = False
 
-                try:
-                    metadata["displayed"] = element.get_attribute("displayed") == "true"
-                except Exception:
-                    metadata["displayed"] = False
+        try:
+            metadata["focused"] = element.get_attribute("focused") == "true"
+        except Exception:
+            metadata["focused"] = False
 
-                metadata_list.append(metadata)
+        try:
+            metadata["scrollable"] = (
+                element.get_attribute("scrollable") == "true"
+            )
+        except Exception:
+            metadata["scrollable"] = False
 
-            return metadata_list
+        try:
+            metadata["selected"] = element.get_attribute("selected") == "true"
+        except Exception:
+            metadata["selected"] = False
 
+        try:
+            metadata["displayed"] = element.get_attribute("displayed") == "true"
         except Exception:
-            return []
+            metadata["displayed"] = False
+
+        return metadata
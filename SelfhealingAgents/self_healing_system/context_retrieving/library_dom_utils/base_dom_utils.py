@@ -1,5 +1,12 @@
+import hashlib
+import logging
 from abc import ABC, abstractmethod
 
+from lxml import etree
+
+from SelfhealingAgents.self_healing_system.context_retrieving.dom_snapshot import DomSnapshot
+from SelfhealingAgents.self_healing_system.schemas.internal_state.locator_status import LocatorStatus
+
 
 class BaseDomUtils(ABC):
     """Abstract base class for library-specific DOM utilities.
@@ -7,6 +14,17 @@ class BaseDomUtils(ABC):
     Defines the common interface that all DOM utility implementations
     must follow, ensuring consistency across different Robot Framework DOM utilities.
     """
+    # Elements that are clickable by their tag alone, used for offline validation
+    _OFFLINE_CLICKABLE_TAGS: frozenset[str] = frozenset(
+        {
+            "button", "a", "select", "mat-button", "mat-radio-button", "mat-checkbox",
+            "md-button", "ion-button", "vaadin-button", "paper-button", "x-button",
+        }
+    )
+    _OFFLINE_CLICKABLE_INPUT_TYPES: frozenset[str] = frozenset(
+        {"button", "radio", "checkbox", "search", "reset", "submit"}
+    )
+
     @abstractmethod
     def __init__(self):
         """Initializes the DOM utility.
@@ -48,6 +66,16 @@ class BaseDomUtils(ABC):
         """
         pass
 
+    def capture_snapshot(self) -> DomSnapshot:
+        """Captures the DOM of the current page once for a whole healing attempt.
+
+        Libraries that can provide more than the simplified DOM tree override this method.
+
+        Returns:
+            DomSnapshot: The snapshot of the current page.
+        """
+        return DomSnapshot(self.get_dom_tree())
+
     @abstractmethod
     def get_library_type(self) -> str:
         """Gets the library type identifier.
@@ -69,15 +97,255 @@ class BaseDomUtils(ABC):
         """
         pass
 
+    def validate_locators(
+        self,
+        locators: list[str],
+        *,
+        include_metadata: bool = False,
+        dom_snapshot: DomSnapshot | None = None,
+        check_clickable: bool = True,
+    ) -> list[LocatorStatus]:
+        """Validates many locators at once.
+
+        Returns match count, validity, uniqueness and clickability of every locator, and
+        optionally the element metadata. If a DOM snapshot is given and no metadata is
+        requested, CSS and XPath locators are first evaluated offline against the snapshot.
+        Only the locators it cannot decide are validated against the live page.
+
+        The snapshot is pruned, so the offline engine only decides locators that match at
+        least one element there. Their counts are a lower bound of the live counts, so
+        callers should confirm the locator they finally pick against the live page.
+
+        Args:
+            locators (list[str]): The locators to validate.
+            include_metadata (bool): Whether to collect element metadata as well.
+            dom_snapshot (DomSnapshot | None): Snapshot of the current page for offline validation.
+            check_clickable (bool): Whether the clickability of the matches is needed. If not,
+                locators whose first match is not clickable by its tag are decided offline as well.
+
+        Returns:
+            list[LocatorStatus]: One status per locator, in the order of `locators`.
+        """
+        statuses: dict[int, LocatorStatus] = {}
+        if dom_snapshot is not None and not include_metadata:
+            for index, locator in enumerate(locators):
+                status: LocatorStatus | None = self._validate_locator_offline(
+                    locator, dom_snapshot, check_clickable=check_clickable
+                )
+                if status is not None:
+                    statuses[index] = status
+        pending: list[int] = [i for i in range(len(locators)) if i not in statuses]
+        if pending:
+            live_statuses: list[LocatorStatus] = self._validate_locators_live(
+                [locators[i] for i in pending], include_metadata=include_metadata
+            )
+            statuses.update(zip(pending, live_statuses))
+        if dom_snapshot is not None:
+            logging.getLogger("SelfhealingReports").info(
+                f"Validated {len(locators) - len(pending)} of {len(locators)} locators offline"
+            )
+        return [statuses[i] for i in range(len(locators))]
+
+    def _validate_locators_live(
+        self, locators: list[str], *, include_metadata: bool = False
+    ) -> list[LocatorStatus]:
+        """Validates many locators against the live page.
+
+        The default implementation queries the library locator by locator. Libraries that
+        can answer many locators in a single round trip override this method.
+
+        Args:
+            locators (list[str]): The locators to validate.
+            include_metadata (bool): Whether to collect element metadata as well.
+
+        Returns:
+            list[LocatorStatus]: One status per locator, in the order of `locators`.
+        """
+        statuses: list[LocatorStatus] = []
+        for locator in locators:
+            status: LocatorStatus = LocatorStatus(locator=locator)
+            try:
+                status.valid = bool(self.is_locator_valid(locator))
+            except Exception:
+                pass
+            if status.valid:
+                try:
+                    status.unique = bool(self.is_locator_unique(locator))
+                except Exception:
+                    pass
+                try:
+                    status.clickable = bool(self.is_element_clickable(locator))
+                except Exception:
+                    pass
+                if include_metadata:
+                    try:
+                        status.metadata = self.get_locator_metadata(locator) or []
+                    except Exception:
+                        pass
+            statuses.append(status)
+        return statuses
+
+    def _validate_locator_offline(
+        self, locator: str, dom_snapshot: DomSnapshot, *, check_clickable: bool = True
+    ) -> LocatorStatus | None:
+        """Validates a single locator against the DOM snapshot.
+
+        Args:
+            locator (str): The locator to validate.
+            dom_snapshot (DomSnapshot): Snapshot of the current page.
+            check_clickable (bool): Whether the clickability of the first match is needed.
+
+        Returns:
+            LocatorStatus | None: The status, or None if the locator cannot be decided offline.
+        """
+        query: dict | None = self._get_script_query(locator)
+        if query is None:
+            return None
+        try:
+            if "css" in query:
+                # soupsieve only pseudo-classes are not supported by browsers
+                if ":-soup-" in query["css"]:
+                    return None
+                count: int = dom_snapshot.query_context.css_count(query["css"])
+                first = dom_snapshot.soup.select_one(query["css"]) if count else None
+                tag: str = first.name.lower() if first is not None else ""
+            else:
+                matches: list = dom_snapshot.query_context.xpath_tree.xpath(query["xpath"])
+                if not isinstance(matches, list) or not all(
+                    isinstance(match, etree._Element) and isinstance(match.tag, str)
+                    for match in matches
+                ):
+                    return None
+                count = len(matches)
+                first = matches[0] if matches else None
+                tag = first.tag.lower() if first is not None else ""
+        except Exception:
+            return None
+        if first is None:
+            return None
+        clickable: bool = tag in self._OFFLINE_CLICKABLE_TAGS or (
+            tag == "input"
+            and (first.get("type") or "").lower() in self._OFFLINE_CLICKABLE_INPUT_TYPES
+        )
+        if check_clickable and not clickable:
+            return None
+        return LocatorStatus(
+            locator=locator,
+            count=count,
+            valid=True,
+            unique=count == 1,
+            clickable=clickable,
+            offline=True,
+        )
+
+    def is_locator_absent(self, locator: str) -> bool:
+        """Checks without waiting whether a locator certainly matches no element on the live page.
+
+        Only CSS and XPath locators that can be resolved inside the page are probed, since the
+        library would wait for all other locators while resolving them.
+
+        Args:
+            locator (str): The locator to probe.
+
+        Returns:
+            bool: True if the locator matches no element, False if it matches one or cannot be probed.
+        """
+        if self._get_script_query(locator) is None:
+            return False
+        try:
+            statuses: list[LocatorStatus] = self._validate_locators_live([locator])
+        except Exception:
+            return False
+        return len(statuses) == 1 and statuses[0].count == 0
+
+    def get_region_fingerprint(self, locator: str, dom_snapshot: DomSnapshot) -> str | None:
+        """Computes a structural fingerprint of the DOM region around the element of a locator.
+
+        The fingerprint covers the tag, id and classes of the first matching element and its
+        ancestors, as well as the attribute names and child tags of the element. Texts are
+        ignored, so that the fingerprint only changes when the structure of the region does.
+
+        Args:
+            locator (str): The locator of the element.
+            dom_snapshot (DomSnapshot): Snapshot of the current page.
+
+        Returns:
+            str | None: The fingerprint, an empty string if the locator cannot be evaluated
+                against the snapshot, or None if it matches no element in the snapshot.
+        """
+        query: dict | None = self._get_script_query(locator)
+        if query is None or ":-soup-" in query.get("css", ""):
+            return ""
+        signatures: list[str] = []
+        try:
+            if "css" in query:
+                element = dom_snapshot.soup.select_one(query["css"])
+                if element is None:
+                    return None
+                signatures.append(" ".join(sorted(element.attrs)))
+                signatures.append(
+                    " ".join(child.name for child in element.find_all(True, recursive=False))
+                )
+                node = element
+                while node is not None and node.name != "[document]":
+                    classes = node.get("class") or []
+                    signatures.append(
+                        f"{node.name}#{node.get('id', '')}.{'.'.join(sorted(classes))}"
+                    )
+                    node = node.parent
+            else:
+                matches = dom_snapshot.query_context.xpath_tree.xpath(query["xpath"])
+                if not isinstance(matches, list):
+                    return ""
+                elements = [
+                    match
+                    for match in matches
+                    if isinstance(match, etree._Element) and isinstance(match.tag, str)
+                ]
+                if not elements:
+                    return None
+                element = elements[0]
+                signatures.append(" ".join(sorted(element.attrib)))
+                signatures.append(
+                    " ".join(child.tag for child in element if isinstance(child.tag, str))
+                )
+                for node in [element, *element.iterancestors()]:
+                    classes = (node.get("class") or "").split()
+                    signatures.append(
+                        f"{node.tag}#{node.get('id', '')}.{'.'.join(sorted(classes))}"
+                    )
+        except Exception:
+            return ""
+        return hashlib.sha1("\n".join(signatures).encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _get_script_query(locator: str) -> dict | None:
+        """Translates a locator into a CSS or XPath query, if the library supports it.
+
+        Args:
+            locator (str): The locator to translate.
+
+        Returns:
+            dict | None: A dictionary with either a 'css' or an 'xpath' key, or None if the
+                locator cannot be expressed as a plain CSS or XPath query.
+        """
+        return None
+
     @abstractmethod
     def get_locator_proposals(
-        self, failed_locator: str, keyword_name: str
+        self,
+        failed_locator: str,
+        keyword_name: str,
+        *,
+        dom_snapshot: DomSnapshot | None = None,
     ) -> list[str]:
         """Gets proposals for the given locator.
 
         Args:
             failed_locator (str): The locator to get proposals for.
             keyword_name (str): The name of the keyword where the locator failed.
+            dom_snapshot (DomSnapshot | None): Snapshot of the current page. If not given,
+                the DOM is retrieved from the library.
 
         Returns:
             list[str]: A list of proposed locators.
@@ -1,15 +1,25 @@
 import re
+import logging
 from typing import Callable, Dict, Iterable, List
 
 from bs4 import BeautifulSoup, ResultSet, Tag
 from robot.libraries.BuiltIn import BuiltIn
 
+from SelfhealingAgents.self_healing_system.context_retrieving.dom_query_context import (
+    DomQueryContext,
+)
+from SelfhealingAgents.self_healing_system.context_retrieving.dom_snapshot import (
+    DomSnapshot,
+)
 from SelfhealingAgents.self_healing_system.context_retrieving.dom_soap_utils import (
     SoupDomUtils,
 )
 from SelfhealingAgents.self_healing_system.context_retrieving.library_dom_utils.base_dom_utils import (
     BaseDomUtils,
 )
+from SelfhealingAgents.self_healing_system.schemas.internal_state.locator_status import (
+    LocatorStatus,
+)
 from SelfhealingAgents.utils.logging import log
 
 
@@ -51,6 +61,58 @@ class BrowserDomUtils(BaseDomUtils):
         "select options",
     }
 
+    # Collects the metadata of a single element, shared by all JavaScript metadata paths
+    _ELEMENT_METADATA_JS: str = """(elem) => {
+        const metadata = {};
+        const put = (key, value) => {
+            if (value) {
+                metadata[key] = String(value);
+            }
+        };
+        for (const property of ["tagName", "childElementCount", "innerText", "type", "value", "name"]) {
+            put(property, elem[property]);
+        }
+        for (const relative of ["parentElement", "previousSibling", "nextSibling"]) {
+            const node = elem[relative];
+            put(`${relative}.tagName`, node && node.tagName);
+            put(`${relative}.innerText`, node && node.innerText);
+        }
+        for (const attribute of ["id", "class", "placeholder", "role", "href", "title"]) {
+            put(attribute, elem.getAttribute(attribute));
+        }
+        const rect = elem.getBoundingClientRect();
+        metadata.is_visible = rect.width > 0 && rect.height > 0
+            && window.getComputedStyle(elem).visibility !== "hidden";
+        metadata.is_enabled = !(elem.matches(":disabled")
+            || elem.closest('[aria-disabled="true"]') !== null);
+        metadata.is_checked = elem.checked === true
+            || elem.getAttribute("aria-checked") === "true";
+        return metadata;
+    }"""
+
+    # Summarizes the elements matched by one locator, following is_element_clickable
+    _ELEMENTS_STATUS_JS: str = """(elements, includeMetadata) => {
+        const clickableTags = ["button", "a", "select", "mat-button", "mat-radio-button",
+            "mat-checkbox", "md-button", "ion-button", "vaadin-button", "paper-button", "x-button"];
+        const clickableInputTypes = ["button", "radio", "checkbox", "search", "reset", "submit"];
+        const describe = ELEMENT_METADATA;
+        if (elements.length === 0) {
+            return {count: 0, clickable: false, visible: false, metadata: []};
+        }
+        const elem = elements[0];
+        const tag = elem.tagName.toLowerCase();
+        const rect = elem.getBoundingClientRect();
+        return {
+            count: elements.length,
+            clickable: clickableTags.includes(tag)
+                || (tag === "input" && clickableInputTypes.includes(elem.type))
+                || window.getComputedStyle(elem).getPropertyValue("cursor") === "pointer",
+            visible: rect.width > 0 && rect.height > 0
+                && window.getComputedStyle(elem).visibility !== "hidden",
+            metadata: includeMetadata ? [describe(elem)] : [],
+        };
+    }""".replace("ELEMENT_METADATA", _ELEMENT_METADATA_JS)
+
     def __init__(self):
         """Initialize Browser DOM utilities."""
         self._library_instance = BuiltIn().get_library_instance("Browser")
@@ -98,95 +160,110 @@ class BrowserDomUtils(BaseDomUtils):
         Returns:
             str: The DOM tree as a string.
         """
+        return self.capture_snapshot().simplified_dom
+
+    def capture_snapshot(self) -> DomSnapshot:
+        """Capture the page once and simplify it for a whole healing attempt.
+
+        The DOM, including open shadow roots, is pruned inside the browser in a single
+        JavaScript call. The page source is only requested if that call fails.
+
+        Returns:
+            DomSnapshot: The snapshot of the current page.
+        """
         if self._library_instance is None:
-            return "<html><body>Browser library not available</body></html>"
+            return DomSnapshot("<html><body>Browser library not available</body></html>")
 
+        # Walks the light DOM and open shadow roots once and applies the pruning rules of
+        # SoupDomUtils.get_simplified_dom_tree, so that only the compact <body> is transferred.
         script: str = """() =>
         {
-        function getFullInnerHTML(node = document.documentElement) {
-            // Function to process each node and retrieve its HTML including Shadow DOM
-            function processNode(node) {
-                let html = "";
-
-                // Check if the node is an element
-                if (node.nodeType === Node.ELEMENT_NODE) {
-                    // If the node has a Shadow DOM, recursively process its shadow DOM
-                    if (node.shadowRoot) {
-                        html += `<${node.tagName.toLowerCase()}${getAttributes(node)}>`;
-                        html += processNode(node.shadowRoot);
-                        html += `</${node.tagName.toLowerCase()}>`;
-                    } else {
-                        // Process children if no Shadow DOM is present
-                        html += `<${node.tagName.toLowerCase()}${getAttributes(node)}>`;
-                        for (let child of node.childNodes) {
-                            html += processNode(child);
-                        }
-                        html += `</${node.tagName.toLowerCase()}>`;
-                    }
-                } else if (node.nodeType === Node.DOCUMENT_FRAGMENT_NODE) {
-                    // Process ShadowRoot (document fragments)
-                    for (let child of node.childNodes) {
-                        html += processNode(child);
-                    }
-                } else if (node.nodeType === Node.TEXT_NODE) {
-                    // Add text content for text nodes
-                    html += node.textContent;
-                }
-                return html;
+            const DROPPED_TAGS = new Set([
+                "script", "svg", "source", "animatetransform", "template", "head", "nav"
+            ]);
+            const KEPT_ATTRIBUTES = new Set(["id", "class", "value", "name", "type", "placeholder", "role"]);
+            const CLASSLESS_TAGS = new Set(["a", "section", "picture", "img"]);
+            const VOID_TAGS = new Set([
+                "area", "base", "br", "col", "embed", "hr", "img", "input",
+                "link", "meta", "param", "source", "track", "wbr"
+            ]);
+            const RAW_TEXT_TAGS = new Set(["style"]);
+
+            function escapeText(text) {
+                return text.replace(/&/g, "&amp;").replace(/</g, "&lt;").replace(/>/g, "&gt;");
             }
 
-            // Helper function to get attributes of an element
-            function getAttributes(node) {
-                if (node.attributes && node.attributes.length > 0) {
-                    return Array.from(node.attributes)
-                        .map(attr => ` ${attr.name}="${attr.value}"`)
-                        .join("");
+            function escapeAttribute(value) {
+                return value.replace(/&/g, "&amp;").replace(/"/g, "&quot;");
+            }
+
+            function isDropped(element, tag) {
+                if (DROPPED_TAGS.has(tag)) {
+                    return true;
+                }
+                const style = element.getAttribute("style");
+                if (style && style.includes("display: none")) {
+                    return true;
                 }
-                return "";
+                return element.getAttribute("type") === "hidden";
             }
 
-            // Start processing from the root node
-            return processNode(node);
-        }
+            function serializeChildren(node, parentTag, out) {
+                for (const child of node.childNodes) {
+                    if (child.nodeType === Node.ELEMENT_NODE) {
+                        serializeElement(child, out);
+                    } else if (child.nodeType === Node.TEXT_NODE) {
+                        out.push(RAW_TEXT_TAGS.has(parentTag) ? child.data : escapeText(child.data));
+                    }
+                }
+            }
 
-        // Get the full inner HTML including all Shadow DOMs
-        const fullHTML = getFullInnerHTML();
-        return fullHTML;
+            function serializeElement(element, out) {
+                const tag = element.localName.toLowerCase();
+                if (isDropped(element, tag)) {
+                    return;
+                }
+                out.push("<", tag);
+                for (const attribute of element.attributes) {
+                    const name = attribute.name;
+                    if (!KEPT_ATTRIBUTES.has(name) || (name === "class" && CLASSLESS_TAGS.has(tag))) {
+                        continue;
+                    }
+                    out.push(" ", name, '="', escapeAttribute(attribute.value), '"');
+                }
+                out.push(">");
+                if (VOID_TAGS.has(tag)) {
+                    return;
+                }
+                // Shadow hosts render their shadow tree instead of their light DOM children
+                serializeChildren(element.shadowRoot || element, tag, out);
+                out.push("</", tag, ">");
             }
-        """
 
-        shadowdom_exist_script: str = """ () => {      
-        return Array.from(document.querySelectorAll('*')).some(el => el.shadowRoot);
+            if (!document.body) {
+                return null;
+            }
+            const out = [];
+            serializeElement(document.body, out);
+            return out.join("");
         }
         """
 
+        page_source: str | None = None
         try:
-            shadowdom_exists: bool = getattr(
-                self._library_instance, "evaluate_javascript"
-            )(None, shadowdom_exist_script)
-            if shadowdom_exists:
-                soup: BeautifulSoup = BeautifulSoup(
-                    getattr(self._library_instance, "evaluate_javascript")(
-                        None, script
-                    ),
-                    "html.parser",
-                )
-            else:
-                soup: BeautifulSoup = BeautifulSoup(
-                    getattr(self._library_instance, "get_page_source")(), "html.parser"
-                )
+            page_source = getattr(self._library_instance, "evaluate_javascript")(
+                None, script
+            )
         except Exception:
+            page_source = None
+        if not page_source:
             try:
-                soup: BeautifulSoup = BeautifulSoup(
-                    getattr(self._library_instance, "get_page_source")(), "html.parser"
-                )
+                page_source = getattr(self._library_instance, "get_page_source")()
             except Exception:
-                return "<html><body>Unable to retrieve DOM tree</body></html>"
+                return DomSnapshot("<html><body>Unable to retrieve DOM tree</body></html>")
 
-        source: str = SoupDomUtils().get_simplified_dom_tree(
-            str(soup.body) if soup.body else str(soup)
-        )
-        return source
+        source: str = SoupDomUtils().get_simplified_dom_tree(page_source)
+        return DomSnapshot(source, raw_source=page_source)
 
     def get_library_type(self) -> str:
         """Get the library type identifier.
@@ -254,20 +331,146 @@ class BrowserDomUtils(BaseDomUtils):
         except Exception:
             return False
 
+    def _validate_locators_live(
+        self, locators: List[str], *, include_metadata: bool = False
+    ) -> List[LocatorStatus]:
+        """Validate many locators with as few Browser library calls as possible.
+
+        CSS and XPath locators are all resolved inside the page with a single JavaScript
+        evaluation. Locators that need the Playwright selector engine, such as `text=`,
+        chained `>>` selectors or CSS on pages with shadow roots, are evaluated with one
+        call per locator.
+
+        Args:
+            locators: The locators to validate.
+            include_metadata: Whether to collect element metadata as well.
+
+        Returns:
+            One status per locator, in the order of `locators`.
+        """
+        if self._library_instance is None or not locators:
+            return super()._validate_locators_live(locators, include_metadata=include_metadata)
+
+        script: str = """(arg) => {
+            const summarize = ELEMENTS_STATUS;
+            const hasShadowRoots = Array.from(document.querySelectorAll("*")).some(
+                (elem) => elem.shadowRoot
+            );
+            const resolve = (query) => {
+                if (query === null) {
+                    return null;
+                }
+                try {
+                    if (query.css !== undefined) {
+                        return hasShadowRoots ? null : Array.from(document.querySelectorAll(query.css));
+                    }
+                    const result = document.evaluate(query.xpath, document, null,
+                        XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+                    const elements = [];
+                    for (let i = 0; i < result.snapshotLength; i++) {
+                        const node = result.snapshotItem(i);
+                        if (node.nodeType !== Node.ELEMENT_NODE) {
+                            return null;
+                        }
+                        elements.push(node);
+                    }
+                    return elements;
+                } catch (e) {
+                    return null;
+                }
+            };
+            return arg.queries.map((query) => {
+                const elements = resolve(query);
+                return elements === null ? null : summarize(elements, arg.includeMetadata);
+            });
+        }""".replace("ELEMENTS_STATUS", self._ELEMENTS_STATUS_JS)
+
+        queries: List[Dict | None] = [self._get_script_query(loc) for loc in locators]
+        results: List[Dict | None] = [None] * len(locators)
+        if any(query is not None for query in queries):
+            try:
+                in_page: List[Dict | None] = getattr(
+                    self._library_instance, "evaluate_javascript"
+                )(None, script, arg={"queries": queries, "includeMetadata": include_metadata})
+                if isinstance(in_page, list) and len(in_page) == len(locators):
+                    results = in_page
+            except Exception:
+                pass
+
+        statuses: List[LocatorStatus] = []
+        for locator, result in zip(locators, results):
+            if result is None:
+                try:
+                    result = getattr(self._library_instance, "evaluate_javascript")(
+                        locator,
+                        self._ELEMENTS_STATUS_JS,
+                        arg=include_metadata,
+                        all_elements=True,
+                    )
+                except Exception:
+                    result = {"count": 0}
+            count: int = result.get("count") or 0
+            statuses.append(
+                LocatorStatus(
+                    locator=locator,
+                    count=count,
+                    valid=count >= 1,
+                    unique=count == 1,
+                    clickable=bool(result.get("clickable")),
+                    visible=bool(result.get("visible")),
+                    metadata=list(result.get("metadata") or []),
+                )
+            )
+        return statuses
+
+    @staticmethod
+    def _get_script_query(locator: str) -> Dict | None:
+        """Translate a CSS or XPath locator into a query that can be resolved inside the page.
+
+        Follows Playwright's selector parsing: explicit `css=`/`xpath=` engines, implicit
+        XPath starting with `//` or `..` and implicit CSS. Chained selectors, quoted text
+        selectors and all other engines are left to the Browser library.
+
+        Args:
+            locator: The locator to translate.
+
+        Returns:
+            A dictionary with either a 'css' or an 'xpath' key, or None if not translatable.
+        """
+        locator = locator.strip()
+        if not locator or ">>" in locator or locator[0] in "\"'`":
+            return None
+        engine: re.Match | None = re.match(r"([a-zA-Z_0-9\-+:*]+)\s*=\s*", locator)
+        if engine is not None:
+            name: str = engine.group(1).lower()
+            if name not in ("css", "xpath"):
+                return None
+            return {name: locator[engine.end():]}
+        if locator.startswith(("//", "..")):
+            return {"xpath": locator}
+        return {"css": locator}
+
     @log
     def get_locator_proposals(
-        self, failed_locator: str, keyword_name: str
+        self,
+        failed_locator: str,
+        keyword_name: str,
+        *,
+        dom_snapshot: DomSnapshot | None = None,
     ) -> list[str]:
         """Get proposals for the given locator.
 
         Args:
             locator: The locator to get proposals for.
+            dom_snapshot: Snapshot of the current page. If not given, the DOM is retrieved
+                from the library.
 
         Returns:
             A list of proposed locators.
         """
-        dom_tree: str = self.get_dom_tree()
-        soup: BeautifulSoup = BeautifulSoup(dom_tree, "html.parser")
+        if dom_snapshot is None:
+            dom_snapshot = self.capture_snapshot()
+        soup: BeautifulSoup = dom_snapshot.soup
 
         keyword_key: str = (keyword_name or "").lower()
         heuristic_locators: List[str] = self._generate_semantic_locators(
@@ -339,11 +542,40 @@ class BrowserDomUtils(BaseDomUtils):
                 locator = None
             if locator:
                 locators.append(locator)
+        logging.getLogger("SelfhealingReports").info(
+            f"Selector count memo stats: {DomQueryContext.for_soup(soup).stats}"
+        )
         return self._deduplicate(locators)
 
     def get_locator_metadata(self, locator: str) -> list[dict]:
         """Get metadata for the given locator.
 
+        All elements matching the locator are described in a single JavaScript evaluation.
+        If that is not possible, the metadata is collected element by element.
+
+        Args:
+            locator: The locator to get metadata for.
+
+        Returns:
+            A list of dictionaries containing metadata about elements matching the locator.
+        """
+        if self._library_instance is None:
+            return []
+
+        script: str = f"(elements) => elements.map({self._ELEMENT_METADATA_JS})"
+        try:
+            metadata_list: List[Dict] = getattr(
+                self._library_instance, "evaluate_javascript"
+            )(locator, script, all_elements=True)
+            if isinstance(metadata_list, list):
+                return metadata_list
+        except Exception:
+            pass
+        return self._get_locator_metadata_per_element(locator)
+
+    def _get_locator_metadata_per_element(self, locator: str) -> list[dict]:
+        """Get metadata for the given locator with separate calls per element and property.
+
         Args:
             locator: The locator to get metadata for.
 
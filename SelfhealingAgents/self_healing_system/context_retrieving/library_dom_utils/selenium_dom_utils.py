@@ -1,16 +1,26 @@
 import re
+import logging
 from typing import Dict, Iterable, List
 
 from bs4 import BeautifulSoup, Tag
 from robot.libraries.BuiltIn import BuiltIn
 from selenium.webdriver.remote.webelement import WebElement
 
+from SelfhealingAgents.self_healing_system.context_retrieving.dom_query_context import (
+    DomQueryContext,
+)
+from SelfhealingAgents.self_healing_system.context_retrieving.dom_snapshot import (
+    DomSnapshot,
+)
 from SelfhealingAgents.self_healing_system.context_retrieving.dom_soap_utils import (
     SoupDomUtils,
 )
 from SelfhealingAgents.self_healing_system.context_retrieving.library_dom_utils.base_dom_utils import (
     BaseDomUtils,
 )
+from SelfhealingAgents.self_healing_system.schemas.internal_state.locator_status import (
+    LocatorStatus,
+)
 from SelfhealingAgents.utils.logging import log
 
 
@@ -104,20 +114,24 @@ class SeleniumDomUtils(BaseDomUtils):
         Returns:
             str: The DOM tree as a string.
         """
+        return self.capture_snapshot().simplified_dom
+
+    def capture_snapshot(self) -> DomSnapshot:
+        """Capture the page source once and simplify it for a whole healing attempt.
+
+        Returns:
+            DomSnapshot: The snapshot of the current page.
+        """
         if self._library_instance is None:
-            return "<html><body>SeleniumLibrary not available</body></html>"
+            return DomSnapshot("<html><body>SeleniumLibrary not available</body></html>")
 
         try:
             page_source: str = getattr(self._library_instance, "get_source")()
-
-            soup: BeautifulSoup = BeautifulSoup(page_source, "html.parser")
-            source: str = SoupDomUtils().get_simplified_dom_tree(
-                str(soup.body) if soup.body else str(soup)
-            )
-            return source
+            source: str = SoupDomUtils().get_simplified_dom_tree(page_source)
+            return DomSnapshot(source, raw_source=page_source)
 
         except Exception as e:
-            return f"<html><body>Error retrieving DOM tree: {str(e)}</body></html>"
+            return DomSnapshot(f"<html><body>Error retrieving DOM tree: {str(e)}</body></html>")
 
     def get_library_type(self) -> str:
         """Get the library type identifier.
@@ -194,20 +208,184 @@ class SeleniumDomUtils(BaseDomUtils):
         except Exception:
             return False
 
+    def _validate_locators_live(
+        self, locators: List[str], *, include_metadata: bool = False
+    ) -> List[LocatorStatus]:
+        """Validate many locators with a single JavaScript execution.
+
+        CSS and XPath locators are resolved inside the page. Other locators are resolved to
+        web elements by SeleniumLibrary and passed to the same script. Count, clickability
+        and metadata of all locators are then read in one request. If the script fails,
+        the locators are validated one by one.
+
+        Args:
+            locators: The locators to validate.
+            include_metadata: Whether to collect element metadata as well.
+
+        Returns:
+            One status per locator, in the order of `locators`.
+        """
+        if self._library_instance is None or not locators:
+            return super()._validate_locators_live(locators, include_metadata=include_metadata)
+
+        script: str = """
+        const [queries, includeMetadata] = arguments;
+        const clickableTags = ["button", "a", "select", "mat-button", "mat-radio-button",
+            "mat-checkbox", "md-button", "ion-button", "vaadin-button", "paper-button",
+            "x-button", "textarea"];
+        const clickableInputTypes = ["button", "radio", "checkbox", "search", "reset", "submit"];
+        const resolve = (query) => {
+            if (query === null || Array.isArray(query)) {
+                return query;
+            }
+            try {
+                if (query.css !== undefined) {
+                    return Array.from(document.querySelectorAll(query.css));
+                }
+                const result = document.evaluate(query.xpath, document, null,
+                    XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+                const elements = [];
+                for (let i = 0; i < result.snapshotLength; i++) {
+                    const node = result.snapshotItem(i);
+                    if (node.nodeType !== Node.ELEMENT_NODE) {
+                        return null;
+                    }
+                    elements.push(node);
+                }
+                return elements;
+            } catch (e) {
+                return null;
+            }
+        };
+        const cursorOf = (elem) => window.getComputedStyle(elem).getPropertyValue("cursor");
+        const isVisible = (elem) => {
+            const rect = elem.getBoundingClientRect();
+            return rect.width > 0 && rect.height > 0
+                && window.getComputedStyle(elem).visibility !== "hidden";
+        };
+        const isClickable = (elem) => {
+            const tag = elem.tagName.toLowerCase();
+            return clickableTags.includes(tag)
+                || (tag === "input" && clickableInputTypes.includes(elem.type))
+                || cursorOf(elem) === "pointer";
+        };
+        const describe = (elem) => {
+            const metadata = {};
+            const put = (key, value) => {
+                if (value) {
+                    metadata[key] = String(value);
+                }
+            };
+            for (const property of ["tagName", "childElementCount", "innerText", "type", "value", "name"]) {
+                put(property, elem[property]);
+            }
+            for (const relative of ["parentElement", "previousSibling", "nextSibling"]) {
+                const node = elem[relative];
+                put(`${relative}.tagName`, node && node.tagName);
+                put(`${relative}.innerText`, node && node.innerText);
+            }
+            for (const attribute of ["id", "class", "placeholder", "role", "href", "title"]) {
+                const value = elem.getAttribute(attribute);
+                put(attribute, attribute === "href" && value !== null && typeof elem.href === "string"
+                    ? elem.href : value);
+            }
+            metadata.is_displayed = isVisible(elem);
+            metadata.is_enabled = !elem.matches(":disabled");
+            metadata.is_selected = elem.selected === true || elem.checked === true;
+            metadata.clickable = ["BUTTON", "A", "INPUT", "SELECT"].includes(elem.tagName.toUpperCase())
+                || cursorOf(elem) === "pointer"
+                || elem.value === "on" || elem.value === "off"
+                || (elem.checked !== undefined && elem.checked !== null);
+            return metadata;
+        };
+        return queries.map((query) => {
+            const elements = resolve(query);
+            if (elements === null || elements.length === 0) {
+                return {count: elements === null ? null : 0, clickable: false, visible: false, metadata: []};
+            }
+            return {
+                count: elements.length,
+                clickable: isClickable(elements[0]),
+                visible: isVisible(elements[0]),
+                metadata: includeMetadata ? [describe(elements[0])] : [],
+            };
+        });
+        """
+        queries: List = []
+        for locator in locators:
+            query: Dict | None = self._get_script_query(locator)
+            if query is None:
+                try:
+                    query = getattr(self._library_instance, "get_webelements")(locator)
+                except Exception:
+                    query = None
+            queries.append(query)
+
+        try:
+            results: List[Dict] = getattr(self._library_instance, "execute_javascript")(
+                script, "ARGUMENTS", queries, include_metadata
+            )
+            if len(results) == len(locators):
+                return [
+                    LocatorStatus(
+                        locator=locator,
+                        count=result.get("count") or 0,
+                        valid=(result.get("count") or 0) >= 1,
+                        unique=result.get("count") == 1,
+                        clickable=bool(result.get("clickable")),
+                        visible=bool(result.get("visible")),
+                        metadata=list(result.get("metadata") or []),
+                    )
+                    for locator, result in zip(locators, results)
+                ]
+        except Exception:
+            pass
+        return super()._validate_locators_live(locators, include_metadata=include_metadata)
+
+    @staticmethod
+    def _get_script_query(locator: str) -> Dict | None:
+        """Translate a CSS or XPath locator into a query that can be resolved inside the page.
+
+        Follows SeleniumLibrary's locator parsing: explicit `css`/`xpath` strategies and
+        implicit XPath starting with `//` or `(//`. Chained locators and all other strategies
+        are left to SeleniumLibrary.
+
+        Args:
+            locator: The locator to translate.
+
+        Returns:
+            A dictionary with either a 'css' or an 'xpath' key, or None if not translatable.
+        """
+        if " >> " in locator:
+            return None
+        if locator.startswith(("//", "(//")):
+            return {"xpath": locator}
+        match: re.Match | None = re.match(r"\s*(css|xpath)\s*[:=]", locator, re.IGNORECASE)
+        if match is None:
+            return None
+        return {match.group(1).lower(): locator[match.end():].lstrip()}
+
     @log
     def get_locator_proposals(
-        self, failed_locator: str, keyword_name: str
+        self,
+        failed_locator: str,
+        keyword_name: str,
+        *,
+        dom_snapshot: DomSnapshot | None = None,
     ) -> List[str]:
         """Get proposals for the given locator.
 
         Args:
             locator: The locator to get proposals for.
+            dom_snapshot: Snapshot of the current page. If not given, the DOM is retrieved
+                from the library.
 
         Returns:
             A list of proposed locators.
         """
-        dom_tree: str = self.get_dom_tree()
-        soup: BeautifulSoup = BeautifulSoup(dom_tree, "html.parser")
+        if dom_snapshot is None:
+            dom_snapshot = self.capture_snapshot()
+        soup: BeautifulSoup = dom_snapshot.soup
 
         keyword_key: str = (keyword_name or "").lower()
         heuristic_locators: List[str] = self._generate_semantic_locators(
@@ -288,6 +466,9 @@ class SeleniumDomUtils(BaseDomUtils):
                 locator = None
             if locator:
                 locators.append(locator)
+        logging.getLogger("SelfhealingReports").info(
+            f"Selector count memo stats: {DomQueryContext.for_soup(soup).stats}"
+        )
         return self._deduplicate(locators)
 
     def get_locator_metadata(self, locator: str) -> List[Dict]:
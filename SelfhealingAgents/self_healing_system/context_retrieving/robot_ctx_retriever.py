@@ -4,6 +4,8 @@ from robot.utils.misc import seq2str
 from robot.libraries.BuiltIn import BuiltIn
 
 from SelfhealingAgents.utils.logging import log
+from SelfhealingAgents.self_healing_system.context_retrieving.dom_snapshot import DomSnapshot
+from SelfhealingAgents.self_healing_system.context_retrieving.file_context_extractor import FileContextExtractor
 from SelfhealingAgents.self_healing_system.context_retrieving.library_dom_utils.base_dom_utils import BaseDomUtils
 from SelfhealingAgents.self_healing_system.schemas.internal_state.prompt_payload import PromptPayload
 
@@ -20,7 +22,10 @@ class RobotCtxRetriever:
     def get_context_payload(
         data: running.Keyword,
         result: result.Keyword,
-        dom_utility: BaseDomUtils
+        dom_utility: BaseDomUtils,
+        *,
+        dom_snapshot: DomSnapshot | None = None,
+        file_context_token_cap: int = 0,
     ) -> PromptPayload:
         """Builds and returns a context payload for the LLM self-healing process.
 
@@ -30,23 +35,27 @@ class RobotCtxRetriever:
         Args:
             result: The keyword result and additional information passed by the Robot Framework listener.
             dom_utility: The library-specific DOM utility instance.
+            dom_snapshot: Snapshot of the current page. If not given, it is captured via the dom_utility.
+            file_context_token_cap: Approximate number of tokens of the source file context. 0 sends the whole file.
 
         Returns:
             A PromptPayload object containing context for the self-healing process.
         """
         robot_code_line: str = RobotCtxRetriever._format_keyword_call(result)
-        dom_tree: str = dom_utility.get_dom_tree()
+        if dom_snapshot is None:
+            dom_snapshot = dom_utility.capture_snapshot()
 
         robot_ctx_payload: PromptPayload = PromptPayload(
             robot_code_line=robot_code_line,
             error_msg=result.message,
-            dom_tree=dom_tree,
+            dom_tree=dom_snapshot.simplified_dom,
             keyword_name=result.name,
             keyword_args=result.args,
             failed_locator=BuiltIn().replace_variables(result.args[0]),
             tried_locator_memory=[],
             locator_type="tbd",
-            file_usage_ctx=RobotCtxRetriever._file_usage_ctx(data)
+            file_usage_ctx=RobotCtxRetriever._file_usage_ctx(data, token_cap=file_context_token_cap),
+            dom_snapshot=dom_snapshot,
         )
         return robot_ctx_payload
 
@@ -71,16 +80,16 @@ class RobotCtxRetriever:
         return f"{assign_str}{result.name} {args_part}"
 
     @staticmethod
-    def _file_usage_ctx(data: running.Keyword) -> str:
-        """Loads the full source file in which the locator failed and returns it as string for context of LLM.
+    def _file_usage_ctx(data: running.Keyword, *, token_cap: int = 0) -> str:
+        """Returns the part of the source file in which the locator failed as context for the LLM.
 
         Args:
-            data: The running test case data.#
+            data: The running keyword data.
+            token_cap: Approximate number of tokens of the context. 0 returns the full file.
 
         Returns:
-            Full file string for context of LLM.
+            The enclosing test or keyword with the variables it references, or the full file.
         """
-        source_file = Path(data.source)
-        if not source_file.exists():
-            raise FileNotFoundError(f"Source file for LLM context not found: {source_file}")
-        return source_file.read_text(encoding="utf-8", errors="ignore")
\ No newline at end of file
+        return FileContextExtractor.extract(
+            Path(data.source), getattr(data, "lineno", None), token_cap=token_cap
+        )
\ No newline at end of file
@@ -0,0 +1,70 @@
+import asyncio
+from typing import Any, Coroutine, Dict, Optional, TypeVar
+
+import httpx
+
+from SelfhealingAgents.self_healing_system.llm.http_client import create_http_client
+
+
+T = TypeVar("T")
+
+
+class EventLoopRunner:
+    """Owns the long-lived asyncio event loop of the healing pipeline.
+
+    Robot Framework calls the listener synchronously, so every healing coroutine is submitted
+    to this runner, which blocks until the coroutine is done. The event loop is created on first
+    use and kept for the whole run, so that HTTP connection pools bound to it survive between
+    failures and coroutines of a healing attempt can run concurrently.
+
+    The HTTP client and the agents built on it are bound to the loop as well, so the runner owns
+    them and releases them when it is closed.
+
+    The loop runs on the calling thread, because Robot Framework ignores log messages and
+    keyword calls from other threads.
+
+    Attributes:
+        agent_pool (Dict[Any, Any]): Agents built for this runner, reused by later healing attempts.
+        _loop (Optional[asyncio.AbstractEventLoop]): The event loop, or None if not created yet.
+        _http_client (Optional[httpx.AsyncClient]): The HTTP client, or None if not created yet.
+    """
+    def __init__(self) -> None:
+        """Initializes the EventLoopRunner without creating the event loop yet."""
+        self.agent_pool: Dict[Any, Any] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._http_client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """The keep-alive HTTP client of the language model clients run on this runner."""
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = create_http_client()
+        return self._http_client
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Runs a coroutine on the event loop and waits for its result.
+
+        Args:
+            coro: The coroutine to run.
+
+        Returns:
+            The result of the coroutine.
+        """
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(coro)
+
+    def close(self) -> None:
+        """Closes the HTTP client, drops the pooled agents and closes the event loop."""
+        self.agent_pool.clear()
+        try:
+            if self._http_client is not None and not self._http_client.is_closed:
+                self.run(self._http_client.aclose())
+        finally:
+            self._http_client = None
+            if self._loop is not None and not self._loop.is_closed():
+                try:
+                    self._loop.run_until_complete(self._loop.shutdown_asyncgens())
+                finally:
+                    self._loop.close()
+                    self._loop = None
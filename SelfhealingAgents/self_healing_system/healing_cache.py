@@ -0,0 +1,165 @@
+import sqlite3
+import time
+from pathlib import Path
+from typing import List, NamedTuple, Optional
+
+
+class CachedHealing(NamedTuple):
+    """A verified healing stored in the healing cache.
+
+    Attributes:
+        fingerprint (str): Structural fingerprint of the DOM region around the healed element.
+        healed_locator (str): Locator that healed the failure.
+    """
+    fingerprint: str
+    healed_locator: str
+
+
+class HealingCache:
+    """Persistent cross-run cache of verified locator healings.
+
+    Healings are stored in a SQLite database keyed by library, keyword, failed locator and
+    a structural fingerprint of the DOM region around the healed element. Only healings
+    whose rerun passed are stored. Entries expire after a time to live, the least recently
+    used entries are evicted beyond a maximum number of entries, and entries are removed
+    when their healed locator stops working.
+
+    Attributes:
+        _path (Path): Path of the SQLite database file.
+        _ttl_seconds (float): Time to live of an entry since its last use, in seconds.
+        _max_entries (int): Maximum number of entries kept in the cache.
+        _connection (sqlite3.Connection): Connection to the SQLite database.
+    """
+    def __init__(self, path: str | Path, *, ttl_days: float = 30.0, max_entries: int = 1000) -> None:
+        """Initializes the HealingCache and creates the database if needed.
+
+        Args:
+            path (str | Path): Path of the SQLite database file.
+            ttl_days (float): Time to live of an entry since its last use, in days.
+            max_entries (int): Maximum number of entries kept in the cache.
+        """
+        self._path: Path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._ttl_seconds: float = ttl_days * 24 * 60 * 60
+        self._max_entries: int = max_entries
+        self._connection: sqlite3.Connection = sqlite3.connect(str(self._path), timeout=30)
+        with self._connection:
+            self._connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS healed_locators (
+                    library TEXT NOT NULL,
+                    keyword TEXT NOT NULL,
+                    failed_locator TEXT NOT NULL,
+                    fingerprint TEXT NOT NULL,
+                    healed_locator TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_used_at REAL NOT NULL,
+                    hits INTEGER NOT NULL DEFAULT 0,
+                    PRIMARY KEY (library, keyword, failed_locator, fingerprint, healed_locator)
+                )
+                """
+            )
+        self._evict()
+
+    def lookup(self, library: str, keyword: str, failed_locator: str) -> List[CachedHealing]:
+        """Returns the cached healings of a failed locator, most recently used first.
+
+        Args:
+            library (str): Name of the library that owns the keyword.
+            keyword (str): Name of the failed keyword.
+            failed_locator (str): The resolved locator that failed.
+
+        Returns:
+            List[CachedHealing]: The cached healings, possibly empty.
+        """
+        rows = self._connection.execute(
+            """
+            SELECT fingerprint, healed_locator FROM healed_locators
+            WHERE library = ? AND keyword = ? AND failed_locator = ? AND last_used_at >= ?
+            ORDER BY last_used_at DESC
+            """,
+            (library, keyword, failed_locator, time.time() - self._ttl_seconds),
+        ).fetchall()
+        return [CachedHealing(*row) for row in rows]
+
+    def store(
+        self,
+        library: str,
+        keyword: str,
+        failed_locator: str,
+        fingerprint: str,
+        healed_locator: str,
+    ) -> None:
+        """Stores a verified healing, or marks it as used if it is already cached.
+
+        Args:
+            library (str): Name of the library that owns the keyword.
+            keyword (str): Name of the failed keyword.
+            failed_locator (str): The resolved locator that failed.
+            fingerprint (str): Structural fingerprint of the DOM region around the healed element.
+            healed_locator (str): Locator that healed the failure.
+        """
+        now: float = time.time()
+        with self._connection:
+            self._connection.execute(
+                """
+                INSERT INTO healed_locators
+                    (library, keyword, failed_locator, fingerprint, healed_locator,
+                     created_at, last_used_at, hits)
+                VALUES (?, ?, ?, ?, ?, ?, ?, 0)
+                ON CONFLICT (library, keyword, failed_locator, fingerprint, healed_locator)
+                DO UPDATE SET last_used_at = excluded.last_used_at, hits = hits + 1
+                """,
+                (library, keyword, failed_locator, fingerprint, healed_locator, now, now),
+            )
+        self._evict()
+
+    def invalidate(
+        self,
+        library: str,
+        keyword: str,
+        failed_locator: str,
+        healed_locator: Optional[str] = None,
+    ) -> None:
+        """Removes cached healings of a failed locator, e.g. when a healed locator stopped working.
+
+        Args:
+            library (str): Name of the library that owns the keyword.
+            keyword (str): Name of the failed keyword.
+            failed_locator (str): The resolved locator that failed.
+            healed_locator (Optional[str]): Only remove healings with this locator. All
+                healings of the failed locator are removed if not given.
+        """
+        query: str = (
+            "DELETE FROM healed_locators WHERE library = ? AND keyword = ? AND failed_locator = ?"
+        )
+        parameters: tuple = (library, keyword, failed_locator)
+        if healed_locator is not None:
+            query += " AND healed_locator = ?"
+            parameters += (healed_locator,)
+        with self._connection:
+            self._connection.execute(query, parameters)
+
+    def close(self) -> None:
+        """Closes the database connection."""
+        self._connection.close()
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM healed_locators").fetchone()[0]
+
+    def _evict(self) -> None:
+        """Removes expired entries and the least recently used entries beyond the maximum."""
+        with self._connection:
+            self._connection.execute(
+                "DELETE FROM healed_locators WHERE last_used_at < ?",
+                (time.time() - self._ttl_seconds,),
+            )
+            self._connection.execute(
+                """
+                DELETE FROM healed_locators WHERE rowid IN (
+                    SELECT rowid FROM healed_locators
+                    ORDER BY last_used_at DESC LIMIT -1 OFFSET ?
+                )
+                """,
+                (self._max_entries,),
+            )
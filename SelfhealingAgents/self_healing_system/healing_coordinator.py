@@ -0,0 +1,194 @@
+import os
+import socket
+import sqlite3
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import ClassVar, Dict, Final, Iterator, Optional
+
+
+# Window of the global LLM request budget, in seconds
+_RATE_WINDOW: Final[float] = 60.0
+_CLAIM_POLL_INTERVAL: Final[float] = 0.5
+
+
+class HealingCoordinator:
+    """Coordinates the healings of parallel worker processes, e.g. of pabot, through a shared SQLite file.
+
+    Workers claim the failed locator they heal, so that a locator failing in several workers at once is
+    healed by one of them only. The other workers wait until the claim is released and then reuse the
+    healing from the shared healing cache. In addition, the LLM requests of all workers are limited to a
+    global number of requests per minute. Claims of workers that died are released after the claim
+    timeout.
+
+    The coordinator of a file is shared within the process, see `shared`. Holders that outlive a run, like
+    the pooled model clients, look it up on every use, so that a closed coordinator is reopened.
+
+    Attributes:
+        _instances (ClassVar[Dict[str, HealingCoordinator]]): Open coordinators by database path.
+        _path (Path): Path of the SQLite database file.
+        _requests_per_minute (int): Global LLM request budget per minute, 0 for no limit.
+        _claim_timeout (float): Seconds after which a claim is considered stale.
+        _owner (str): Identifier of this coordinator in its worker process.
+        _connection (sqlite3.Connection): Connection to the SQLite database.
+    """
+    _instances: ClassVar[Dict[str, "HealingCoordinator"]] = {}
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        requests_per_minute: int = 0,
+        claim_timeout: float = 120.0,
+    ) -> None:
+        """Initializes the HealingCoordinator and creates the database if needed.
+
+        Args:
+            path (str | Path): Path of the SQLite database file shared by the workers.
+            requests_per_minute (int): Global LLM request budget per minute, 0 for no limit.
+            claim_timeout (float): Seconds after which a claim is considered stale.
+        """
+        self._path: Path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._requests_per_minute: int = requests_per_minute
+        self._claim_timeout: float = claim_timeout
+        self._owner: str = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._connection: sqlite3.Connection = sqlite3.connect(
+            str(self._path), timeout=30, isolation_level=None
+        )
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS healing_claims (
+                claim_key TEXT PRIMARY KEY,
+                owner TEXT NOT NULL,
+                claimed_at REAL NOT NULL
+            )
+            """
+        )
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS llm_requests (requested_at REAL NOT NULL)"
+        )
+
+    @classmethod
+    def shared(
+        cls,
+        path: str | Path,
+        *,
+        requests_per_minute: int = 0,
+        claim_timeout: float = 120.0,
+    ) -> "HealingCoordinator":
+        """Returns the open coordinator of a database file, creating it on first use.
+
+        Args:
+            path (str | Path): Path of the SQLite database file shared by the workers.
+            requests_per_minute (int): Global LLM request budget per minute, 0 for no limit.
+            claim_timeout (float): Seconds after which a claim is considered stale.
+
+        Returns:
+            HealingCoordinator: The coordinator of this process for the database file.
+        """
+        key: str = str(Path(path).resolve())
+        if key not in cls._instances:
+            cls._instances[key] = cls(
+                path, requests_per_minute=requests_per_minute, claim_timeout=claim_timeout
+            )
+        return cls._instances[key]
+
+    def claim(self, claim_key: str) -> bool:
+        """Claims the healing of a failed locator for this worker.
+
+        Args:
+            claim_key (str): Key of the failed locator.
+
+        Returns:
+            bool: True if this worker holds the claim, False if another worker is healing the locator.
+        """
+        now: float = time.time()
+        with self._transaction():
+            self._connection.execute(
+                "DELETE FROM healing_claims WHERE claimed_at < ?", (now - self._claim_timeout,)
+            )
+            self._connection.execute(
+                "INSERT OR IGNORE INTO healing_claims (claim_key, owner, claimed_at) VALUES (?, ?, ?)",
+                (claim_key, self._owner, now),
+            )
+            row = self._connection.execute(
+                "SELECT owner FROM healing_claims WHERE claim_key = ?", (claim_key,)
+            ).fetchone()
+        return row is not None and row[0] == self._owner
+
+    def wait_for_release(self, claim_key: str, timeout: Optional[float] = None) -> bool:
+        """Waits until another worker released its claim of a failed locator.
+
+        Args:
+            claim_key (str): Key of the failed locator.
+            timeout (Optional[float]): Seconds to wait at most, the claim timeout if not given.
+
+        Returns:
+            bool: True if the claim was released, False if the timeout elapsed first.
+        """
+        deadline: float = time.monotonic() + (self._claim_timeout if timeout is None else timeout)
+        while time.monotonic() < deadline:
+            row = self._connection.execute(
+                "SELECT 1 FROM healing_claims WHERE claim_key = ?", (claim_key,)
+            ).fetchone()
+            if row is None:
+                return True
+            time.sleep(_CLAIM_POLL_INTERVAL)
+        return False
+
+    def release(self, claim_key: str) -> None:
+        """Releases the claim of this worker on a failed locator.
+
+        Args:
+            claim_key (str): Key of the failed locator.
+        """
+        self._connection.execute(
+            "DELETE FROM healing_claims WHERE claim_key = ? AND owner = ?",
+            (claim_key, self._owner),
+        )
+
+    def reserve_request(self) -> float:
+        """Reserves an LLM request in the global request budget.
+
+        Returns:
+            float: 0 if the request was reserved, otherwise the seconds to wait before trying again.
+        """
+        if self._requests_per_minute <= 0:
+            return 0.0
+        now: float = time.time()
+        with self._transaction():
+            self._connection.execute(
+                "DELETE FROM llm_requests WHERE requested_at <= ?", (now - _RATE_WINDOW,)
+            )
+            count, oldest = self._connection.execute(
+                "SELECT COUNT(*), MIN(requested_at) FROM llm_requests"
+            ).fetchone()
+            if count < self._requests_per_minute:
+                self._connection.execute("INSERT INTO llm_requests (requested_at) VALUES (?)", (now,))
+                return 0.0
+        return max(oldest + _RATE_WINDOW - now, 0.01)
+
+    def close(self) -> None:
+        """Releases the claims of this worker and closes the database connection."""
+        if self._instances.get(str(self._path.resolve())) is self:
+            del self._instances[str(self._path.resolve())]
+        try:
+            self._connection.execute("DELETE FROM healing_claims WHERE owner = ?", (self._owner,))
+        finally:
+            self._connection.close()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        """Runs a block in a transaction that takes the database write lock at its start.
+
+        The write lock keeps other workers from interleaving between the reads and writes of the block.
+        """
+        self._connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            self._connection.execute("ROLLBACK")
+            raise
+        self._connection.execute("COMMIT")
@@ -1,11 +1,17 @@
-import asyncio
-from typing import List, Final
+from typing import Dict, List, Final, Optional, Tuple
 
 from robot import result, running
 
 from SelfhealingAgents.utils.cfg import Cfg
 from SelfhealingAgents.utils.logging import log
+from SelfhealingAgents.self_healing_system.event_loop_runner import EventLoopRunner
+from SelfhealingAgents.self_healing_system.llm.http_client import use_http_client
+from SelfhealingAgents.self_healing_system.llm.request_scheduler import (
+    ProviderUnavailableError,
+    RequestScheduler,
+)
 from SelfhealingAgents.self_healing_system.schemas.internal_state.prompt_payload import PromptPayload
+from SelfhealingAgents.self_healing_system.context_retrieving.dom_snapshot import DomSnapshot
 from SelfhealingAgents.self_healing_system.context_retrieving.robot_ctx_retriever import RobotCtxRetriever
 from SelfhealingAgents.self_healing_system.agents.locator_agent.base_locator_agent import BaseLocatorAgent
 from SelfhealingAgents.self_healing_system.agents.locator_agent.locator_agent_factory import LocatorAgentFactory
@@ -33,6 +39,55 @@ class KickoffMultiAgentSystem:
     This class coordinates the multi-agent system responsible for self-healing failed Robot Framework keywords.
     It retrieves the necessary context, instantiates the appropriate agents, and triggers the healing process.
     """
+    @staticmethod
+    def get_agent_type(owner: str) -> str:
+        """Maps the library owning a failed keyword to its agent type.
+
+        Args:
+            owner: The name of the Robot Framework library, e.g. 'SeleniumLibrary'.
+
+        Returns:
+            The agent type of the library, e.g. 'selenium'.
+
+        Raises:
+            ValueError: If the library is not supported.
+        """
+        agent_type: str | None = _LIBRARY_MAPPING.get(owner, None)
+        if agent_type is None:
+            raise ValueError(f"Library type: {owner} not supported.")
+        return agent_type
+
+    @staticmethod
+    def get_agents(
+        agent_type: str, cfg: Cfg, dom_utility: BaseDomUtils, event_loop_runner: EventLoopRunner
+    ) -> Tuple[BaseLocatorAgent, OrchestratorAgent]:
+        """Returns the pooled locator and orchestrator agents for a library and configuration.
+
+        The agents and their model clients are built on first use with the HTTP client of the event
+        loop runner, and reused by all later healing attempts on that runner. The DOM utility of the
+        current attempt is handed to the locator agent.
+
+        Args:
+            agent_type: The agent type of the library, e.g. 'selenium'.
+            cfg: An instance of the Cfg config class containing user-defined application configuration.
+            dom_utility: The DOM utility of the current healing attempt.
+            event_loop_runner: The event loop runner the agents run on.
+
+        Returns:
+            The locator agent and the orchestrator agent.
+        """
+        pool: Dict[Tuple[str, Cfg], Tuple[BaseLocatorAgent, OrchestratorAgent]] = event_loop_runner.agent_pool
+        key: Tuple[str, Cfg] = (agent_type, cfg)
+        agents: Tuple[BaseLocatorAgent, OrchestratorAgent] | None = pool.get(key)
+        if agents is None:
+            with use_http_client(event_loop_runner.http_client):
+                locator_agent: BaseLocatorAgent = LocatorAgentFactory.create_agent(agent_type, cfg, dom_utility)
+                agents = (locator_agent, OrchestratorAgent(cfg, locator_agent))
+            pool[key] = agents
+        else:
+            agents[0].dom_utility = dom_utility
+        return agents
+
     @staticmethod
     @log
     def kickoff_healing(
@@ -41,33 +96,63 @@ class KickoffMultiAgentSystem:
         *,
         cfg: Cfg,
         tried_locator_memory: List[str],
+        dom_utility: Optional[BaseDomUtils] = None,
+        dom_snapshot: Optional[DomSnapshot] = None,
+        event_loop_runner: Optional[EventLoopRunner] = None,
     ) -> LocatorHealingResponse | str | NoHealingNeededResponse:
         """Instantiates the multi-agent system, retrieves context, and initiates the self-healing process.
 
+        While the circuit breaker of one of the LLM providers is open, healing is skipped before the page
+        is captured.
+
         Args:
             data: The running test case data.
             result: The keyword result and additional information passed by the Robot Framework listener.
             cfg: An instance of the Cfg config class containing user-defined application configuration.
             tried_locator_memory: A list of locator suggestions that have already been tried and failed.
+            dom_utility: The DOM utility of the library, if already created by the caller.
+            dom_snapshot: The snapshot of the current page, if already captured by the caller.
+            event_loop_runner: The event loop runner owned by the caller. If not given, a runner is created
+                and closed for this call.
 
         Returns:
             A LocatorHealingResponse with suggestions for healing the current Robot Framework test,
              a string message, or a NoHealingNeededResponse if no healing is required.
         """
-        agent_type: str = _LIBRARY_MAPPING.get(result.owner, None)
-        if agent_type is None:
-            raise ValueError(f"Library type: {agent_type} not supported.")
-        dom_utility: BaseDomUtils = DomUtilityFactory.create_dom_utility(agent_type)
+        for provider, model in (
+            (cfg.orchestrator_agent_provider, cfg.orchestrator_agent_model),
+            (cfg.locator_agent_provider, cfg.locator_agent_model),
+        ):
+            if not RequestScheduler.is_available(provider, model):
+                return f"error: LLM provider {provider}:{model} is unavailable, healing is paused."
+
+        agent_type: str = KickoffMultiAgentSystem.get_agent_type(result.owner)
+        if dom_utility is None:
+            dom_utility = DomUtilityFactory.create_dom_utility(agent_type)
+        if dom_snapshot is None:
+            dom_snapshot = dom_utility.capture_snapshot()
 
-        robot_ctx_payload: PromptPayload = RobotCtxRetriever.get_context_payload(data, result, dom_utility)
+        robot_ctx_payload: PromptPayload = RobotCtxRetriever.get_context_payload(
+            data,
+            result,
+            dom_utility,
+            dom_snapshot=dom_snapshot,
+            file_context_token_cap=cfg.file_context_token_cap,
+        )
         robot_ctx_payload.tried_locator_memory = tried_locator_memory
         robot_ctx_payload.locator_type = cfg.locator_type
+        robot_ctx_payload.dom_token_budget = cfg.dom_token_budget
+        robot_ctx_payload.prompt_layout = cfg.prompt_layout
 
-        locator_agent: BaseLocatorAgent = LocatorAgentFactory.create_agent(agent_type, cfg, dom_utility)
-
-        orchestrator_agent: OrchestratorAgent = OrchestratorAgent(cfg, locator_agent)
-
-        response = asyncio.get_event_loop().run_until_complete(
-            orchestrator_agent.run_async(robot_ctx_payload)
-        )
+        runner: EventLoopRunner = event_loop_runner or EventLoopRunner()
+        try:
+            orchestrator_agent: OrchestratorAgent = KickoffMultiAgentSystem.get_agents(
+                agent_type, cfg, dom_utility, runner
+            )[1]
+            response = runner.run(orchestrator_agent.run_async(robot_ctx_payload))
+        except ProviderUnavailableError as e:
+            return f"error: {e}, healing is paused."
+        finally:
+            if event_loop_runner is None:
+                runner.close()
         return response
@@ -1,17 +1,27 @@
-from pydantic_ai.models.openai import OpenAIModel
+from functools import partial
+from pathlib import Path
+
+from pydantic_ai.models import Model
 
 from SelfhealingAgents.utils.cfg import Cfg
 from SelfhealingAgents.utils.logging import log
+from SelfhealingAgents.self_healing_system.healing_coordinator import HealingCoordinator
+from SelfhealingAgents.self_healing_system.llm.coordinated_model import CoordinatedModel
 from SelfhealingAgents.self_healing_system.llm.model_factory import ModelFactory
+from SelfhealingAgents.self_healing_system.llm.request_scheduler import RequestScheduler, ScheduledModel
+from SelfhealingAgents.self_healing_system.llm.response_cache import CachingModel
 
 
 @log
-def get_client_model(*, provider: str, model: str, cfg: Cfg) -> OpenAIModel | None:
+def get_client_model(*, provider: str, model: str, cfg: Cfg) -> Model | None:
     """Creates and returns a language model client for the specified provider and model.
 
     Instantiates a ModelFactory and attempts to create a language model client
     using the given provider, model name, and configuration. If the provider is
-    unknown, returns None.
+    unknown, returns None. The client is wrapped so that its requests keep to the
+    request budget of all workers if they coordinate their healings, are rate limited,
+    retried and cut off by the scheduler of the provider and model, and are
+    recorded to or replayed from disk if the LLM response cache is enabled.
 
     Args:
         provider: The name of the language model provider (e.g., 'openai').
@@ -19,10 +29,40 @@ def get_client_model(*, provider: str, model: str, cfg: Cfg) -> OpenAIModel | No
         cfg: The configuration object containing provider-specific settings.
 
     Returns:
-        An instance of OpenAIModel if the provider is recognized; otherwise, None.
+        The model client if the provider is recognized; otherwise, None.
     """
     factory: ModelFactory = ModelFactory()
     try:
-        return factory.create_model(provider, model, cfg)
+        client: Model = factory.create_model(provider, model, cfg)
     except ValueError:
         return None
+    if cfg.healing_coordination_path and cfg.healing_coordination_requests_per_minute:
+        client = CoordinatedModel(
+            client,
+            coordinator=partial(
+                HealingCoordinator.shared,
+                cfg.healing_coordination_path,
+                requests_per_minute=cfg.healing_coordination_requests_per_minute,
+                claim_timeout=cfg.healing_claim_timeout,
+            ),
+        )
+    client = ScheduledModel(
+        client,
+        scheduler=RequestScheduler.for_model(
+            provider,
+            model,
+            requests_per_minute=cfg.llm_rate_limit_rpm,
+            max_retries=cfg.llm_max_retries,
+            backoff_max=cfg.llm_backoff_max,
+            breaker_threshold=cfg.llm_circuit_breaker_threshold,
+            breaker_cooldown=cfg.llm_circuit_breaker_cooldown,
+        ),
+    )
+    if cfg.llm_response_cache_mode == "bypass":
+        return client
+    cache_dir: Path = (
+        Path(cfg.llm_response_cache_dir)
+        if cfg.llm_response_cache_dir
+        else Path.cwd() / "SelfhealingAgentsLlmCache"
+    )
+    return CachingModel(client, cache_dir=cache_dir, mode=cfg.llm_response_cache_mode)
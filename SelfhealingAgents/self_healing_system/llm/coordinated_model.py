@@ -0,0 +1,58 @@
+import asyncio
+import logging
+from typing import Callable
+
+from pydantic_ai.messages import ModelMessage, ModelResponse
+from pydantic_ai.models import Model, ModelRequestParameters
+from pydantic_ai.models.wrapper import WrapperModel
+from pydantic_ai.settings import ModelSettings
+
+from SelfhealingAgents.self_healing_system.healing_coordinator import HealingCoordinator
+
+
+class CoordinatedModel(WrapperModel):
+    """Model wrapper that keeps the requests of all workers within the global request budget.
+
+    Before every request, a slot is reserved in the request budget of the shared healing coordinator.
+    If the budget of the current minute is used up by the workers, the request waits for the next free slot.
+    The coordinator is looked up per request, because the pooled model outlives the coordinator closed at
+    the end of a run.
+
+    Attributes:
+        wrapped (Model): The model whose requests are limited.
+        _coordinator (Callable[[], HealingCoordinator]): Returns the open coordinator that holds the global
+            request budget.
+    """
+    def __init__(self, wrapped: Model, *, coordinator: Callable[[], HealingCoordinator]) -> None:
+        """Initializes the CoordinatedModel.
+
+        Args:
+            wrapped (Model): The model whose requests are limited.
+            coordinator (Callable[[], HealingCoordinator]): Returns the open coordinator that holds the global
+                request budget, e.g. `HealingCoordinator.shared` bound to the coordination file.
+        """
+        super().__init__(wrapped)
+        self._coordinator: Callable[[], HealingCoordinator] = coordinator
+
+    async def request(
+        self,
+        messages: list[ModelMessage],
+        model_settings: ModelSettings | None,
+        model_request_parameters: ModelRequestParameters,
+    ) -> ModelResponse:
+        """Waits for a slot in the global request budget and sends the request.
+
+        Args:
+            messages (list[ModelMessage]): The messages of the request.
+            model_settings (ModelSettings | None): The model settings of the request.
+            model_request_parameters (ModelRequestParameters): Tools and output settings of the request.
+
+        Returns:
+            ModelResponse: The model response.
+        """
+        while (wait := self._coordinator().reserve_request()) > 0:
+            logging.getLogger("SelfhealingReports").info(
+                f"Global LLM request budget used up, waiting {wait:.1f}s"
+            )
+            await asyncio.sleep(wait)
+        return await self.wrapped.request(messages, model_settings, model_request_parameters)
@@ -0,0 +1,50 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+import httpx
+
+
+_HTTP_CLIENT: ContextVar[Optional[httpx.AsyncClient]] = ContextVar("http_client", default=None)
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """Creates a keep-alive HTTP client for the language model clients.
+
+    Returns:
+        A new httpx.AsyncClient instance.
+    """
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(timeout=600, connect=5),
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=60),
+    )
+
+
+def get_shared_http_client() -> httpx.AsyncClient:
+    """Returns the keep-alive HTTP client the language model clients are currently built with.
+
+    An httpx client is bound to the event loop of its first request, so it is only shared inside
+    `use_http_client`, which each event loop runner enters with its own client. Outside of it, a
+    new client is returned.
+
+    Returns:
+        The httpx.AsyncClient instance to build the model client with.
+    """
+    client: Optional[httpx.AsyncClient] = _HTTP_CLIENT.get()
+    if client is None or client.is_closed:
+        return create_http_client()
+    return client
+
+
+@contextmanager
+def use_http_client(client: httpx.AsyncClient) -> Iterator[None]:
+    """Shares an HTTP client with all language model clients built inside the context.
+
+    Args:
+        client: The HTTP client to share.
+    """
+    token = _HTTP_CLIENT.set(client)
+    try:
+        yield
+    finally:
+        _HTTP_CLIENT.reset(token)
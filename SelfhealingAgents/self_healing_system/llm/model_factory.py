@@ -1,4 +1,4 @@
-from typing import Dict, Callable
+from typing import Callable, ClassVar, Dict, Optional
 from importlib.metadata import entry_points, EntryPoints
 
 from pydantic_ai.models.openai import OpenAIModel
@@ -15,18 +15,25 @@ class ModelFactory:
     Attributes:
         _builders (Dict[str, Callable[[str, Cfg], OpenAIModel]]):
             Mapping of provider names to their builder callables, discovered from entry points.
+        _discovered_builders (ClassVar[Optional[Dict[str, Callable[[str, Cfg], OpenAIModel]]]]):
+            Builders discovered by the first instance, shared by all later instances.
     """
+    _discovered_builders: ClassVar[Optional[Dict[str, Callable[[str, Cfg], OpenAIModel]]]] = None
+
     def __init__(self) -> None:
         """Initializes the ModelFactory and loads available model provider entry points.
 
         Discovers all entry points registered under the 'SelfhealingAgents.llm_model_providers'
-        group (set in pyproject.toml) and stores their builder callables for later use.
+        group (set in pyproject.toml) and stores their builder callables for later use. The
+        discovery runs once per process; later instances reuse its result.
         """
-        eps: EntryPoints = entry_points(group="SelfhealingAgents.llm_model_providers")
-        self._builders: Dict[str, Callable[[str, Cfg], OpenAIModel]] = {
-            ep.name: ep.load()
-            for ep in eps
-        }
+        if ModelFactory._discovered_builders is None:
+            eps: EntryPoints = entry_points(group="SelfhealingAgents.llm_model_providers")
+            ModelFactory._discovered_builders = {
+                ep.name: ep.load()
+                for ep in eps
+            }
+        self._builders: Dict[str, Callable[[str, Cfg], OpenAIModel]] = ModelFactory._discovered_builders
 
     def create_model(self, provider: str, model_name: str, cfg: Cfg) -> OpenAIModel:
         """Creates a language model instance for the specified provider and configuration.
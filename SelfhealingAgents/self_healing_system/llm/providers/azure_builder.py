@@ -3,6 +3,7 @@ from pydantic_ai.models.openai import OpenAIModel
 from pydantic_ai.providers.azure import AzureProvider
 
 from SelfhealingAgents.utils.cfg import Cfg
+from SelfhealingAgents.self_healing_system.llm.http_client import get_shared_http_client
 
 
 def azure_builder(model_name: str, cfg: Cfg) -> OpenAIModel:
@@ -25,6 +26,8 @@ def azure_builder(model_name: str, cfg: Cfg) -> OpenAIModel:
                 api_key=cfg.azure_api_key,
                 api_version=cfg.azure_api_version,
                 azure_endpoint=cfg.azure_endpoint,
+                http_client=get_shared_http_client(),
+                max_retries=0,
             )
         ),
     )
\ No newline at end of file
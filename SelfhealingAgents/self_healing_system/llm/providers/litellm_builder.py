@@ -1,7 +1,9 @@
+from openai import AsyncOpenAI
 from pydantic_ai.models.openai import OpenAIModel
 from pydantic_ai.providers.openai import OpenAIProvider
 
 from SelfhealingAgents.utils.cfg import Cfg
+from SelfhealingAgents.self_healing_system.llm.http_client import get_shared_http_client
 
 
 def litellm_builder(model_name: str, cfg: Cfg) -> OpenAIModel:
@@ -21,7 +23,11 @@ def litellm_builder(model_name: str, cfg: Cfg) -> OpenAIModel:
     return OpenAIModel(
         model_name=model_name,
         provider=OpenAIProvider(
-            api_key=cfg.litellm_api_key,
-            base_url=endpoint,
+            openai_client=AsyncOpenAI(
+                api_key=cfg.litellm_api_key,
+                base_url=endpoint,
+                http_client=get_shared_http_client(),
+                max_retries=0,
+            )
         ),
     )
\ No newline at end of file
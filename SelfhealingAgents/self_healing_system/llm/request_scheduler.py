@@ -0,0 +1,341 @@
+import asyncio
+import email.utils
+import logging
+import random
+import time
+from typing import Awaitable, Callable, ClassVar, Dict, Final, Optional, Tuple, TypeVar
+
+import httpx
+from pydantic_ai.exceptions import ModelHTTPError
+from pydantic_ai.messages import ModelMessage, ModelResponse
+from pydantic_ai.models import Model, ModelRequestParameters
+from pydantic_ai.models.wrapper import WrapperModel
+from pydantic_ai.settings import ModelSettings
+
+
+T = TypeVar("T")
+
+_RETRYABLE_STATUS_CODES: Final[frozenset[int]] = frozenset({408, 409, 429, 500, 502, 503, 504})
+_BACKOFF_BASE: Final[float] = 1.0
+
+
+class ProviderUnavailableError(RuntimeError):
+    """Raised instead of a request while the circuit breaker of a provider and model is open."""
+
+
+class TokenBucket:
+    """Token bucket that spaces the requests to a provider and model.
+
+    Requests reserve a token each. When the bucket is empty, the reservation is queued behind the
+    earlier ones and the caller is told how long to wait for its token.
+
+    Attributes:
+        _rate (float): Tokens added per second.
+        _capacity (float): Maximum number of tokens, i.e. the size of a burst.
+        _tokens (float): Available tokens, negative if reservations are queued.
+        _updated_at (float): Monotonic time of the last refill.
+    """
+    def __init__(self, requests_per_minute: float, capacity: Optional[float] = None) -> None:
+        """Initializes a full TokenBucket.
+
+        Args:
+            requests_per_minute (float): Sustained request rate.
+            capacity (Optional[float]): Burst size, the requests of one second by default, at least 1.
+        """
+        self._rate: float = requests_per_minute / 60
+        self._capacity: float = capacity if capacity is not None else max(self._rate, 1.0)
+        self._tokens: float = self._capacity
+        self._updated_at: float = time.monotonic()
+
+    def reserve(self) -> float:
+        """Reserves a token.
+
+        Returns:
+            float: Seconds to wait until the reserved token is available, 0 if it is available now.
+        """
+        now: float = time.monotonic()
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated_at) * self._rate)
+        self._updated_at = now
+        self._tokens -= 1
+        return 0.0 if self._tokens >= 0 else -self._tokens / self._rate
+
+
+class CircuitBreaker:
+    """Circuit breaker that stops requests to a provider and model after consecutive failures.
+
+    After `threshold` consecutive failures, the circuit opens for `cooldown` seconds and requests fail
+    immediately. After the cooldown, the next request is let through; if it fails as well, the circuit
+    opens again right away, and a success closes it.
+
+    Attributes:
+        _threshold (int): Consecutive failures that open the circuit, 0 to never open it.
+        _cooldown (float): Seconds the circuit stays open.
+        _failures (int): Consecutive failures so far.
+        _opened_until (float): Monotonic time until which the circuit is open.
+    """
+    def __init__(self, threshold: int, cooldown: float) -> None:
+        """Initializes a closed CircuitBreaker.
+
+        Args:
+            threshold (int): Consecutive failures that open the circuit, 0 to never open it.
+            cooldown (float): Seconds the circuit stays open.
+        """
+        self._threshold: int = threshold
+        self._cooldown: float = cooldown
+        self._failures: int = 0
+        self._opened_until: float = 0.0
+
+    @property
+    def is_open(self) -> bool:
+        """Whether requests currently fail without being sent."""
+        return time.monotonic() < self._opened_until
+
+    def record_success(self) -> None:
+        """Closes the circuit after a successful request."""
+        self._failures = 0
+        self._opened_until = 0.0
+
+    def record_failure(self) -> bool:
+        """Counts a failed request and opens the circuit when the threshold is reached.
+
+        Returns:
+            bool: True if the circuit has been opened by this failure.
+        """
+        self._failures += 1
+        if self._threshold and self._failures >= self._threshold:
+            self._opened_until = time.monotonic() + self._cooldown
+            return True
+        return False
+
+
+class RequestScheduler:
+    """Schedules the requests to one provider and model of all agents of the run.
+
+    Requests are spaced by a token bucket, retried on rate limits, server errors and connection errors
+    with jittered exponential backoff or after the delay the provider asked for with Retry-After, and
+    cut off by a circuit breaker while the provider keeps failing. A Retry-After longer than the maximum
+    backoff fails the request instead of waiting, so that a throttled provider does not stall the suite.
+
+    Attributes:
+        _schedulers (ClassVar[Dict[Tuple[str, str], RequestScheduler]]): Schedulers by provider and model.
+        _bucket (Optional[TokenBucket]): Spaces the requests, or None for no rate limit.
+        _breaker (CircuitBreaker): Cuts off requests while the provider keeps failing.
+        _max_retries (int): Retries of a failed request.
+        _backoff_max (float): Maximum seconds to wait before a retry.
+        _name (str): Provider and model, for log messages.
+    """
+    _schedulers: ClassVar[Dict[Tuple[str, str], "RequestScheduler"]] = {}
+
+    def __init__(
+        self,
+        *,
+        requests_per_minute: float = 0,
+        max_retries: int = 2,
+        backoff_max: float = 30.0,
+        breaker_threshold: int = 5,
+        breaker_cooldown: float = 60.0,
+        name: str = "",
+    ) -> None:
+        """Initializes the RequestScheduler.
+
+        Args:
+            requests_per_minute (float): Request rate of the token bucket, 0 for no rate limit.
+            max_retries (int): Retries of a failed request.
+            backoff_max (float): Maximum seconds to wait before a retry.
+            breaker_threshold (int): Consecutive failures that open the circuit, 0 to never open it.
+            breaker_cooldown (float): Seconds the circuit stays open.
+            name (str): Provider and model, for log messages.
+        """
+        self._bucket: Optional[TokenBucket] = (
+            TokenBucket(requests_per_minute) if requests_per_minute > 0 else None
+        )
+        self._breaker: CircuitBreaker = CircuitBreaker(breaker_threshold, breaker_cooldown)
+        self._max_retries: int = max_retries
+        self._backoff_max: float = backoff_max
+        self._name: str = name
+
+    @classmethod
+    def for_model(cls, provider: str, model: str, **kwargs) -> "RequestScheduler":
+        """Returns the scheduler of a provider and model, creating it on first use.
+
+        Args:
+            provider (str): The name of the language model provider.
+            model (str): The name of the model.
+            **kwargs: Settings of a new scheduler, see `__init__`.
+
+        Returns:
+            RequestScheduler: The scheduler shared by all clients of the provider and model.
+        """
+        key: Tuple[str, str] = (provider, model)
+        if key not in cls._schedulers:
+            cls._schedulers[key] = cls(name=f"{provider}:{model}", **kwargs)
+        return cls._schedulers[key]
+
+    @classmethod
+    def reset(cls) -> None:
+        """Drops the schedulers of all providers and models, including their rate limits and open circuits."""
+        cls._schedulers.clear()
+
+    @classmethod
+    def is_available(cls, provider: str, model: str) -> bool:
+        """Checks whether requests to a provider and model are currently let through.
+
+        Args:
+            provider (str): The name of the language model provider.
+            model (str): The name of the model.
+
+        Returns:
+            bool: False if the circuit breaker of the provider and model is open, True otherwise.
+        """
+        scheduler: Optional[RequestScheduler] = cls._schedulers.get((provider, model))
+        return scheduler is None or not scheduler._breaker.is_open
+
+    async def run(self, send: Callable[[], Awaitable[T]]) -> T:
+        """Sends a request when the rate limit allows it and retries it on transient errors.
+
+        Args:
+            send (Callable[[], Awaitable[T]]): Sends the request once.
+
+        Returns:
+            T: The result of the request.
+
+        Raises:
+            ProviderUnavailableError: If the circuit breaker is open.
+            Exception: The error of the last attempt, if the request did not succeed.
+        """
+        logger: logging.Logger = logging.getLogger("SelfhealingReports")
+        attempt: int = 0
+        while True:
+            if self._breaker.is_open:
+                raise ProviderUnavailableError(
+                    f"LLM provider {self._name} is unavailable after repeated failures"
+                )
+            if self._bucket is not None and (wait := self._bucket.reserve()) > 0:
+                await asyncio.sleep(wait)
+            try:
+                result: T = await send()
+            except Exception as e:
+                if not self._is_retryable(e):
+                    raise
+                if self._breaker.record_failure():
+                    logger.info(f"LLM provider {self._name} keeps failing, pausing requests: {e}")
+                    raise
+                delay: float = self._retry_delay(e, attempt)
+                if attempt >= self._max_retries or delay > self._backoff_max:
+                    raise
+                attempt += 1
+                logger.info(f"LLM request to {self._name} failed, retry {attempt} in {delay:.1f}s: {e}")
+                await asyncio.sleep(delay)
+                continue
+            self._breaker.record_success()
+            return result
+
+    def _retry_delay(self, error: Exception, attempt: int) -> float:
+        """Returns the seconds to wait before retrying a failed request.
+
+        Args:
+            error (Exception): The error of the failed attempt.
+            attempt (int): Number of retries so far.
+
+        Returns:
+            float: The Retry-After delay of the provider, or a jittered exponential backoff.
+        """
+        retry_after: Optional[float] = self._retry_after(error)
+        if retry_after is not None:
+            return retry_after
+        return random.uniform(0, min(self._backoff_max, _BACKOFF_BASE * 2 ** attempt))
+
+    @staticmethod
+    def _is_retryable(error: Exception) -> bool:
+        """Checks whether an error is a rate limit, a server error or a connection error.
+
+        Connection errors and timeouts reach the scheduler wrapped in a ModelAPIError, so the causes of
+        the error are searched for the httpx transport error.
+
+        Args:
+            error (Exception): The error of a request.
+
+        Returns:
+            bool: True if the request may succeed when it is retried.
+        """
+        if isinstance(error, ModelHTTPError):
+            return error.status_code in _RETRYABLE_STATUS_CODES
+        cause: Optional[BaseException] = error
+        while cause is not None:
+            if isinstance(cause, httpx.TransportError):
+                return True
+            cause = cause.__cause__
+        return False
+
+    @staticmethod
+    def _retry_after(error: Exception) -> Optional[float]:
+        """Reads the Retry-After headers of the HTTP response that caused an error.
+
+        Args:
+            error (Exception): The error of a request. The HTTP response is looked up on its causes.
+
+        Returns:
+            Optional[float]: The delay in seconds the provider asked for, or None if it did not.
+        """
+        cause: Optional[BaseException] = error
+        while cause is not None:
+            response = getattr(cause, "response", None)
+            headers = getattr(response, "headers", None)
+            if headers is not None:
+                try:
+                    if headers.get("retry-after-ms") is not None:
+                        return float(headers["retry-after-ms"]) / 1000
+                    if headers.get("retry-after") is not None:
+                        value: str = headers["retry-after"]
+                        try:
+                            return max(float(value), 0.0)
+                        except ValueError:
+                            return max(email.utils.parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+                except (TypeError, ValueError):
+                    return None
+            cause = cause.__cause__
+        return None
+
+
+class ScheduledModel(WrapperModel):
+    """Model wrapper that sends its requests through the request scheduler of its provider and model.
+
+    Attributes:
+        wrapped (Model): The model whose requests are scheduled.
+        _scheduler (RequestScheduler): The scheduler of the provider and model.
+    """
+    def __init__(self, wrapped: Model, *, scheduler: RequestScheduler) -> None:
+        """Initializes the ScheduledModel.
+
+        The provider builders disable the retries of the OpenAI client, because they would stack with the
+        retries of the scheduler and hide failures from its circuit breaker.
+
+        Args:
+            wrapped (Model): The model whose requests are scheduled.
+            scheduler (RequestScheduler): The scheduler of the provider and model.
+        """
+        super().__init__(wrapped)
+        self._scheduler: RequestScheduler = scheduler
+
+    async def request(
+        self,
+        messages: list[ModelMessage],
+        model_settings: ModelSettings | None,
+        model_request_parameters: ModelRequestParameters,
+    ) -> ModelResponse:
+        """Sends the request through the scheduler.
+
+        Args:
+            messages (list[ModelMessage]): The messages of the request.
+            model_settings (ModelSettings | None): The model settings of the request.
+            model_request_parameters (ModelRequestParameters): Tools and output settings of the request.
+
+        Returns:
+            ModelResponse: The model response.
+
+        Raises:
+            ProviderUnavailableError: If the circuit breaker of the provider and model is open.
+        """
+        return await self._scheduler.run(
+            lambda: self.wrapped.request(messages, model_settings, model_request_parameters)
+        )
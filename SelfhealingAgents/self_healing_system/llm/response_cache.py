@@ -0,0 +1,141 @@
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Any, Final
+
+from pydantic import TypeAdapter
+from pydantic_ai.messages import ModelMessage, ModelMessagesTypeAdapter, ModelResponse
+from pydantic_ai.models import Model, ModelRequestParameters
+from pydantic_ai.models.wrapper import WrapperModel
+from pydantic_ai.settings import ModelSettings
+
+
+RESPONSE_CACHE_MODES: Final[frozenset[str]] = frozenset({"bypass", "record", "replay"})
+# Message fields that differ between otherwise identical requests
+_VOLATILE_FIELDS: Final[frozenset[str]] = frozenset(
+    {
+        "timestamp", "run_id", "conversation_id", "tool_call_id", "id", "usage",
+        "provider_response_id", "provider_details",
+    }
+)
+_REQUEST_PARAMETERS_ADAPTER: Final[TypeAdapter] = TypeAdapter(ModelRequestParameters)
+
+
+class CachingModel(WrapperModel):
+    """Model wrapper that stores model responses in a content-addressed cache on disk.
+
+    Every request is keyed by a hash of the model name, the model settings, the request parameters
+    and the messages, without fields such as timestamps that differ between identical requests.
+    In 'record' mode, cached responses are returned and missing ones are requested from the wrapped
+    model and stored. In 'replay' mode, only cached responses are returned and a missing response is
+    an error, so that runs are deterministic and need no network access.
+
+    Attributes:
+        wrapped (Model): The model whose responses are cached.
+        _cache_dir (Path): Directory of the cached responses.
+        _mode (str): 'record' or 'replay'.
+    """
+    def __init__(self, wrapped: Model, *, cache_dir: str | Path, mode: str = "record") -> None:
+        """Initializes the CachingModel.
+
+        Args:
+            wrapped (Model): The model whose responses are cached.
+            cache_dir (str | Path): Directory of the cached responses.
+            mode (str): 'record' or 'replay'.
+
+        Raises:
+            ValueError: If the mode is unknown.
+        """
+        if mode not in RESPONSE_CACHE_MODES - {"bypass"}:
+            raise ValueError(f"Unknown response cache mode: {mode}")
+        super().__init__(wrapped)
+        self._cache_dir: Path = Path(cache_dir)
+        self._mode: str = mode
+
+    async def request(
+        self,
+        messages: list[ModelMessage],
+        model_settings: ModelSettings | None,
+        model_request_parameters: ModelRequestParameters,
+    ) -> ModelResponse:
+        """Returns the cached response of a request, or requests and stores it in 'record' mode.
+
+        Args:
+            messages (list[ModelMessage]): The messages of the request.
+            model_settings (ModelSettings | None): The model settings of the request.
+            model_request_parameters (ModelRequestParameters): Tools and output settings of the request.
+
+        Returns:
+            ModelResponse: The model response.
+
+        Raises:
+            LookupError: If no response is cached for the request in 'replay' mode.
+        """
+        key: str = self._request_key(messages, model_settings, model_request_parameters)
+        path: Path = self._cache_dir / key[:2] / f"{key}.json"
+        logger: logging.Logger = logging.getLogger("SelfhealingReports")
+        if path.is_file():
+            logger.info(f"Replaying cached model response {key}")
+            return ModelMessagesTypeAdapter.validate_json(path.read_bytes())[0]
+        if self._mode == "replay":
+            raise LookupError(f"No cached model response for request {key} in replay mode")
+
+        response: ModelResponse = await self.wrapped.request(
+            messages, model_settings, model_request_parameters
+        )
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary: Path = path.with_suffix(".tmp")
+        temporary.write_bytes(ModelMessagesTypeAdapter.dump_json([response]))
+        temporary.replace(path)
+        logger.info(f"Recorded model response {key}")
+        return response
+
+    def _request_key(
+        self,
+        messages: list[ModelMessage],
+        model_settings: ModelSettings | None,
+        model_request_parameters: ModelRequestParameters,
+    ) -> str:
+        """Computes the content hash of a request.
+
+        Args:
+            messages (list[ModelMessage]): The messages of the request.
+            model_settings (ModelSettings | None): The model settings of the request.
+            model_request_parameters (ModelRequestParameters): Tools and output settings of the request.
+
+        Returns:
+            str: The hex digest of the request.
+        """
+        content: dict = {
+            "model": f"{self.system}:{self.model_name}",
+            "settings": model_settings or {},
+            "parameters": _REQUEST_PARAMETERS_ADAPTER.dump_python(
+                model_request_parameters, mode="json"
+            ),
+            "messages": ModelMessagesTypeAdapter.dump_python(messages, mode="json"),
+        }
+        canonical: str = json.dumps(
+            self._without_volatile_fields(content), sort_keys=True, default=str
+        )
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _without_volatile_fields(value: Any) -> Any:
+        """Removes the fields that differ between identical requests from dumped messages.
+
+        Args:
+            value (Any): The dumped request content.
+
+        Returns:
+            Any: The content without volatile fields.
+        """
+        if isinstance(value, dict):
+            return {
+                key: CachingModel._without_volatile_fields(item)
+                for key, item in value.items()
+                if key not in _VOLATILE_FIELDS
+            }
+        if isinstance(value, list):
+            return [CachingModel._without_volatile_fields(item) for item in value]
+        return value
@@ -1,11 +1,12 @@
 import shutil
-from typing import List
+from typing import List, Optional
 from pathlib import Path
 
 from SelfhealingAgents.utils.logging import log
 from SelfhealingAgents.self_healing_system.reports.report_types.base_report import BaseReport
 from SelfhealingAgents.self_healing_system.schemas.internal_state.report_data import ReportData
 from SelfhealingAgents.self_healing_system.schemas.internal_state.report_context import ReportContext
+from SelfhealingAgents.self_healing_system.schemas.internal_state.healing_memo_stats import HealingMemoStats
 from SelfhealingAgents.self_healing_system.reports.report_types.action_log_report import ActionLogReport
 from SelfhealingAgents.self_healing_system.reports.report_types.healed_files_report import HealedFilesReport
 from SelfhealingAgents.self_healing_system.reports.report_types.diff_files_report import DiffFilesReport
@@ -50,7 +51,9 @@ class ReportGenerator:
         ]
 
     @log
-    def generate_reports(self, report_info: List[ReportData]) -> None:
+    def generate_reports(
+        self, report_info: List[ReportData], *, memo_stats: Optional[HealingMemoStats] = None
+    ) -> None:
         """Generates all report types for the provided healing event data.
 
         This method processes the given list of healing events and generates
@@ -58,7 +61,10 @@ class ReportGenerator:
 
         Args:
             report_info: A list of ReportData objects representing healing events.
+            memo_stats: Statistics of the in-run healing memo to include in the summary.
         """
         ctx: ReportContext = ReportContext(report_info=report_info)
+        if memo_stats is not None:
+            ctx.memo_stats = memo_stats
         for rt in self._report_types:
             ctx: ReportContext = rt.generate_report(ctx)
\ No newline at end of file
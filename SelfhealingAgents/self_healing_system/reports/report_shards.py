@@ -0,0 +1,86 @@
+import json
+import os
+import socket
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+
+from SelfhealingAgents.self_healing_system.reports.report_generator import ReportGenerator
+from SelfhealingAgents.self_healing_system.reports.report_info_persistence import (
+    deduplicate_report_info,
+    sort_report_info,
+)
+from SelfhealingAgents.self_healing_system.schemas.internal_state.healing_memo_stats import HealingMemoStats
+from SelfhealingAgents.self_healing_system.schemas.internal_state.report_data import ReportData
+
+SHARD_PATTERN = "report_info_*.jsonl"
+
+
+def report_shard_path(shard_dir: Path | str) -> Path:
+    """Return the shard file of this worker process in the shard directory."""
+    return Path(shard_dir) / f"report_info_{socket.gethostname()}_{os.getpid()}.jsonl"
+
+
+def append_report_shard(
+    path: Path | str,
+    report_info: Iterable[ReportData],
+    *,
+    memo_stats: Optional[HealingMemoStats] = None,
+) -> None:
+    """Append healing events, and optionally the memo statistics of the worker, to its shard file.
+    Every entry is written as one JSON line, so that each worker only ever appends to its own file.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    lines = [json.dumps({"report": item.model_dump()}) for item in report_info]
+    if memo_stats is not None:
+        lines.append(json.dumps({"memo_stats": memo_stats.model_dump()}))
+    if not lines:
+        return
+    with path.open("a", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+
+
+def load_report_shards(shard_dir: Path | str) -> Tuple[List[ReportData], HealingMemoStats]:
+    """Load the healing events and the summed memo statistics of all shard files, oldest file first.
+    Lines that cannot be parsed, e.g. of a worker that was killed while writing, are skipped.
+    """
+    report_info: List[ReportData] = []
+    memo_stats = HealingMemoStats()
+    shards = sorted(Path(shard_dir).glob(SHARD_PATTERN), key=lambda p: (p.stat().st_mtime, p.name))
+    for shard in shards:
+        for line in shard.read_text(encoding="utf-8").splitlines():
+            try:
+                entry = json.loads(line)
+                if "report" in entry:
+                    report_info.append(ReportData.model_validate(entry["report"]))
+                elif "memo_stats" in entry:
+                    stats = HealingMemoStats.model_validate(entry["memo_stats"])
+                    memo_stats.hits += stats.hits
+                    memo_stats.misses += stats.misses
+            except Exception:
+                continue
+    return report_info, memo_stats
+
+
+def merge_report_shards(
+    shard_dir: Path | str,
+    report_directory: Optional[str] = None,
+    *,
+    remove_shards: bool = True,
+) -> int:
+    """Merge the shard files of all workers and generate the reports once.
+    The healing events are deduplicated and sorted by file and lineno like on reruns, then the
+    action log, healed files, diffs and summary are generated into the report directory.
+
+    Returns:
+        The number of healing events in the merged reports.
+    """
+    report_info, memo_stats = load_report_shards(shard_dir)
+    ordered = sort_report_info(deduplicate_report_info(report_info))
+    report_generator = ReportGenerator(base_dir=report_directory)
+    if ordered:
+        report_generator.generate_reports(ordered, memo_stats=memo_stats)
+    if remove_shards:
+        for shard in Path(shard_dir).glob(SHARD_PATTERN):
+            shard.unlink(missing_ok=True)
+    return len(ordered)
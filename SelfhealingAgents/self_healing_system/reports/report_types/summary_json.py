@@ -4,6 +4,7 @@ from pathlib import Path
 from SelfhealingAgents.utils.logging import log
 from SelfhealingAgents.self_healing_system.reports.report_types.base_report import BaseReport
 from SelfhealingAgents.self_healing_system.schemas.internal_state.report_context import ReportContext
+from SelfhealingAgents.self_healing_system.schemas.internal_state.healing_memo_stats import HealingMemoStats
 
 
 class SummaryJson(BaseReport):
@@ -25,7 +26,8 @@ class SummaryJson(BaseReport):
         """Generates and saves a summary of healing events as a JSON file.
 
         Aggregates the total number of healing events, the number of affected tests and files,
-        and lists their names. The summary is written to 'summary.json' in the output directory.
+        and lists their names. If available, the hit and miss statistics of the in-run healing
+        memo are added. The summary is written to 'summary.json' in the output directory.
 
         Args:
             report_context: The context object containing healing event data.
@@ -43,6 +45,8 @@ class SummaryJson(BaseReport):
             "affected_tests": list({r.test_name for r in report_context.report_info}),
             "affected_files": list({r.file for r in report_context.report_info}),
         }
+        if isinstance(report_context.memo_stats, HealingMemoStats):
+            summary["healing_memo"] = report_context.memo_stats.model_dump()
 
         summary_path = self._out_dir / "summary.json"
         with summary_path.open("w", encoding="utf-8") as f:
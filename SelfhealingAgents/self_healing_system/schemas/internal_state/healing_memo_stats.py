@@ -0,0 +1,14 @@
+from pydantic import BaseModel, Field
+
+
+class HealingMemoStats(BaseModel):
+    """Schema for the statistics of the in-run healed-locator memo.
+
+    Attributes:
+        hits (int): Number of failures healed by a memoized locator.
+        misses (int): Number of failures without a memoized locator or whose memoized locator failed.
+    """
+    hits: int = Field(0, description="Number of failures healed by a memoized locator.")
+    misses: int = Field(
+        0, description="Number of failures without a memoized locator or whose memoized locator failed."
+    )
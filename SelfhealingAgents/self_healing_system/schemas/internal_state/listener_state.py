@@ -1,9 +1,10 @@
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
 from pydantic import BaseModel, Field
 
 from SelfhealingAgents.utils.cfg import Cfg
 from SelfhealingAgents.self_healing_system.schemas.internal_state.report_data import ReportData
+from SelfhealingAgents.self_healing_system.schemas.internal_state.healing_memo_stats import HealingMemoStats
 
 
 class ListenerState(BaseModel):
@@ -18,6 +19,9 @@ class ListenerState(BaseModel):
         should_generate_locators (bool): Indicates if locator suggestions should be generated.
         tried_locators (List[str]): List of locators that have been tried.
         healed (bool): Indicates if the current locator has been healed.
+        healing_memo (Dict[Tuple[str, str, str], str]): Locators that healed a failed locator in this run,
+            keyed by library, keyword and resolved failed locator.
+        memo_stats (HealingMemoStats): Hit and miss statistics of the healing memo.
     """
     cfg: Cfg = Field(..., description="Configuration pydantic class.")
     context: Dict[str, Any] = Field(default_factory=dict, description="Context dictionary.")
@@ -31,4 +35,11 @@ class ListenerState(BaseModel):
         True, description="True if current locators suggestions should be generated."
     )
     tried_locators: List[str] = Field(default_factory=list)
-    healed: bool = Field(False, description="True if current locator is healed.")
\ No newline at end of file
+    healed: bool = Field(False, description="True if current locator is healed.")
+    healing_memo: Dict[Tuple[str, str, str], str] = Field(
+        default_factory=dict,
+        description="Healed locators of this run keyed by library, keyword and resolved failed locator."
+    )
+    memo_stats: HealingMemoStats = Field(
+        default_factory=HealingMemoStats, description="Hit and miss statistics of the healing memo."
+    )
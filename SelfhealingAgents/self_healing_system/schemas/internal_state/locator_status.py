@@ -0,0 +1,43 @@
+from pydantic import BaseModel, Field
+
+
+class LocatorStatus(BaseModel):
+    """Schema for the result of validating a single locator against the current page.
+
+    Attributes:
+        locator (str): The validated locator.
+        count (int | None): Number of matching elements, or None if the library did not report it.
+        valid (bool): Whether the locator matches at least one element.
+        unique (bool): Whether the locator matches exactly one element.
+        clickable (bool): Whether the first matching element is clickable.
+        visible (bool): Whether the first matching element is rendered visibly, if the library reported it.
+        metadata (list[dict]): Metadata of the matching elements, if requested.
+        offline (bool): Whether the status was decided against the DOM snapshot instead of the live page.
+    """
+
+    locator: str = Field(..., description="The validated locator.")
+    count: int | None = Field(
+        default=None,
+        description="Number of matching elements, or None if the library did not report it.",
+    )
+    valid: bool = Field(
+        default=False, description="Whether the locator matches at least one element."
+    )
+    unique: bool = Field(
+        default=False, description="Whether the locator matches exactly one element."
+    )
+    clickable: bool = Field(
+        default=False, description="Whether the first matching element is clickable."
+    )
+    visible: bool = Field(
+        default=False,
+        description="Whether the first matching element is rendered visibly, if the library reported it.",
+    )
+    metadata: list[dict] = Field(
+        default_factory=list,
+        description="Metadata of the matching elements, if requested.",
+    )
+    offline: bool = Field(
+        default=False,
+        description="Whether the status was decided against the DOM snapshot instead of the live page.",
+    )
@@ -1,4 +1,8 @@
-from pydantic import BaseModel, Field
+from typing import Literal
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from SelfhealingAgents.self_healing_system.context_retrieving.dom_snapshot import DomSnapshot
 
 
 class PromptPayload(BaseModel):
@@ -13,7 +17,13 @@ class PromptPayload(BaseModel):
         failed_locator (str): Locator that failed in the Robot Framework keyword.
         tried_locator_memory (list): List of tried locator suggestions that still failed.
         locator_type (str): Locator type restriction for suggestions of model.
+        dom_token_budget (int): Approximate number of tokens of the DOM in the prompt, 0 for the whole DOM.
+        prompt_layout (Literal['failure_first', 'cache_friendly']): Order of the prompt content.
+        file_usage_ctx (str): Parent-Test or Parent-Keyword of failed locator.
+        dom_snapshot (DomSnapshot | None): Snapshot of the page shared across the healing attempt.
     """
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     robot_code_line: str = Field(
         ..., description="The raw Robot keyword call that failed"
     )
@@ -34,6 +44,18 @@ class PromptPayload(BaseModel):
     locator_type: str = Field(
         "css", description="Locator type restriction for suggestions of model."
     )
+    dom_token_budget: int = Field(
+        0, description="Approximate number of tokens of the DOM in the prompt, 0 for the whole DOM."
+    )
+    prompt_layout: Literal["failure_first", "cache_friendly"] = Field(
+        "failure_first", description="Order of the prompt content, 'failure_first' or 'cache_friendly'."
+    )
     file_usage_ctx: str = Field(
         ..., description="Parent-Test or Parent-Keyword of failed locator."
-    )
\ No newline at end of file
+    )
+    dom_snapshot: DomSnapshot | None = Field(
+        None,
+        description="Snapshot of the page shared across the healing attempt.",
+        exclude=True,
+        repr=False,
+    )
@@ -1,9 +1,10 @@
-from typing import List
+from typing import List, Optional
 from pathlib import Path
 
 from pydantic import BaseModel, Field
 
 from SelfhealingAgents.self_healing_system.schemas.internal_state.report_data import ReportData
+from SelfhealingAgents.self_healing_system.schemas.internal_state.healing_memo_stats import HealingMemoStats
 
 
 class ReportContext(BaseModel):
@@ -12,6 +13,8 @@ class ReportContext(BaseModel):
     Attributes:
         report_info (List[ReportData]): List containing data about healed locators and healing events.
         external_resource_paths (List[Path]): Paths to external resource files referenced in the report.
+        memo_stats (Optional[HealingMemoStats]): Statistics of the in-run healing memo, if available.
     """
     report_info: List[ReportData] = Field(..., description="Report info containing data about healed locators.")
-    external_resource_paths: List[Path] = Field(default_factory=list, description="Paths of external resource files.")
\ No newline at end of file
+    external_resource_paths: List[Path] = Field(default_factory=list, description="Paths of external resource files.")
+    memo_stats: Optional[HealingMemoStats] = Field(None, description="Statistics of the in-run healing memo.")
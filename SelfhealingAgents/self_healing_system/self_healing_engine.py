@@ -1,14 +1,29 @@
+import inspect
+import time
 from pathlib import Path
-from typing import Any, Final
+from typing import Any, Final, Optional
 
 from robot import result, running
 from robot.api import logger as rf_logger
 from robot.libraries.BuiltIn import BuiltIn
 from robot.model import TestCase
 
+from SelfhealingAgents.self_healing_system.agents.locator_agent.base_locator_agent import (
+    BaseLocatorAgent,
+)
+from SelfhealingAgents.self_healing_system.event_loop_runner import EventLoopRunner
+from SelfhealingAgents.self_healing_system.healing_cache import CachedHealing, HealingCache
+from SelfhealingAgents.self_healing_system.healing_coordinator import HealingCoordinator
 from SelfhealingAgents.self_healing_system.kickoff_multi_agent_system import (
     KickoffMultiAgentSystem,
 )
+from SelfhealingAgents.self_healing_system.context_retrieving.dom_snapshot import DomSnapshot
+from SelfhealingAgents.self_healing_system.context_retrieving.dom_utility_factory import (
+    DomUtilityFactory,
+)
+from SelfhealingAgents.self_healing_system.context_retrieving.library_dom_utils.base_dom_utils import (
+    BaseDomUtils,
+)
 from SelfhealingAgents.self_healing_system.schemas.api.locator_healing import (
     LocatorHealingResponse,
     NoHealingNeededResponse,
@@ -16,9 +31,13 @@ from SelfhealingAgents.self_healing_system.schemas.api.locator_healing import (
 from SelfhealingAgents.self_healing_system.schemas.internal_state.listener_state import (
     ListenerState,
 )
+from SelfhealingAgents.self_healing_system.schemas.internal_state.locator_status import (
+    LocatorStatus,
+)
 from SelfhealingAgents.self_healing_system.schemas.internal_state.report_data import (
     ReportData,
 )
+from SelfhealingAgents.self_healing_system.speculative_healer import SpeculativeHealer
 from SelfhealingAgents.utils.logfire_init import init_logfire
 from SelfhealingAgents.utils.logging import initialize_logger
 
@@ -29,6 +48,13 @@ initialize_logger()
 _ALLOWED_LIBRARIES: Final[frozenset] = frozenset(
     {"Browser", "SeleniumLibrary", "AppiumLibrary"}
 )
+_LOCATOR_ARGUMENT_NAMES: Final[frozenset] = frozenset({"selector", "locator"})
+_FAST_FAIL_PROBE_INTERVAL: Final[float] = 0.1
+# Keywords after which the page is likely to have changed
+_PAGE_CHANGING_KEYWORDS: Final[tuple[str, ...]] = (
+    "click", "tap", "submit", "go to", "go back", "go forward", "new page", "open browser", "reload",
+)
+_SPECULATIVE_LOOKAHEAD: Final[int] = 10
 
 
 class SelfHealingEngine:
@@ -40,15 +66,71 @@ class SelfHealingEngine:
 
     Attributes:
         _listener_state (ListenerState): The shared ListenerState object for maintaining state across the test run.
+        _event_loop_runner (Optional[EventLoopRunner]): The event loop runner the healing coroutines are run on.
+        _healing_cache (Optional[HealingCache]): The persistent healing cache, or None if it is disabled.
+        _coordinator (Optional[HealingCoordinator]): Coordinates healings with parallel workers, or None if
+            coordination is disabled.
+        _claim_key (Optional[str]): Key of the failed locator this worker claimed for the current healing.
+        _healing_key (Optional[tuple[str, str, str]]): Library, keyword and resolved failed locator of the
+            current healing.
+        _healing_data (Optional[running.Keyword]): Copy of the failed keyword of the current healing.
+        _memoized_locator (Optional[str]): Healed locator of the in-run memo tried for the current healing.
+        _dom_utility (Optional[BaseDomUtils]): DOM utility of the current healing, if already created.
+        _dom_snapshot (Optional[DomSnapshot]): Snapshot of the page at the failure of the current healing.
+        _cached_locators (list[str]): Healed locators of the cache tried for the current healing.
+        _fast_fail_data (Optional[running.Keyword]): Copy of the keyword healed before it ran, if any.
+        _locator_keywords (dict[tuple[str, str], bool]): Whether keywords take a locator as first argument.
+        _speculative_healer (Optional[SpeculativeHealer]): Precomputes proposals after page changes, or None if
+            speculative healing is disabled.
+        _speculative_targets (list[tuple[str, str]]): Resolved locators and keyword names of the keywords that
+            follow the last page-changing keyword, not yet handed to the speculative healer.
     """
 
-    def __init__(self, listener_state: ListenerState):
+    def __init__(
+        self, listener_state: ListenerState, *, event_loop_runner: Optional[EventLoopRunner] = None
+    ):
         """Initializes the SelfHealingEngine.
 
         Args:
             listener_state: The shared ListenerState object for maintaining state across the test run.
+            event_loop_runner: The event loop runner owned by the listener, if any.
         """
         self._listener_state: ListenerState = listener_state
+        self._event_loop_runner: Optional[EventLoopRunner] = event_loop_runner
+        cfg = listener_state.cfg
+        # Coordinated workers share their healings through the coordination file, unless a cache is configured
+        healing_cache_path: Optional[str] = cfg.healing_cache_path or cfg.healing_coordination_path
+        self._healing_cache: Optional[HealingCache] = (
+            HealingCache(
+                healing_cache_path,
+                ttl_days=cfg.healing_cache_ttl_days,
+                max_entries=cfg.healing_cache_max_entries,
+            )
+            if healing_cache_path
+            else None
+        )
+        self._coordinator: Optional[HealingCoordinator] = (
+            HealingCoordinator.shared(
+                cfg.healing_coordination_path,
+                requests_per_minute=cfg.healing_coordination_requests_per_minute,
+                claim_timeout=cfg.healing_claim_timeout,
+            )
+            if cfg.healing_coordination_path
+            else None
+        )
+        self._claim_key: Optional[str] = None
+        self._healing_key: Optional[tuple[str, str, str]] = None
+        self._healing_data: Optional[running.Keyword] = None
+        self._memoized_locator: Optional[str] = None
+        self._dom_utility: Optional[BaseDomUtils] = None
+        self._dom_snapshot: Optional[DomSnapshot] = None
+        self._cached_locators: list[str] = []
+        self._fast_fail_data: Optional[running.Keyword] = None
+        self._locator_keywords: dict[tuple[str, str], bool] = {}
+        self._speculative_healer: Optional[SpeculativeHealer] = (
+            SpeculativeHealer() if cfg.speculative_healing else None
+        )
+        self._speculative_targets: list[tuple[str, str]] = []
 
     def start_test(self, data: running.TestCase, result_: result.TestCase) -> None:
         """Handles the start of a test case.
@@ -64,6 +146,56 @@ class SelfHealingEngine:
         self._listener_state.context["current_test"] = data.name
         rf_logger.debug(f"SelfhealingAgents: Monitoring test '{data.name}'")
 
+    def start_keyword(self, data: running.Keyword, result_: result.Keyword) -> None:
+        """Probes the locator of a keyword before it runs, if the fast-fail probe is enabled.
+
+        Invoked by listener when a keyword starts. If the locator certainly matches no element, healing starts
+        right away and the keyword runs with the best verified suggestion instead of waiting for the library
+        timeout on the missing element. Only action keywords are probed: assertions, waits and reads may expect
+        a missing element. If the element appears while healing, the keyword keeps its locator.
+
+        Args:
+            data: The running keyword data.
+            result_: The result object for the keyword.
+        """
+        cfg = self._listener_state.cfg
+        if not (cfg.enable_self_healing and cfg.fast_fail_probe):
+            return
+        if result_.owner not in _ALLOWED_LIBRARIES or not data.args or self._healing_data is not None:
+            return
+        if not BaseLocatorAgent.is_action_keyword(data.name) or not self._has_locator_argument(
+            result_.owner, data.name
+        ):
+            return
+        try:
+            locator: str = str(BuiltIn().replace_variables(data.args[0]))
+        except Exception:
+            return
+        self._ensure_dom_utility(result_.owner)
+        if self._dom_utility is None or not self._is_locator_absent(locator):
+            self._dom_utility = None
+            return
+
+        rf_logger.info(
+            f"SelfhealingAgents: Locator '{locator}' matches no element, healing it before '{data.name}' runs."
+        )
+        original_message: str = result_.message
+        result_.message = f"Element with locator '{locator}' not found."
+        try:
+            self._initiate_healing(data, result_)
+        finally:
+            result_.message = original_message
+        if not self._listener_state.suggestions or (
+            self._dom_utility is not None and not self._dom_utility.is_locator_absent(locator)
+        ):
+            self._reset_state()
+            return
+        suggestion: str = self._listener_state.suggestions.pop(0)
+        self._listener_state.tried_locators.append(suggestion)
+        self._fast_fail_data = data.deepcopy()
+        data.args = [suggestion, *data.args[1:]]
+        result_.args = tuple(data.args)
+
     def end_keyword(self, data: running.Keyword, result_: result.Keyword) -> Any:
         """Handles the end of a keyword execution and triggers self-healing if needed.
 
@@ -82,10 +214,31 @@ class SelfHealingEngine:
             return None
         self._listener_state.healed = False
 
+        if (
+            self._speculative_healer is not None
+            and not result_.failed
+            and self._healing_data is None
+            and result_.owner in _ALLOWED_LIBRARIES
+        ):
+            self._speculate(data, result_)
+
+        if self._fast_fail_data is not None and not result_.failed:
+            self._record_report(
+                self._fast_fail_data, self._listener_state.tried_locators[-1], result_.status
+            )
+            self._remember_healing(self._listener_state.tried_locators[-1])
+            self._reset_state()
+            return None
+
         # ToDo: Implement a more robust way to start self-healing
         if result_.failed and result_.owner in _ALLOWED_LIBRARIES:
             rf_logger.debug(f"RobotAid: Detected failure in keyword '{data.name}'")
-            pre_healing_data: running.Keyword = data.deepcopy()
+            pre_healing_data: running.Keyword = self._fast_fail_data or data.deepcopy()
+            if self._fast_fail_data is not None:
+                # The locator healed before the keyword ran failed, ask for new suggestions
+                self._fast_fail_data = None
+                self._listener_state.should_generate_locators = not self._listener_state.suggestions
+            self._discard_failed_reuse(data)
             if self._listener_state.retry_count < self._listener_state.cfg.max_retries:
                 if self._listener_state.should_generate_locators:
                     self._initiate_healing(data, result_)
@@ -103,9 +256,19 @@ class SelfHealingEngine:
                         self._listener_state.tried_locators[-1],
                         result_.status,
                     )
+                    self._remember_healing(self._listener_state.tried_locators[-1])
             self._reset_state()
         return None
 
+    def close(self) -> None:
+        """Releases the background worker, the healing cache and the coordination file at the end of the run."""
+        if self._speculative_healer is not None:
+            self._speculative_healer.close()
+        if self._healing_cache is not None:
+            self._healing_cache.close()
+        if self._coordinator is not None:
+            self._coordinator.close()
+
     def end_test(self, data: running.TestCase, result_: result.TestCase) -> None:
         """Handles the end of a test case.
 
@@ -127,29 +290,389 @@ class SelfHealingEngine:
     def _initiate_healing(self, data: running.Keyword, result_: result.Keyword) -> None:
         """Starts the self-healing process using the agentic system.
 
-        Invokes the multi-agent system to generate locator suggestions and updates the listener state accordingly.
+        On the first attempt for a failed locator, the locator that healed it earlier in this run is retried
+        first. If workers coordinate their healings, this worker then claims the failed locator, waiting for
+        another worker that is already healing it. Then the healing cache is consulted, if enabled. Otherwise, or if those locators fail as well,
+        invokes the multi-agent system to generate locator suggestions and updates the listener state accordingly.
+        Generated suggestions are verified against the live page before any rerun, and the keyword is only rerun
+        with the best verified one. If none of them can be verified, new suggestions are requested while retries
+        are left.
+
+        Args:
+            data: The running keyword data.
+            result_: The result object for the failed keyword.
+        """
+        if self._healing_key is None:
+            self._healing_key = self._get_healing_key(data, result_)
+            self._healing_data = data.deepcopy()
+            if self._healing_key is not None:
+                if self._try_memoized_healing(data, result_):
+                    return
+                if self._coordinator is not None:
+                    self._claim_healing()
+                if self._healing_cache is not None and self._try_cached_healings(result_):
+                    return
+
+        self._ensure_dom_utility(result_.owner)
+        if self._speculative_healer is not None and self._dom_utility is not None:
+            try:
+                if self._dom_snapshot is None:
+                    self._dom_snapshot = self._dom_utility.capture_snapshot()
+                resolved: DomSnapshot = self._speculative_healer.resolve(self._dom_snapshot)
+                if resolved is self._dom_snapshot and self._speculative_targets:
+                    # First failure on the new page: prepare the upcoming locators on the snapshot of this healing
+                    self._speculative_healer.prepare(
+                        DomUtilityFactory.create_dom_utility(KickoffMultiAgentSystem.get_agent_type(result_.owner)),
+                        self._dom_snapshot,
+                        self._speculative_targets,
+                    )
+                    self._speculative_targets = []
+                self._dom_snapshot = resolved
+            except Exception as e:
+                rf_logger.debug(f"SelfhealingAgents: Speculative proposals not available: {e}")
+        while True:
+            locator_suggestions: LocatorHealingResponse | str | NoHealingNeededResponse = (
+                KickoffMultiAgentSystem.kickoff_healing(
+                    self._healing_data or data,
+                    result_,
+                    cfg=self._listener_state.cfg,
+                    tried_locator_memory=self._listener_state.tried_locators,
+                    dom_utility=self._dom_utility,
+                    dom_snapshot=self._dom_snapshot,
+                    event_loop_runner=self._event_loop_runner,
+                )
+            )
+
+            # Only proceed with healing, if response type is LocatorHealingResponse
+            if isinstance(locator_suggestions, LocatorHealingResponse):
+                self._listener_state.retry_count += 1
+                verified_suggestions: list[str] = self._preflight_suggestions(
+                    data.name, locator_suggestions.suggestions
+                )
+                self._listener_state.suggestions = verified_suggestions
+                self._listener_state.should_generate_locators = False
+                if (
+                    verified_suggestions
+                    or self._listener_state.retry_count >= self._listener_state.cfg.max_retries
+                ):
+                    return
+            elif isinstance(locator_suggestions, NoHealingNeededResponse):
+                self._listener_state.suggestions = None
+                self._listener_state.should_generate_locators = True
+                return
+            else:
+                return
+
+    def _speculate(self, data: running.Keyword, result_: result.Keyword) -> None:
+        """Remembers the upcoming locators after a page-changing keyword.
+
+        The page is not captured here, so that passing keywords do not wait for it. The proposals for the
+        remembered locators are computed in the background from the snapshot of the first healing on the new
+        page, so that further failures on the same page find them ready.
+
+        The upcoming keywords are the next keywords of the same library in the body that contains the passed
+        keyword. Their locators are resolved now, so locators using variables that are assigned later are
+        skipped.
+
+        Args:
+            data: The running keyword data of the passed keyword.
+            result_: The result object of the passed keyword.
+        """
+        if not any(keyword in data.name.lower() for keyword in _PAGE_CHANGING_KEYWORDS):
+            return
+        try:
+            body = list(data.parent.body)
+            upcoming = body[body.index(data) + 1 :]
+        except Exception:
+            return
+
+        targets: list[tuple[str, str]] = []
+        for step in upcoming:
+            if len(targets) >= _SPECULATIVE_LOOKAHEAD:
+                break
+            if getattr(step, "type", None) != "KEYWORD" or not step.args:
+                continue
+            if not self._has_locator_argument(result_.owner, step.name):
+                continue
+            try:
+                targets.append(
+                    (str(BuiltIn().replace_variables(step.args[0])), step.name.split(".")[-1].strip())
+                )
+            except Exception:
+                continue
+        self._speculative_targets = targets
+
+    def _has_locator_argument(self, owner: str, keyword_name: str) -> bool:
+        """Checks whether a library keyword takes a locator as its first argument.
+
+        Args:
+            owner: The library that owns the keyword.
+            keyword_name: The name of the keyword.
+
+        Returns:
+            True if the first argument of the keyword is a selector or locator, False otherwise.
+        """
+        key: tuple[str, str] = (owner, keyword_name)
+        if key not in self._locator_keywords:
+            try:
+                library = BuiltIn().get_library_instance(owner)
+                method = getattr(library, keyword_name.split(".")[-1].strip().lower().replace(" ", "_"))
+                parameters = list(inspect.signature(method).parameters)
+                self._locator_keywords[key] = bool(parameters) and parameters[0] in _LOCATOR_ARGUMENT_NAMES
+            except Exception:
+                self._locator_keywords[key] = False
+        return self._locator_keywords[key]
+
+    def _is_locator_absent(self, locator: str) -> bool:
+        """Probes the live page until the locator matches an element or the probe timeout elapses.
+
+        Args:
+            locator: The resolved locator to probe.
+
+        Returns:
+            True if the locator matched no element during the whole probe timeout, False otherwise.
+        """
+        deadline: float = time.monotonic() + self._listener_state.cfg.fast_fail_probe_timeout
+        while self._dom_utility.is_locator_absent(locator):
+            if time.monotonic() >= deadline:
+                return True
+            time.sleep(_FAST_FAIL_PROBE_INTERVAL)
+        return False
+
+    def _ensure_dom_utility(self, owner: str) -> None:
+        """Creates the DOM utility of the current healing, if not already done.
+
+        Args:
+            owner: The library that owns the failed keyword.
+        """
+        if self._dom_utility is not None:
+            return
+        try:
+            self._dom_utility = DomUtilityFactory.create_dom_utility(
+                KickoffMultiAgentSystem.get_agent_type(owner)
+            )
+        except Exception as e:
+            rf_logger.debug(f"SelfhealingAgents: DOM utility not available: {e}")
+
+    def _preflight_suggestions(self, keyword_name: str, suggestions: list[str]) -> list[str]:
+        """Verifies all locator suggestions against the live page before the keyword is rerun.
+
+        All suggestions are checked in a single validation round trip that does not wait for elements:
+        they must match an element, and a clickable one for keywords that click or select. Verified
+        suggestions are ranked by uniqueness and visibility, so that the best one is rerun first and a bad
+        suggestion never costs a keyword timeout. Rejected suggestions are added to the tried locators, so
+        that they are not proposed again.
+
+        Args:
+            keyword_name: The name of the failed keyword.
+            suggestions: The locator suggestions of the multi-agent system.
+
+        Returns:
+            The verified suggestions, best first, an empty list if none could be verified, or the unchanged
+            suggestions if they cannot be verified in this context.
+        """
+        if self._dom_utility is None or not suggestions:
+            return suggestions
+        try:
+            statuses: list[LocatorStatus] = self._dom_utility.validate_locators(suggestions)
+        except Exception as e:
+            rf_logger.debug(f"SelfhealingAgents: Suggestions could not be verified: {e}")
+            return suggestions
+        if len(statuses) != len(suggestions) or not all(
+            isinstance(status, LocatorStatus) for status in statuses
+        ):
+            return suggestions
+
+        needs_clickable: bool = BaseLocatorAgent.is_clickable_keyword(keyword_name)
+        verified: list[LocatorStatus] = sorted(
+            (
+                status
+                for status in statuses
+                if status.valid and (status.clickable or not needs_clickable)
+            ),
+            key=lambda status: (not status.unique, not status.visible),
+        )
+        rejected: list[str] = [
+            status.locator for status in statuses if status not in verified
+        ]
+        if rejected:
+            rf_logger.info(
+                f"SelfhealingAgents: Suggestions {rejected} do not match an actionable element on the page."
+            )
+            self._listener_state.tried_locators.extend(rejected)
+        return [status.locator for status in verified]
+
+    @staticmethod
+    def _get_healing_key(
+        data: running.Keyword, result_: result.Keyword
+    ) -> Optional[tuple[str, str, str]]:
+        """Builds the key under which healings of a failed locator are remembered.
+
+        Args:
+            data: The running keyword data.
+            result_: The result object for the failed keyword.
+
+        Returns:
+            Library, keyword and resolved failed locator, or None if the keyword has no locator argument.
+        """
+        try:
+            return result_.owner, data.name, str(BuiltIn().replace_variables(data.args[0]))
+        except Exception:
+            return None
+
+    def _try_memoized_healing(self, data: running.Keyword, result_: result.Keyword) -> bool:
+        """Uses the locator that healed the same failed locator earlier in this run as suggestion.
+
+        The memoized locator is verified against the live page like generated suggestions, and is forgotten if
+        it no longer matches an actionable element. Its rerun does not count against the retries of the
+        multi-agent system, which is asked if the rerun fails.
 
         Args:
+            data: The running keyword data.
             result_: The result object for the failed keyword.
+
+        Returns:
+            True if a memoized locator was set as suggestion, False otherwise.
         """
-        locator_suggestions: LocatorHealingResponse | str | NoHealingNeededResponse = (
-            KickoffMultiAgentSystem.kickoff_healing(
-                data,
-                result_,
-                cfg=self._listener_state.cfg,
-                tried_locator_memory=self._listener_state.tried_locators,
+        memoized_locator: str | None = self._listener_state.healing_memo.get(self._healing_key)
+        if memoized_locator is None:
+            self._listener_state.memo_stats.misses += 1
+            return False
+        self._ensure_dom_utility(result_.owner)
+        if not self._preflight_suggestions(data.name, [memoized_locator]):
+            self._listener_state.healing_memo.pop(self._healing_key, None)
+            self._listener_state.memo_stats.misses += 1
+            return False
+        rf_logger.info(
+            f"SelfhealingAgents: Retrying locator '{memoized_locator}' that healed "
+            f"'{self._healing_key[2]}' earlier in this run."
+        )
+        self._memoized_locator = memoized_locator
+        self._listener_state.suggestions = [memoized_locator]
+        self._listener_state.should_generate_locators = False
+        return True
+
+    def _claim_healing(self) -> None:
+        """Claims the current failed locator for this worker, after waiting for a worker that already heals it.
+
+        The healing of the other worker is stored in the shared healing cache when its rerun passed, so it is
+        found by the subsequent cache lookup. If the other worker does not finish within the claim wait, or the
+        coordination file is not available, healing proceeds without a claim.
+        """
+        claim_key: str = "\x1f".join(self._healing_key)
+        try:
+            if not self._coordinator.claim(claim_key):
+                rf_logger.info(
+                    f"SelfhealingAgents: Locator '{self._healing_key[2]}' is being healed by another worker, "
+                    f"waiting for its result."
+                )
+                self._coordinator.wait_for_release(
+                    claim_key, timeout=self._listener_state.cfg.healing_claim_wait
+                )
+                if not self._coordinator.claim(claim_key):
+                    return
+            self._claim_key = claim_key
+        except Exception as e:
+            rf_logger.debug(f"SelfhealingAgents: Healing coordination not available: {e}")
+
+    def _try_cached_healings(self, result_: result.Keyword) -> bool:
+        """Uses verified healings of the healing cache as locator suggestions.
+
+        Cached healings are only used if the structure of the DOM region around their element is unchanged
+        and they still match an element on the live page. Cached healings that no longer match are removed
+        from the cache. Their reruns do not count against the retries of the multi-agent system, which is asked
+        if all of them fail.
+
+        Args:
+            result_: The result object for the failed keyword.
+
+        Returns:
+            True if cached healings were set as suggestions, False otherwise.
+        """
+        try:
+            entries: list[CachedHealing] = self._healing_cache.lookup(*self._healing_key)
+            self._dom_utility = DomUtilityFactory.create_dom_utility(
+                KickoffMultiAgentSystem.get_agent_type(result_.owner)
             )
+            self._dom_snapshot = self._dom_utility.capture_snapshot()
+        except Exception as e:
+            rf_logger.debug(f"SelfhealingAgents: Healing cache not available: {e}")
+            return False
+
+        candidates: list[str] = []
+        for entry in entries:
+            if entry.healed_locator in candidates:
+                continue
+            if entry.fingerprint and entry.fingerprint != self._dom_utility.get_region_fingerprint(
+                entry.healed_locator, self._dom_snapshot
+            ):
+                continue
+            candidates.append(entry.healed_locator)
+        if not candidates:
+            return False
+
+        statuses = self._dom_utility.validate_locators(candidates)
+        for status in statuses:
+            if not status.valid:
+                self._healing_cache.invalidate(*self._healing_key, status.locator)
+        self._cached_locators = [status.locator for status in statuses if status.valid]
+        if not self._cached_locators:
+            return False
+
+        rf_logger.info(
+            f"SelfhealingAgents: Using cached healings for locator '{self._healing_key[2]}'."
         )
+        self._listener_state.suggestions = self._cached_locators.copy()
+        self._listener_state.should_generate_locators = False
+        return True
+
+    def _discard_failed_reuse(self, data: running.Keyword) -> None:
+        """Forgets a memoized or cached healing when its rerun failed.
+
+        If no other reused locator is left to try, the multi-agent system is asked for new suggestions.
 
-        # Only proceed with healing, if response type is LocatorHealingResponse
-        if isinstance(locator_suggestions, LocatorHealingResponse):
-            self._listener_state.suggestions = locator_suggestions.suggestions
-            self._listener_state.should_generate_locators = False
-            self._listener_state.retry_count += 1
-        elif isinstance(locator_suggestions, NoHealingNeededResponse):
-            self._listener_state.suggestions = None
+        Args:
+            data: The running keyword data of the failed rerun.
+        """
+        if self._healing_key is None or not data.args:
+            return
+        failed_locator: str = data.args[0]
+        if failed_locator == self._memoized_locator:
+            self._listener_state.healing_memo.pop(self._healing_key, None)
+            self._listener_state.memo_stats.misses += 1
+            self._memoized_locator = None
+        elif failed_locator in self._cached_locators:
+            self._healing_cache.invalidate(*self._healing_key, failed_locator)
+        else:
+            return
+        if not self._listener_state.suggestions:
             self._listener_state.should_generate_locators = True
+
+    def _remember_healing(self, healed_locator: str) -> None:
+        """Remembers a verified healing in the in-run memo and the healing cache.
+
+        In the healing cache, the healing is keyed by the structural fingerprint of the DOM region around
+        the healed element on the page of the failure.
+
+        Args:
+            healed_locator: The locator whose rerun passed.
+        """
+        if self._healing_key is None:
             return
+        if healed_locator == self._memoized_locator:
+            self._listener_state.memo_stats.hits += 1
+        self._listener_state.healing_memo[self._healing_key] = healed_locator
+        if self._healing_cache is None:
+            return
+        try:
+            fingerprint: str | None = (
+                self._dom_utility.get_region_fingerprint(healed_locator, self._dom_snapshot)
+                if self._dom_utility is not None and self._dom_snapshot is not None
+                else ""
+            )
+            self._healing_cache.store(*self._healing_key, fingerprint or "", healed_locator)
+        except Exception as e:
+            rf_logger.debug(f"SelfhealingAgents: Healing could not be cached: {e}")
 
     def _try_locator_suggestions(self, data: running.Keyword) -> Any:
         """Attempts to rerun a keyword with suggested locators.
@@ -175,7 +698,7 @@ class SelfHealingEngine:
         )
         self._listener_state.healed = True
         if not self._listener_state.suggestions:
-            self._should_generate_locators = True
+            self._listener_state.should_generate_locators = True
         return result
 
     @staticmethod
@@ -262,12 +785,26 @@ class SelfHealingEngine:
     def _reset_state(self) -> None:
         """Resets the healing state for the next keyword or test.
 
-        Clears locator suggestions, resets retry count, and prepares for the next healing attempt.
+        Clears locator suggestions, resets retry count, releases the claim of the failed locator, and prepares
+        for the next healing attempt.
         """
+        if self._claim_key is not None:
+            try:
+                self._coordinator.release(self._claim_key)
+            except Exception as e:
+                rf_logger.debug(f"SelfhealingAgents: Healing claim could not be released: {e}")
+            self._claim_key = None
         self._listener_state.retry_count = 0
         self._listener_state.suggestions = None
         self._listener_state.should_generate_locators = True
         self._listener_state.tried_locators.clear()
+        self._healing_key = None
+        self._healing_data = None
+        self._memoized_locator = None
+        self._dom_utility = None
+        self._dom_snapshot = None
+        self._cached_locators = []
+        self._fast_fail_data = None
 
     @staticmethod
     def _extract_source_metadata(source: Any) -> tuple[str, str]:
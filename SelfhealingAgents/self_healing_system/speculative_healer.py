@@ -0,0 +1,124 @@
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from SelfhealingAgents.self_healing_system.context_retrieving.dom_snapshot import DomSnapshot
+from SelfhealingAgents.self_healing_system.context_retrieving.library_dom_utils.base_dom_utils import (
+    BaseDomUtils,
+)
+
+
+class SpeculativeHealer:
+    """Precomputes DOM-based locator proposals while the test is still passing.
+
+    At the first failure after a page-changing keyword, the engine hands over the snapshot of the new page
+    together with the locators of the upcoming keywords. Parsing the snapshot and generating the proposals
+    for those locators happens on a background thread. When another of the locators fails on the same page,
+    the parsed snapshot and its proposals are ready, so the healing attempt does not have to compute them.
+
+    Only the offline work runs in the background. The snapshot itself is captured by the caller, because
+    the libraries must not be driven from another thread. The background job works on its own copy of the
+    snapshot, so that its parsed tree and query context are never shared with the caller's thread while the
+    job is running.
+
+    Attributes:
+        _executor (Optional[ThreadPoolExecutor]): Background worker, created on first use.
+        _snapshot (Optional[DomSnapshot]): Copy of the snapshot the pending proposals are computed on.
+        _future (Optional[Future]): Background computation of the proposals for `_snapshot`.
+    """
+    def __init__(self) -> None:
+        """Initializes the SpeculativeHealer without starting the background worker yet."""
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._snapshot: Optional[DomSnapshot] = None
+        self._future: Optional[Future] = None
+
+    def prepare(
+        self,
+        dom_utility: BaseDomUtils,
+        dom_snapshot: DomSnapshot,
+        targets: List[Tuple[str, str]],
+    ) -> None:
+        """Starts computing the proposals of upcoming locators on a snapshot in the background.
+
+        Proposals prepared for an earlier snapshot are discarded.
+
+        Args:
+            dom_utility (BaseDomUtils): DOM utility of the library that owns the upcoming keywords, used by the
+                background job only.
+            dom_snapshot (DomSnapshot): Snapshot of the page after the page-changing keyword. It is copied
+                without its parsed tree, so the caller can keep using it.
+            targets (List[Tuple[str, str]]): Resolved locator and keyword name of the upcoming keywords.
+        """
+        if self._future is not None:
+            self._future.cancel()
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="speculative-healing")
+        self._snapshot = DomSnapshot(dom_snapshot.simplified_dom, raw_source=dom_snapshot.raw_source)
+        self._future = self._executor.submit(
+            self._compute_proposals, dom_utility, self._snapshot, targets
+        )
+
+    def resolve(self, dom_snapshot: DomSnapshot) -> DomSnapshot:
+        """Returns the prepared snapshot if the page did not change since it was captured.
+
+        Waits for the background computation, if it is still running, so that the returned snapshot is no
+        longer used by the background thread.
+
+        Args:
+            dom_snapshot (DomSnapshot): Snapshot of the page at the failure.
+
+        Returns:
+            DomSnapshot: The prepared snapshot with its precomputed proposals, or `dom_snapshot` if the
+                page changed or nothing was prepared.
+        """
+        if (
+            self._future is None
+            or self._snapshot is None
+            or self._snapshot.simplified_dom != dom_snapshot.simplified_dom
+        ):
+            return dom_snapshot
+        try:
+            self._future.result()
+        except Exception as e:
+            logging.getLogger("SelfhealingReports").info(f"Speculative healing failed: {e}")
+            return dom_snapshot
+        logging.getLogger("SelfhealingReports").info(
+            f"Using {len(self._snapshot.locator_proposals)} speculatively computed proposal lists"
+        )
+        return self._snapshot
+
+    def close(self) -> None:
+        """Stops the background worker and drops pending computations."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        self._snapshot = None
+        self._future = None
+
+    @staticmethod
+    def _compute_proposals(
+        dom_utility: BaseDomUtils,
+        dom_snapshot: DomSnapshot,
+        targets: List[Tuple[str, str]],
+    ) -> None:
+        """Parses the snapshot and stores the proposals of every target in it.
+
+        Args:
+            dom_utility (BaseDomUtils): DOM utility of the library that owns the upcoming keywords.
+            dom_snapshot (DomSnapshot): Snapshot to compute the proposals on.
+            targets (List[Tuple[str, str]]): Resolved locator and keyword name of the upcoming keywords.
+        """
+        proposals: Dict[Tuple[str, str], List[str]] = {}
+        for locator, keyword_name in targets:
+            if (locator, keyword_name) in proposals:
+                continue
+            try:
+                proposals[(locator, keyword_name)] = list(
+                    dom_utility.get_locator_proposals(
+                        locator, keyword_name, dom_snapshot=dom_snapshot
+                    )
+                    or []
+                )
+            except Exception:
+                continue
+        dom_snapshot.locator_proposals.update(proposals)
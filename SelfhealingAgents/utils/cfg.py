@@ -1,4 +1,4 @@
-from typing import Any, Optional
+from typing import Any, Literal, Optional
 
 from pydantic import Field, ConfigDict
 from pydantic_settings import BaseSettings
@@ -35,6 +35,11 @@ class Cfg(BaseSettings):
     orchestrator_agent_temperature: float = Field(
         0.1, gt=0, env="ORCHESTRATOR_AGENT_TEMPERATURE"
     )
+    orchestrator_routing: Literal["llm", "rules"] = Field(
+        "llm", env="ORCHESTRATOR_ROUTING",
+        description="Routing of failures to the locator agent - Options: 'llm', 'rules'. With 'rules', "
+                    "unambiguous locator errors skip the orchestrator agent."
+    )
     locator_agent_provider: str = Field(
         "openai", env="LOCATOR_AGENT_PROVIDER",
         description="LLM Provider for Locator agent - Options: 'openai', 'azure'."
@@ -58,15 +63,122 @@ class Cfg(BaseSettings):
         "css", env="LOCATOR_TYPE",
         description="Locator type restriction for suggestions of model."
     )
+    dom_token_budget: int = Field(
+        0, ge=0, env="DOM_TOKEN_BUDGET",
+        description="Approximate number of tokens of the DOM in the locator generation prompt. If set, larger DOMs "
+                    "are pruned to the fragments most relevant to the failed locator. 0 sends the whole DOM."
+    )
+    prompt_layout: Literal["failure_first", "cache_friendly"] = Field(
+        "failure_first", env="PROMPT_LAYOUT",
+        description="Order of the locator generation prompt - Options: 'failure_first', 'cache_friendly'. With "
+                    "'cache_friendly', file context and DOM come before the failure details, so that providers "
+                    "can reuse the cached prompt prefix. The DOM is then pruned independently of the failure, and "
+                    "the fragments relevant to the failed locator follow the failure details."
+    )
+    file_context_token_cap: int = Field(
+        0, ge=0, env="FILE_CONTEXT_TOKEN_CAP",
+        description="Approximate number of tokens of the source file context in the prompt. If set, only the "
+                    "enclosing test or keyword and the variables it references are sent. 0 sends the whole file."
+    )
     report_directory: Optional[str] = Field(
         None, env="REPORT_DIRECTORY",
         description="Path to the report directory."
     )
+    report_shard_directory: Optional[str] = Field(
+        None, env="REPORT_SHARD_DIRECTORY",
+        description="Directory for per-worker report shards in parallel runs, e.g. with pabot. If set, each worker "
+                    "streams its healing events to its own shard instead of generating reports, and the shards are "
+                    "merged afterwards with 'python -m SelfhealingAgents.merge_reports'."
+    )
     is_rerun_activated: Optional[bool] = Field(
         False, env="IS_RERUN_ACTIVATED",
         description="Boolean if Rerun option is activated. If True, Report folder will not be deleted to avoid overwriting the initial run."
     )
 
+    healing_cache_path: Optional[str] = Field(
+        None, env="HEALING_CACHE_PATH",
+        description="Path to the SQLite file of the persistent healing cache. The cache is disabled if not set."
+    )
+    healing_cache_ttl_days: float = Field(
+        30.0, gt=0, env="HEALING_CACHE_TTL_DAYS",
+        description="Days after its last use until a cached healing expires."
+    )
+    healing_cache_max_entries: int = Field(
+        1000, gt=0, env="HEALING_CACHE_MAX_ENTRIES",
+        description="Maximum number of healings kept in the cache. The least recently used ones are evicted first."
+    )
+    fast_fail_probe: bool = Field(
+        False, env="FAST_FAIL_PROBE",
+        description="Whether locators of action keywords, e.g. clicks and text input, are probed before the "
+                    "keyword runs, so that missing elements are healed without waiting for the library timeout. "
+                    "Assertions, waits and reads are not probed."
+    )
+    fast_fail_probe_timeout: float = Field(
+        0.5, ge=0, env="FAST_FAIL_PROBE_TIMEOUT",
+        description="Seconds the fast-fail probe waits for a missing element to appear."
+    )
+    healing_coordination_path: Optional[str] = Field(
+        None, env="HEALING_COORDINATION_PATH",
+        description="Path to a SQLite file shared by parallel workers, e.g. of pabot. Workers then heal a failed "
+                    "locator only once, share their healings and keep to a global LLM request budget. The file "
+                    "also serves as healing cache if HEALING_CACHE_PATH is not set. Disabled if not set."
+    )
+    healing_claim_timeout: float = Field(
+        120.0, gt=0, env="HEALING_CLAIM_TIMEOUT",
+        description="Seconds after which the claim of a worker on a locator is considered stale, e.g. because the "
+                    "worker died."
+    )
+    healing_claim_wait: float = Field(
+        10.0, ge=0, env="HEALING_CLAIM_WAIT",
+        description="Seconds a worker waits at most for the healing of the same locator by another worker, "
+                    "before it heals the locator itself."
+    )
+    healing_coordination_requests_per_minute: int = Field(
+        0, ge=0, env="HEALING_COORDINATION_REQUESTS_PER_MINUTE",
+        description="Number of LLM requests per minute of all workers together that share "
+                    "HEALING_COORDINATION_PATH, counted across processes in the coordination file. "
+                    "LLM_RATE_LIMIT_RPM limits each worker process on its own. 0 means no limit."
+    )
+    speculative_healing: bool = Field(
+        False, env="SPECULATIVE_HEALING",
+        description="Whether locator proposals for the upcoming keywords are precomputed after page-changing "
+                    "keywords."
+    )
+    llm_rate_limit_rpm: float = Field(
+        0, ge=0, env="LLM_RATE_LIMIT_RPM",
+        description="Requests per minute to each provider and model of this worker. 0 means no limit."
+    )
+    llm_max_retries: int = Field(
+        2, ge=0, env="LLM_MAX_RETRIES",
+        description="Retries of LLM requests that failed with a rate limit, server or connection error, with "
+                    "jittered exponential backoff or after the Retry-After delay of the provider."
+    )
+    llm_backoff_max: float = Field(
+        30.0, gt=0, env="LLM_BACKOFF_MAX",
+        description="Maximum seconds to wait before retrying an LLM request. Requests whose Retry-After is longer "
+                    "fail instead of waiting."
+    )
+    llm_circuit_breaker_threshold: int = Field(
+        5, ge=0, env="LLM_CIRCUIT_BREAKER_THRESHOLD",
+        description="Consecutive failed LLM requests after which healing is paused for the cooldown. 0 never "
+                    "pauses healing."
+    )
+    llm_circuit_breaker_cooldown: float = Field(
+        60.0, gt=0, env="LLM_CIRCUIT_BREAKER_COOLDOWN",
+        description="Seconds healing is paused after the circuit breaker opened."
+    )
+    llm_response_cache_mode: Literal["bypass", "record", "replay"] = Field(
+        "bypass", env="LLM_RESPONSE_CACHE_MODE",
+        description="Local cache of LLM responses - Options: 'bypass', 'record', 'replay'. 'record' reuses cached "
+                    "responses and stores new ones, 'replay' only serves cached responses and fails on a miss, "
+                    "for deterministic runs without network access."
+    )
+    llm_response_cache_dir: Optional[str] = Field(
+        None, env="LLM_RESPONSE_CACHE_DIR",
+        description="Directory of the LLM response cache. Defaults to 'SelfhealingAgentsLlmCache' in the current "
+                    "working directory."
+    )
+
     azure_api_key: Optional[str] = Field(
         None, env="AZURE_API_KEY",
         description="Azure API key"
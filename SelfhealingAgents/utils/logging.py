@@ -99,4 +99,19 @@ def log(func: Callable[..., Any]) -> Callable[..., Any]:
             except Exception as e:
                 logger.exception(f"Function {func.__name__} raised an exception:")
                 raise
-        return sync_wrapper
\ No newline at end of file
+        return sync_wrapper
+
+
+def log_usage(agent_name: str, usage: Any) -> None:
+    """Logs the token usage of an agent run, including the input tokens read from the provider's prompt cache.
+
+    Args:
+        agent_name (str): Name of the agent that made the requests.
+        usage (Any): The pydantic-ai usage of the run.
+    """
+    logging.getLogger("SelfhealingReports").info(
+        f"{agent_name} usage: {getattr(usage, 'input_tokens', 0)} input tokens "
+        f"({getattr(usage, 'cache_read_tokens', 0)} cached), "
+        f"{getattr(usage, 'output_tokens', 0)} output tokens, "
+        f"{getattr(usage, 'requests', 0)} requests"
+    )
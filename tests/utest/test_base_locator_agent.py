@@ -27,6 +27,9 @@ class _FakeAgentRunResult:
     def __init__(self, output: Any) -> None:
         self.output: Any = output
 
+    def usage(self) -> Any:
+        return None
+
 
 class _FakeUsageLimits:
     def __init__(self, request_limit: int, total_tokens_limit: int) -> None:
@@ -34,6 +37,10 @@ class _FakeUsageLimits:
         self.total_tokens_limit: int = total_tokens_limit
 
 
+class _FakeRunUsage:
+    pass
+
+
 class _FakeAgent:
     def __init__(
         self, *, model: Any, system_prompt: str, deps_type: Any, output_type: Any
@@ -64,7 +71,7 @@ class _FakeModelRetry(Exception):
 
 
 class _FakeRunContext:
-    def __init__(self, deps: Any) -> None:
+    def __init__(self, deps: Any, **kwargs: Any) -> None:
         self.deps: Any = deps
 
     @classmethod
@@ -109,6 +116,7 @@ def _install_stubs() -> _LoggerStub:
 
     pa_usage = types.ModuleType("pydantic_ai.usage")
     pa_usage.UsageLimits = _FakeUsageLimits
+    pa_usage.RunUsage = _FakeRunUsage
     _force_module("pydantic_ai.usage", pa_usage)
 
     pa_agent = types.ModuleType("pydantic_ai.agent")
@@ -122,6 +130,7 @@ def _install_stubs() -> _LoggerStub:
         return f
 
     logging_mod.log = log
+    logging_mod.log_usage = lambda agent_name, usage: None
     cfg_mod = types.ModuleType("SelfhealingAgents.utils.cfg")
 
     class Cfg:
@@ -207,6 +216,7 @@ def _install_stubs() -> _LoggerStub:
             keyword_args: tuple,
             failed_locator: str,
             tried_locator_memory: list,
+            dom_snapshot: Any = None,
         ) -> None:
             self.robot_code_line = robot_code_line
             self.error_msg = error_msg
@@ -215,6 +225,7 @@ def _install_stubs() -> _LoggerStub:
             self.keyword_args = keyword_args
             self.failed_locator = failed_locator
             self.tried_locator_memory = tried_locator_memory
+            self.dom_snapshot = dom_snapshot
 
     payload_mod.PromptPayload = PromptPayload
     _force_module(
@@ -278,8 +289,9 @@ class _DomStub:
         self._raise_valid = raise_valid
         self._raise_unique = raise_unique
         self._raise_clickable = raise_clickable
+        self.validate_calls: List[List[str]] = []
 
-    def get_locator_proposals(self, failed: str, keyword: str) -> List[str]:
+    def get_locator_proposals(self, failed: str, keyword: str, *, dom_snapshot: Any = None) -> List[str]:
         return list(self._proposals)
 
     def get_locator_metadata(self, locator: str) -> List[dict]:
@@ -300,6 +312,21 @@ class _DomStub:
             raise RuntimeError("click err")
         return bool(self._clickable_map.get(locator, False))
 
+    def validate_locators(self, locators: List[str], *, include_metadata: bool = False, **kwargs: Any) -> List[Any]:
+        from SelfhealingAgents.self_healing_system.schemas.internal_state.locator_status import LocatorStatus
+
+        self.validate_calls.append(list(locators))
+        return [
+            LocatorStatus(
+                locator=loc,
+                valid=self._valid,
+                unique=bool(self._unique_map.get(loc, False)),
+                clickable=bool(self._clickable_map.get(loc, False)),
+                metadata=self.get_locator_metadata(loc) if include_metadata else [],
+            )
+            for loc in locators
+        ]
+
 
 def _payload(PromptPayload: Any, *, keyword: str = "Click") -> Any:
     return PromptPayload(
@@ -427,24 +454,6 @@ def test_heal_with_dom_utils_empty_proposals_raises(
         _run(inst._heal_with_dom_utils(_ctx(_payload(PromptPayload))))
 
 
-def test_is_locator_valid_unique_clickable_with_exceptions(
-    mod_and_cls: Tuple[Any, Any, Any, Any],
-) -> None:
-    BaseLocatorAgent, _, __, ___ = mod_and_cls
-    dom = _DomStub(
-        valid=True, unique_map={"proc:x": True}, clickable_map={"proc:x": True}
-    )
-    inst = _ConcreteAgentFactory.make(BaseLocatorAgent, dom, use_llm=False)
-    assert inst._is_locator_valid("proc:x") is True
-    assert inst._is_locator_unique("proc:x") is True
-    assert inst._is_element_clickable("proc:x") is True
-    dom_exc = _DomStub(raise_valid=True, raise_unique=True, raise_clickable=True)
-    inst2 = _ConcreteAgentFactory.make(BaseLocatorAgent, dom_exc, use_llm=False)
-    assert inst2._is_locator_valid("x") is False
-    assert inst2._is_locator_unique("x") is False
-    assert inst2._is_element_clickable("x") is False
-
-
 def test_sort_and_filter_helpers(mod_and_cls: Tuple[Any, Any, Any, Any]) -> None:
     BaseLocatorAgent, _, __, ___ = mod_and_cls
     dom = _DomStub(
@@ -456,4 +465,109 @@ def test_sort_and_filter_helpers(mod_and_cls: Tuple[Any, Any, Any, Any]) -> None
     sorted_list = inst._sort_locators(["b", "a", "c"])
     assert sorted_list[:2] == ["a", "c"]
     filtered = inst._filter_clickable_locators(["a", "b", "c"])
-    assert filtered == ["a", "c"]
\ No newline at end of file
+    assert filtered == ["a", "c"]
+
+def test_heal_with_dom_utils_validates_proposals_once(
+    mod_and_cls: Tuple[Any, Any, Any, Any], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    BaseLocatorAgent, _, PromptPayload, _ = mod_and_cls
+    dom = _DomStub(
+        proposals=["l1", "l2", "l3"],
+        valid=True,
+        unique_map={"proc:l2": True},
+        clickable_map={"proc:l1": True, "proc:l2": True},
+        metadata_map={"proc:l2": {"id": "second"}},
+    )
+    captured: dict = {}
+
+    def fake_get_user_msg(ctx: Any, suggestions: List[str], metadata: List[dict]) -> str:
+        captured["suggestions"] = suggestions
+        captured["metadata"] = metadata
+        return "SEL_USER"
+
+    mod = sys.modules[BaseLocatorAgent.__module__]
+    monkeypatch.setattr(
+        mod.PromptsLocatorSelectionAgent, "get_user_msg", staticmethod(fake_get_user_msg)
+    )
+    inst = _ConcreteAgentFactory.make(BaseLocatorAgent, dom, use_llm=False)
+    inst.selection_agent.run_result = _FakeAgentRunResult("#alt")
+    _run(inst._heal_with_dom_utils(_ctx(_payload(PromptPayload, keyword="Click"))))
+    assert dom.validate_calls == [["proc:l1", "proc:l2", "proc:l3"]]
+    assert captured["suggestions"] == ["proc:l2", "proc:l1"]
+    assert captured["metadata"] == [{"id": "second"}, {"id": "proc:l1"}]
+
+
+def test_output_validator_validates_suggestions_once(
+    mod_and_cls: Tuple[Any, Any, Any, Any],
+) -> None:
+    BaseLocatorAgent, LocatorHealingResponse, PromptPayload, _ = mod_and_cls
+    dom = _DomStub(
+        valid=True,
+        unique_map={"proc:b": True},
+        clickable_map={"proc:a": True, "proc:b": True},
+    )
+    inst = _ConcreteAgentFactory.make(BaseLocatorAgent, dom, use_llm=True)
+    res = _run(
+        inst.generation_agent.validator(
+            _ctx(_payload(PromptPayload, keyword="Click")),
+            LocatorHealingResponse(["a", "b"]),
+        )
+    )
+    assert res.suggestions == ["proc:b", "proc:a"]
+    assert dom.validate_calls == [["proc:a", "proc:b"]]
+
+
+def test_output_validator_confirms_all_offline_locators_live(
+    mod_and_cls: Tuple[Any, Any, Any, Any],
+) -> None:
+    BaseLocatorAgent, LocatorHealingResponse, PromptPayload, _ = mod_and_cls
+    from SelfhealingAgents.self_healing_system.schemas.internal_state.locator_status import LocatorStatus
+
+    class OfflineDomStub(_DomStub):
+        def validate_locators(self, locators: List[str], **kwargs: Any) -> List[Any]:
+            if kwargs.get("dom_snapshot") is None:
+                return super().validate_locators(locators, **kwargs)
+            self.validate_calls.append(["offline"] + list(locators))
+            return [
+                LocatorStatus(locator=loc, count=1, valid=True, unique=True, clickable=True, offline=True)
+                for loc in locators
+            ]
+
+    dom = OfflineDomStub(
+        valid=True,
+        unique_map={"proc:a": False, "proc:b": True},
+        clickable_map={"proc:a": True, "proc:b": True},
+    )
+    inst = _ConcreteAgentFactory.make(BaseLocatorAgent, dom, use_llm=True)
+    payload = _payload(PromptPayload, keyword="Click")
+    payload.dom_snapshot = object()
+    res = _run(inst.generation_agent.validator(_ctx(payload), LocatorHealingResponse(["a", "b"])))
+    assert res.suggestions == ["proc:b", "proc:a"]
+    assert dom.validate_calls == [["offline", "proc:a", "proc:b"], ["proc:a", "proc:b"]]
+
+
+def test_output_validator_drops_lower_ranked_locators_that_fail_live(
+    mod_and_cls: Tuple[Any, Any, Any, Any],
+) -> None:
+    BaseLocatorAgent, LocatorHealingResponse, PromptPayload, _ = mod_and_cls
+    from SelfhealingAgents.self_healing_system.schemas.internal_state.locator_status import LocatorStatus
+
+    class OfflineDomStub(_DomStub):
+        def validate_locators(self, locators: List[str], **kwargs: Any) -> List[Any]:
+            if kwargs.get("dom_snapshot") is None:
+                return super().validate_locators(locators, **kwargs)
+            return [
+                LocatorStatus(locator=loc, count=1, valid=True, unique=True, clickable=True, offline=True)
+                for loc in locators
+            ]
+
+    dom = OfflineDomStub(
+        valid=True,
+        unique_map={"proc:a": True, "proc:b": True},
+        clickable_map={"proc:a": True, "proc:b": False},
+    )
+    inst = _ConcreteAgentFactory.make(BaseLocatorAgent, dom, use_llm=True)
+    payload = _payload(PromptPayload, keyword="Click")
+    payload.dom_snapshot = object()
+    res = _run(inst.generation_agent.validator(_ctx(payload), LocatorHealingResponse(["a", "b"])))
+    assert res.suggestions == ["proc:a"]
@@ -7,6 +7,7 @@ from typing import Any, Callable, Dict, List, Tuple, Optional
 
 
 MODULE_PATH: str = "SelfhealingAgents.self_healing_system.context_retrieving.library_dom_utils.browser_dom_utils"
+BASE_MODULE_PATH: str = "SelfhealingAgents.self_healing_system.context_retrieving.library_dom_utils.base_dom_utils"
 
 
 def _install_stub_logging_if_needed() -> None:
@@ -23,14 +24,16 @@ def _install_stub_logging_if_needed() -> None:
     def log(func: Callable[..., Any]) -> Callable[..., Any]:
         return func
     logging_mod.log = log
+    logging_mod.log_usage = lambda agent_name, usage: None
     sys.modules["SelfhealingAgents"] = pkg
     sys.modules["SelfhealingAgents.utils"] = utils
     sys.modules["SelfhealingAgents.utils.logging"] = logging_mod
 
 
 def _import_module_fresh() -> Any:
-    if MODULE_PATH in sys.modules:
-        del sys.modules[MODULE_PATH]
+    for name in (MODULE_PATH, BASE_MODULE_PATH):
+        if name in sys.modules:
+            del sys.modules[name]
     return importlib.import_module(MODULE_PATH)
 
 
@@ -108,24 +111,31 @@ def test_is_locator_unique_handles_exception(monkeypatch: Any, mod_and_cls: Tupl
     assert inst.is_locator_unique("css=#x") is False
 
 
-def test_get_dom_tree_shadow_dom_path(monkeypatch: Any, mod_and_cls: Tuple[Any, Any]) -> None:
+def test_get_dom_tree_simplifies_in_browser(monkeypatch: Any, mod_and_cls: Tuple[Any, Any]) -> None:
     mod, BrowserDomUtils = mod_and_cls
-    html_shadow: str = "<html><body><div id='a'>A</div></body></html>"
+    compact_body: str = "<body><div id='a'>A</div></body>"
+    scripts: List[str] = []
     class Lib:
         def evaluate_javascript(self, ctx: Any, script: str) -> Any:
-            if "shadowRoot" in script and "some(" in script:
-                return True
-            return html_shadow
+            scripts.append(script)
+            return compact_body
         def get_page_source(self) -> str:
             raise AssertionError("should not be called")
+    received: List[str] = []
     class SDU:
         def get_simplified_dom_tree(self, src: str) -> str:
+            received.append(src)
             return "<body><div id='a'>A</div></body>"
     _patch_built_in(monkeypatch, mod, Lib())
     monkeypatch.setattr(mod, "SoupDomUtils", SDU, raising=True)
     inst = BrowserDomUtils()
-    out: str = inst.get_dom_tree()
-    assert out == "<body><div id='a'>A</div></body>"
+    snapshot = inst.capture_snapshot()
+    assert snapshot.simplified_dom == "<body><div id='a'>A</div></body>"
+    assert snapshot.raw_source == compact_body
+    assert received == [compact_body]
+    assert len(scripts) == 1
+    assert "shadowRoot" in scripts[0]
+    assert "display: none" in scripts[0]
 
 
 def test_get_dom_tree_plain_source_path(monkeypatch: Any, mod_and_cls: Tuple[Any, Any]) -> None:
@@ -133,13 +143,12 @@ def test_get_dom_tree_plain_source_path(monkeypatch: Any, mod_and_cls: Tuple[Any
     html_plain: str = "<html><body><div id='b'>B</div></body></html>"
     class Lib:
         def evaluate_javascript(self, ctx: Any, script: str) -> Any:
-            if "shadowRoot" in script and "some(" in script:
-                return False
-            raise AssertionError("should not request full shadow html")
+            raise RuntimeError("javascript not available")
         def get_page_source(self) -> str:
             return html_plain
     class SDU:
         def get_simplified_dom_tree(self, src: str) -> str:
+            assert src == html_plain
             return "<body><div id='b'>B</div></body>"
     _patch_built_in(monkeypatch, mod, Lib())
     monkeypatch.setattr(mod, "SoupDomUtils", SDU, raising=True)
@@ -273,8 +282,8 @@ def test_get_locator_proposals_fill_text(monkeypatch: Any, mod_and_cls: Tuple[An
     """
     monkeypatch.setattr(
         getattr(mod, "BrowserDomUtils"),
-        "get_dom_tree",
-        lambda self: html,
+        "capture_snapshot",
+        lambda self: mod.DomSnapshot(html),
         raising=False,
     )
     class SDU:
@@ -311,6 +320,26 @@ def test_get_locator_proposals_fill_text(monkeypatch: Any, mod_and_cls: Tuple[An
     assert out == ["css=textarea", "css=input"] or out == ["css=input", "css=textarea"]
 
 
+def test_get_locator_metadata_single_evaluation(monkeypatch: Any, mod_and_cls: Tuple[Any, Any]) -> None:
+    mod, BrowserDomUtils = mod_and_cls
+    calls: List[Tuple[Any, bool]] = []
+    class Lib:
+        def evaluate_javascript(self, selector: Any, script: str, all_elements: bool = False) -> Any:
+            calls.append((selector, all_elements))
+            return [
+                {"tagName": "BUTTON", "id": "a", "is_visible": True, "is_enabled": True, "is_checked": False},
+                {"tagName": "BUTTON", "id": "b", "is_visible": False, "is_enabled": True, "is_checked": False},
+            ]
+        def get_elements(self, locator: str) -> List[str]:
+            raise AssertionError("should not be called")
+    _patch_built_in(monkeypatch, mod, Lib())
+    inst = getattr(mod, "BrowserDomUtils")()
+    meta: List[Dict[str, Any]] = inst.get_locator_metadata("css=button")
+    assert calls == [("css=button", True)]
+    assert [m["id"] for m in meta] == ["a", "b"]
+    assert meta[1]["is_visible"] is False
+
+
 def test_get_locator_metadata_happy_path(monkeypatch: Any, mod_and_cls: Tuple[Any, Any]) -> None:
     mod, BrowserDomUtils = mod_and_cls
     class Lib:
@@ -356,3 +385,51 @@ def test_get_locator_metadata_happy_path(monkeypatch: Any, mod_and_cls: Tuple[An
         assert m["is_visible"] is True
         assert m["is_enabled"] is True
         assert m["is_checked"] is False
+
+
+def test_validate_locators_resolves_css_and_xpath_in_one_call(monkeypatch: Any, mod_and_cls: Tuple[Any, Any]) -> None:
+    mod, BrowserDomUtils = mod_and_cls
+    calls: List[Tuple[Any, Dict[str, Any]]] = []
+    class Lib:
+        def evaluate_javascript(self, selector: Optional[str], *function: str, **kwargs: Any) -> Any:
+            calls.append((selector, kwargs))
+            if selector is None:
+                return [
+                    {"count": 1, "clickable": True, "metadata": []},
+                    {"count": 3, "clickable": False, "metadata": []},
+                    None,
+                    None,
+                ]
+            if selector == "text=Login":
+                return {"count": 1, "clickable": True, "metadata": []}
+            raise RuntimeError("no such engine")
+    _patch_built_in(monkeypatch, mod, Lib())
+    inst = BrowserDomUtils()
+    out = inst.validate_locators(["css=#ok", "//div", "text=Login", "bogus=x"])
+    assert [s.locator for s in out] == ["css=#ok", "//div", "text=Login", "bogus=x"]
+    assert [(s.count, s.valid, s.unique, s.clickable) for s in out] == [
+        (1, True, True, True),
+        (3, True, False, False),
+        (1, True, True, True),
+        (0, False, False, False),
+    ]
+    assert calls[0][1]["arg"]["queries"] == [{"css": "#ok"}, {"xpath": "//div"}, None, None]
+    assert [c[0] for c in calls[1:]] == ["text=Login", "bogus=x"]
+    assert calls[1][1]["all_elements"] is True
+
+
+@pytest.mark.parametrize(
+    "locator, expected",
+    [
+        ("css=div.a", {"css": "div.a"}),
+        ("button[name=x]", {"css": "button[name=x]"}),
+        ("xpath=//a", {"xpath": "//a"}),
+        ("//a", {"xpath": "//a"}),
+        ("text=Login", None),
+        ('"Login"', None),
+        ("div >> text=Login", None),
+    ],
+)
+def test__get_script_query(mod_and_cls: Tuple[Any, Any], locator: str, expected: Optional[Dict[str, str]]) -> None:
+    _, BrowserDomUtils = mod_and_cls
+    assert BrowserDomUtils._get_script_query(locator) == expected
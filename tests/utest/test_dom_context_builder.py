@@ -0,0 +1,74 @@
+from SelfhealingAgents.self_healing_system.context_retrieving.dom_context_builder import DomContextBuilder
+from SelfhealingAgents.self_healing_system.context_retrieving.dom_snapshot import DomSnapshot
+
+
+_FILLER: str = "".join(
+    f"<div class='teaser'><p>Article {i} about shipping and returns</p></div>" for i in range(200)
+)
+_DOM: str = (
+    "<body>"
+    f"<main>{_FILLER}</main>"
+    "<form id='login-form'>"
+    "<label for='user'>Username</label><input id='user-name' name='username'/>"
+    "<button class='btn submit'>Sign in</button>"
+    "</form>"
+    "<footer><a href='/help'>Help</a></footer>"
+    "</body>"
+)
+
+
+def test_small_dom_is_sent_unchanged() -> None:
+    snapshot: DomSnapshot = DomSnapshot("<body><button id='login'>Login</button></body>")
+    out: str = DomContextBuilder.build(
+        snapshot, failed_locator="#login-btn", keyword_name="Click", token_budget=1000
+    )
+    assert out == snapshot.simplified_dom
+
+
+def test_zero_budget_disables_pruning() -> None:
+    snapshot: DomSnapshot = DomSnapshot(_DOM)
+    out: str = DomContextBuilder.build(
+        snapshot, failed_locator="#username", keyword_name="Fill Text", token_budget=0
+    )
+    assert out == _DOM
+
+
+def test_large_dom_is_pruned_to_relevant_fragments() -> None:
+    snapshot: DomSnapshot = DomSnapshot(_DOM)
+    out: str = DomContextBuilder.build(
+        snapshot, failed_locator="css=input#userName", keyword_name="Fill Text", token_budget=200
+    )
+    assert len(out) <= 200 * 4
+    assert 'name="username"' in out
+    assert out.startswith("<!-- body -->\n<form id=\"login-form\">")
+    assert "Article 17" not in out
+
+
+def test_anchor_locators_pull_in_their_region() -> None:
+    snapshot: DomSnapshot = DomSnapshot(_DOM)
+    out: str = DomContextBuilder.build(
+        snapshot,
+        failed_locator="#sign-in",
+        keyword_name="Click",
+        token_budget=150,
+        anchor_locators=["css=label[for='user']"],
+    )
+    assert "Sign in" in out
+    assert "Username" in out
+
+
+def test_unrelated_failure_keeps_interactive_elements() -> None:
+    snapshot: DomSnapshot = DomSnapshot(_DOM)
+    out: str = DomContextBuilder.build(snapshot, failed_locator="", keyword_name="", token_budget=200)
+    assert "Sign in" in out
+    assert 'name="username"' in out
+    assert "Article 17" not in out
+
+
+def test_identical_rows_are_all_kept() -> None:
+    rows: str = "".join("<tr><td><button class='delete'>Delete</button></td></tr>" for _ in range(3))
+    snapshot: DomSnapshot = DomSnapshot(f"<body><main>{_FILLER}</main><table>{rows}</table></body>")
+    out: str = DomContextBuilder.build(
+        snapshot, failed_locator="button.delete", keyword_name="Click", token_budget=300
+    )
+    assert out.count("Delete") == 3
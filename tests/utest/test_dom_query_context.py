@@ -0,0 +1,191 @@
+import gc
+from typing import Any, List
+
+import pytest
+from bs4 import BeautifulSoup
+
+import SelfhealingAgents.self_healing_system.context_retrieving.dom_query_context as dqc_module
+from SelfhealingAgents.self_healing_system.context_retrieving.dom_query_context import DomQueryContext
+from SelfhealingAgents.self_healing_system.context_retrieving.dom_soap_utils import SoupDomUtils
+
+
+def _sample_html() -> str:
+    return """
+    <html>
+      <body>
+        <div id="main">
+          <p id="p1">Hello</p>
+          <p id="p2">World</p>
+          <div class="item">A</div>
+          <div class="item">B</div>
+        </div>
+      </body>
+    </html>
+    """
+
+
+@pytest.fixture()
+def soup() -> BeautifulSoup:
+    return BeautifulSoup(_sample_html(), "html.parser")
+
+
+@pytest.fixture()
+def html_parse_calls(monkeypatch: pytest.MonkeyPatch) -> List[str]:
+    calls: List[str] = []
+    original = dqc_module.etree.HTML
+
+    def counting_html(text: str, *args: Any, **kwargs: Any) -> Any:
+        calls.append(text)
+        return original(text, *args, **kwargs)
+
+    monkeypatch.setattr(dqc_module.etree, "HTML", counting_html)
+    return calls
+
+
+def test_for_soup_returns_same_context(soup: BeautifulSoup) -> None:
+    assert DomQueryContext.for_soup(soup) is DomQueryContext.for_soup(soup)
+
+
+def test_for_soup_distinguishes_equal_soups() -> None:
+    a = BeautifulSoup(_sample_html(), "html.parser")
+    b = BeautifulSoup(_sample_html(), "html.parser")
+    assert DomQueryContext.for_soup(a) is not DomQueryContext.for_soup(b)
+
+
+def test_xpath_queries_parse_dom_once(soup: BeautifulSoup, html_parse_calls: List[str]) -> None:
+    assert SoupDomUtils.is_xpath_unique(soup, "//p[@id='p1']") is True
+    assert SoupDomUtils.is_xpath_multiple(soup, "//div[@class='item']") is True
+    assert SoupDomUtils.is_xpath_unique(soup, "//p") is False
+    assert SoupDomUtils.is_xpath_multiple(soup, "//p[@id='p2']") is False
+    assert len(html_parse_calls) == 1
+
+
+def test_invalidate_drops_context(soup: BeautifulSoup, html_parse_calls: List[str]) -> None:
+    assert SoupDomUtils.is_xpath_unique(soup, "//p[@id='p1']") is True
+    soup.select_one("#p1").decompose()
+    DomQueryContext.invalidate(soup)
+    assert SoupDomUtils.is_xpath_unique(soup, "//p[@id='p1']") is False
+    assert len(html_parse_calls) == 2
+
+
+def test_context_is_dropped_with_soup() -> None:
+    soup = BeautifulSoup(_sample_html(), "html.parser")
+    key = id(soup)
+    DomQueryContext.for_soup(soup)
+    assert key in DomQueryContext._registry
+    del soup
+    gc.collect()
+    assert key not in DomQueryContext._registry
+
+
+def test_invalid_xpath_does_not_poison_context(soup: BeautifulSoup) -> None:
+    assert SoupDomUtils.is_xpath_unique(soup, "//*[") is False
+    assert SoupDomUtils.is_xpath_unique(soup, "//p[@id='p2']") is True
+
+
+def test_css_count_is_memoized(soup: BeautifulSoup) -> None:
+    context: DomQueryContext = DomQueryContext.for_soup(soup)
+    assert SoupDomUtils.get_selector_count(soup, "div.item") == 2
+    assert SoupDomUtils.is_selector_unique(soup, "div.item") is False
+    assert SoupDomUtils.is_selector_unique(soup, "p#p1") is True
+    assert SoupDomUtils.get_selector_count(soup, "p#p1") == 1
+    assert context.css_hits == 2
+    assert context.css_misses == 2
+
+
+def test_invalid_css_selector_counts_as_zero(soup: BeautifulSoup) -> None:
+    assert SoupDomUtils.get_selector_count(soup, "div[") == 0
+    assert SoupDomUtils.is_selector_unique(soup, "div[") is False
+    assert DomQueryContext.for_soup(soup).css_hits == 1
+
+
+def test_generate_unique_css_selector_reuses_counts(soup: BeautifulSoup) -> None:
+    for elem in soup.find_all(["p", "div"]):
+        SoupDomUtils.generate_unique_css_selector(elem, soup)
+    first_misses: int = DomQueryContext.for_soup(soup).css_misses
+    for elem in soup.find_all(["p", "div"]):
+        SoupDomUtils.generate_unique_css_selector(elem, soup)
+    assert DomQueryContext.for_soup(soup).css_misses == first_misses
+
+
+_INDEX_HTML: str = """
+<html>
+  <body>
+    <form id="login" class="card main-form">
+      <label for="user">User <b>name</b></label>
+      <input id="user" name="user" type="TEXT" placeholder="Your name" class="field"/>
+      <input id="pass" name="pass" type="password" class="field secret"/>
+      <input name="user" type="text" class="field"/>
+      <button type="submit" role="button" class="btn btn-primary">Log in</button>
+      <a role="button" class="btn">Log in with SSO</a>
+      <!-- Log in -->
+      <iframe>Log in</iframe>
+    </form>
+    <div class="Card">card</div>
+  </body>
+</html>
+"""
+
+
+@pytest.mark.parametrize(
+    "selector",
+    [
+        "input#user",
+        "input#missing",
+        'input[name="user"]',
+        'input[type="text"]',
+        'input[type="password"]',
+        'input[placeholder="Your name"]',
+        'button[role="button"]',
+        "button.btn",
+        "a.btn.btn-primary",
+        "button.btn.btn-primary",
+        "div.card",
+        "div.Card",
+        "form#login.card",
+        'input.field[name="user"]',
+        'button:-soup-contains-own("Log in")',
+        'a:-soup-contains-own("Log in")',
+        'label:-soup-contains-own("name")',
+        'label:-soup-contains-own("User")',
+        'iframe:-soup-contains-own("Log")',
+        'INPUT[NAME="user"]',
+        "input#1user",
+        "form > input",
+        'input[name="user"]:nth-of-type(1)',
+    ],
+)
+def test_indexed_css_count_matches_soupsieve(selector: str) -> None:
+    soup: BeautifulSoup = BeautifulSoup(_INDEX_HTML, "html.parser")
+    try:
+        expected: int = len(soup.select(selector))
+    except Exception:
+        expected = 0
+    assert DomQueryContext.for_soup(soup).css_count(selector) == expected
+
+
+@pytest.mark.parametrize(
+    "xpath",
+    [
+        "//input[@id='user']",
+        "//input[@name='user']",
+        "//input[@type='text']",
+        "//input[@type='TEXT']",
+        '//button[@role="button"]',
+        "//div[@class='Card']",
+        "//input[@missing='x']",
+        "//form/input[2]",
+    ],
+)
+def test_indexed_xpath_count_matches_lxml(xpath: str) -> None:
+    soup: BeautifulSoup = BeautifulSoup(_INDEX_HTML, "html.parser")
+    context: DomQueryContext = DomQueryContext.for_soup(soup)
+    assert context.xpath_count(xpath) == len(context.xpath_tree.xpath(xpath))
+
+
+def test_simple_selectors_are_answered_from_index(soup: BeautifulSoup) -> None:
+    context: DomQueryContext = DomQueryContext.for_soup(soup)
+    assert SoupDomUtils.is_selector_unique(soup, "p#p1") is True
+    assert SoupDomUtils.is_xpath_multiple(soup, "//div[@class='item']") is True
+    assert SoupDomUtils.is_selector_unique(soup, "div#main > p") is False
+    assert context.index_hits == 2
@@ -0,0 +1,43 @@
+from bs4 import BeautifulSoup
+
+from SelfhealingAgents.self_healing_system.context_retrieving.dom_query_context import DomQueryContext
+from SelfhealingAgents.self_healing_system.context_retrieving.dom_snapshot import DomSnapshot
+from SelfhealingAgents.self_healing_system.context_retrieving.dom_soap_utils import SoupDomUtils
+from SelfhealingAgents.self_healing_system.schemas.internal_state.prompt_payload import PromptPayload
+
+
+_SOURCE: str = "<html><head><title>t</title></head><body><input id='a' style='x'/></body></html>"
+
+
+def test_snapshot_reuses_simplified_tree() -> None:
+    simplified: str = SoupDomUtils.get_simplified_dom_tree(_SOURCE)
+    snapshot: DomSnapshot = DomSnapshot(simplified, raw_source=_SOURCE)
+    _, tree = SoupDomUtils.simplify_dom(_SOURCE)
+    assert snapshot.soup is tree
+    assert snapshot.soup is snapshot.soup
+    assert snapshot.raw_source == _SOURCE
+
+
+def test_snapshot_parses_unknown_dom_once() -> None:
+    snapshot: DomSnapshot = DomSnapshot("<body><p id='x'>x</p></body>")
+    soup: BeautifulSoup = snapshot.soup
+    assert soup.p["id"] == "x"
+    assert snapshot.soup is soup
+    assert snapshot.query_context is DomQueryContext.for_soup(soup)
+
+
+def test_prompt_payload_does_not_serialize_snapshot() -> None:
+    snapshot: DomSnapshot = DomSnapshot("<body></body>")
+    payload: PromptPayload = PromptPayload(
+        robot_code_line="Click  #a",
+        error_msg="boom",
+        dom_tree=snapshot.simplified_dom,
+        keyword_name="Click",
+        keyword_args=("#a",),
+        failed_locator="#a",
+        tried_locator_memory=[],
+        file_usage_ctx="",
+        dom_snapshot=snapshot,
+    )
+    assert payload.dom_snapshot is snapshot
+    assert "dom_snapshot" not in payload.model_dump()
@@ -23,6 +23,7 @@ def _install_stub_logging_if_needed() -> None:
     def log(func: Callable[..., Any]) -> Callable[..., Any]:
         return func
     logging_mod.log = log
+    logging_mod.log_usage = lambda agent_name, usage: None
     sys.modules["SelfhealingAgents"] = pkg
     sys.modules["SelfhealingAgents.utils"] = utils
     sys.modules["SelfhealingAgents.utils.logging"] = logging_mod
@@ -210,6 +211,34 @@ def test_get_simplified_dom_tree_removes_noise(soupdom: Tuple[Any, Any]) -> None
         assert all("class" not in node.attrs for node in dom.find_all(t))
 
 
+def test_simplify_dom_returns_reusable_tree(soupdom: Tuple[Any, Any]) -> None:
+    _, S = soupdom
+    src: str = _sample_html()
+    simplified, tree = S.simplify_dom(src)
+    assert simplified == S.get_simplified_dom_tree(src)
+    assert str(tree) == str(BeautifulSoup(simplified, "html.parser"))
+    assert [child.name for child in tree.find_all(True, recursive=False)] == ["body"]
+    assert S.parse_simplified_dom(simplified) is not tree
+    _, tree = S.simplify_dom(src)
+    assert S.parse_simplified_dom(simplified) is tree
+
+
+def test_simplify_dom_strips_attributes_in_one_pass(soupdom: Tuple[Any, Any]) -> None:
+    _, S = soupdom
+    src: str = (
+        '<body><a id="l" class="c" href="/x" data-x="1">L</a>'
+        '<div style="display: none"><span id="gone">x</span></div>'
+        '<img class="i" src="s" alt="a" role="img">'
+        '<input type="hidden" id="h"><input type="text" name="n" style="color:red">'
+        "<p>a<script>x</script>b</p></body>"
+    )
+    simplified, tree = S.simplify_dom(src)
+    assert simplified == (
+        '<body><a id="l">L</a><img role="img"/><input name="n" type="text"/><p>ab</p></body>'
+    )
+    assert tree.p.string == "ab"
+
+
 def test_is_xpath_unique_and_multiple(soupdom: Tuple[Any, Any], soup: BeautifulSoup) -> None:
     _, S = soupdom
     assert S.is_xpath_unique(soup, "//p[@id='p2']") is True
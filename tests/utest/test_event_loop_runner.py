@@ -0,0 +1,41 @@
+import asyncio
+
+from SelfhealingAgents.self_healing_system.event_loop_runner import EventLoopRunner
+
+
+async def _running_loop() -> asyncio.AbstractEventLoop:
+    await asyncio.sleep(0)
+    return asyncio.get_running_loop()
+
+
+def test_run_reuses_the_event_loop() -> None:
+    runner: EventLoopRunner = EventLoopRunner()
+    first: asyncio.AbstractEventLoop = runner.run(_running_loop())
+    second: asyncio.AbstractEventLoop = runner.run(_running_loop())
+    assert first is second
+    assert not first.is_closed()
+    runner.close()
+    assert first.is_closed()
+
+
+def test_run_allows_concurrency_inside_the_coroutine() -> None:
+    async def gather() -> list[int]:
+        async def value(i: int) -> int:
+            await asyncio.sleep(0)
+            return i
+
+        return list(await asyncio.gather(*(value(i) for i in range(3))))
+
+    runner: EventLoopRunner = EventLoopRunner()
+    assert runner.run(gather()) == [0, 1, 2]
+    runner.close()
+
+
+def test_run_after_close_creates_a_new_loop() -> None:
+    runner: EventLoopRunner = EventLoopRunner()
+    first: asyncio.AbstractEventLoop = runner.run(_running_loop())
+    runner.close()
+    runner.close()
+    second: asyncio.AbstractEventLoop = runner.run(_running_loop())
+    assert second is not first
+    runner.close()
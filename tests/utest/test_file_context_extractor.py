@@ -0,0 +1,83 @@
+from pathlib import Path
+
+import pytest
+
+from SelfhealingAgents.self_healing_system.context_retrieving.file_context_extractor import FileContextExtractor
+
+
+_SUITE: str = """*** Settings ***
+Library    Browser
+
+*** Variables ***
+${LOGIN BUTTON}    css=#login
+${UNUSED}    nothing
+
+*** Test Cases ***
+Login Works
+    New Page    https://example.com
+    Click    ${login_button}
+    Log    done
+
+Other Test
+    Log    other
+
+*** Keywords ***
+Open Menu
+    [Arguments]    ${menu}
+    Click    ${menu}
+"""
+
+
+@pytest.fixture
+def suite(tmp_path: Path) -> Path:
+    path: Path = tmp_path / "login.robot"
+    path.write_text(_SUITE, encoding="utf-8")
+    return path
+
+
+def test_extract_returns_enclosing_test_and_referenced_variables(suite: Path) -> None:
+    out: str = FileContextExtractor.extract(suite, 11, token_cap=500)
+    assert out == (
+        "*** Variables ***\n"
+        "${LOGIN BUTTON}    css=#login\n"
+        "\n"
+        "*** Test Cases ***\n"
+        "Login Works\n"
+        "    New Page    https://example.com\n"
+        "    Click    ${login_button}\n"
+        "    Log    done\n"
+    )
+
+
+def test_extract_returns_enclosing_keyword(suite: Path) -> None:
+    out: str = FileContextExtractor.extract(suite, 20, token_cap=500)
+    assert out == "*** Keywords ***\nOpen Menu\n    [Arguments]    ${menu}\n    Click    ${menu}\n"
+
+
+def test_extract_cuts_block_down_to_lines_around_failure(suite: Path) -> None:
+    out: str = FileContextExtractor.extract(suite, 11, token_cap=35)
+    assert out.startswith("*** Variables ***\n${LOGIN BUTTON}    css=#login\n\n*** Test Cases ***\nLogin Works\n")
+    assert out.endswith("    ...\n    Click    ${login_button}\n    Log    done\n")
+    assert "New Page" not in out
+    assert len(out) <= 35 * 4
+
+
+def test_extract_without_cap_returns_whole_file(suite: Path) -> None:
+    assert FileContextExtractor.extract(suite, 11, token_cap=0) == _SUITE
+
+
+def test_extract_parses_file_once(monkeypatch: pytest.MonkeyPatch, suite: Path) -> None:
+    import SelfhealingAgents.self_healing_system.context_retrieving.file_context_extractor as module
+
+    calls: list = []
+    original = module.get_model
+    monkeypatch.setattr(module, "get_model", lambda source: calls.append(source) or original(source))
+    FileContextExtractor._files.clear()
+    FileContextExtractor.extract(suite, 11, token_cap=500)
+    FileContextExtractor.extract(suite, 20, token_cap=500)
+    assert calls == [suite]
+
+
+def test_extract_raises_for_missing_file(tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError):
+        FileContextExtractor.extract(tmp_path / "missing.robot", 1, token_cap=500)
@@ -0,0 +1,70 @@
+import time
+
+import pytest
+
+from SelfhealingAgents.self_healing_system.healing_cache import CachedHealing, HealingCache
+
+
+_KEY: tuple[str, str, str] = ("Browser", "Click", "#login")
+
+
+@pytest.fixture
+def cache(tmp_path) -> HealingCache:
+    healing_cache: HealingCache = HealingCache(tmp_path / "cache" / "healings.sqlite")
+    yield healing_cache
+    healing_cache.close()
+
+
+def test_store_and_lookup(cache: HealingCache) -> None:
+    cache.store(*_KEY, "fp", "#sign-in")
+    assert cache.lookup(*_KEY) == [CachedHealing("fp", "#sign-in")]
+    assert cache.lookup("Browser", "Click", "#other") == []
+
+
+def test_store_existing_healing_marks_it_as_used(cache: HealingCache) -> None:
+    cache.store(*_KEY, "fp", "#first")
+    cache.store(*_KEY, "fp", "#second")
+    cache.store(*_KEY, "fp", "#first")
+    assert len(cache) == 2
+    assert [entry.healed_locator for entry in cache.lookup(*_KEY)] == ["#first", "#second"]
+
+
+def test_cache_persists_across_instances(tmp_path) -> None:
+    path = tmp_path / "healings.sqlite"
+    first: HealingCache = HealingCache(path)
+    first.store(*_KEY, "fp", "#sign-in")
+    first.close()
+    second: HealingCache = HealingCache(path)
+    assert second.lookup(*_KEY) == [CachedHealing("fp", "#sign-in")]
+    second.close()
+
+
+def test_expired_healings_are_ignored_and_evicted(tmp_path, monkeypatch) -> None:
+    path = tmp_path / "healings.sqlite"
+    cache: HealingCache = HealingCache(path, ttl_days=1)
+    cache.store(*_KEY, "fp", "#sign-in")
+    now: float = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 2 * 24 * 60 * 60)
+    assert cache.lookup(*_KEY) == []
+    cache.close()
+    assert len(HealingCache(path, ttl_days=1)) == 0
+
+
+def test_least_recently_used_healings_are_evicted(tmp_path, monkeypatch) -> None:
+    cache: HealingCache = HealingCache(tmp_path / "healings.sqlite", max_entries=2)
+    clock: list[float] = [1000.0]
+    monkeypatch.setattr(time, "time", lambda: clock[0])
+    for locator in ("#a", "#b", "#c"):
+        clock[0] += 1
+        cache.store(*_KEY, "fp", locator)
+    assert [entry.healed_locator for entry in cache.lookup(*_KEY)] == ["#c", "#b"]
+    cache.close()
+
+
+def test_invalidate(cache: HealingCache) -> None:
+    cache.store(*_KEY, "fp", "#a")
+    cache.store(*_KEY, "fp", "#b")
+    cache.invalidate(*_KEY, "#a")
+    assert [entry.healed_locator for entry in cache.lookup(*_KEY)] == ["#b"]
+    cache.invalidate(*_KEY)
+    assert len(cache) == 0
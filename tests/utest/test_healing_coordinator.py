@@ -0,0 +1,92 @@
+import asyncio
+import time
+from functools import partial
+
+import pytest
+from pydantic_ai.messages import ModelMessage, ModelRequest, ModelResponse, TextPart
+from pydantic_ai.models import ModelRequestParameters
+from pydantic_ai.models.function import FunctionModel
+
+from SelfhealingAgents.self_healing_system.healing_coordinator import HealingCoordinator
+from SelfhealingAgents.self_healing_system.llm.coordinated_model import CoordinatedModel
+
+
+_KEY: str = "Browser\x1fClick\x1f#login"
+
+
+@pytest.fixture
+def workers(tmp_path) -> tuple[HealingCoordinator, HealingCoordinator]:
+    path = tmp_path / "coordination.sqlite"
+    first: HealingCoordinator = HealingCoordinator(path, requests_per_minute=2, claim_timeout=1)
+    second: HealingCoordinator = HealingCoordinator(path, requests_per_minute=2, claim_timeout=1)
+    yield first, second
+    first.close()
+    second.close()
+
+
+def test_only_one_worker_claims_a_locator(workers) -> None:
+    first, second = workers
+    assert first.claim(_KEY)
+    assert first.claim(_KEY)
+    assert not second.claim(_KEY)
+    assert second.claim("Browser\x1fClick\x1f#logout")
+
+    first.release(_KEY)
+    assert second.wait_for_release(_KEY)
+    assert second.claim(_KEY)
+
+
+def test_wait_for_release_times_out_on_a_held_claim(workers) -> None:
+    first, second = workers
+    first.claim(_KEY)
+    assert not second.wait_for_release(_KEY)
+
+
+def test_wait_for_release_is_capped_by_its_timeout(workers) -> None:
+    first, second = workers
+    first.claim(_KEY)
+    started: float = time.monotonic()
+    assert not second.wait_for_release(_KEY, timeout=0.1)
+    assert time.monotonic() - started < 1
+
+
+def test_closing_a_worker_releases_its_claims(tmp_path) -> None:
+    path = tmp_path / "coordination.sqlite"
+    first: HealingCoordinator = HealingCoordinator(path)
+    second: HealingCoordinator = HealingCoordinator(path)
+    first.claim(_KEY)
+    first.close()
+    assert second.claim(_KEY)
+    second.close()
+
+
+def test_request_budget_is_shared_by_workers(workers) -> None:
+    first, second = workers
+    assert first.reserve_request() == 0
+    assert second.reserve_request() == 0
+    wait: float = first.reserve_request()
+    assert 0 < wait <= 60
+
+
+def test_shared_returns_one_coordinator_per_file(tmp_path) -> None:
+    path = tmp_path / "coordination.sqlite"
+    coordinator: HealingCoordinator = HealingCoordinator.shared(path)
+    assert HealingCoordinator.shared(str(path)) is coordinator
+    coordinator.close()
+    assert HealingCoordinator.shared(path) is not coordinator
+    HealingCoordinator.shared(path).close()
+
+
+def test_coordinated_model_outlives_a_closed_coordinator(tmp_path) -> None:
+    path = tmp_path / "coordination.sqlite"
+    model: CoordinatedModel = CoordinatedModel(
+        FunctionModel(lambda messages, info: ModelResponse(parts=[TextPart("healed")])),
+        coordinator=partial(HealingCoordinator.shared, path, requests_per_minute=5),
+    )
+    messages: list[ModelMessage] = [ModelRequest.user_text_prompt("heal css=#login")]
+
+    asyncio.run(model.request(messages, None, ModelRequestParameters()))
+    HealingCoordinator.shared(path).close()
+    response: ModelResponse = asyncio.run(model.request(messages, None, ModelRequestParameters()))
+    assert response.parts[0].content == "healed"
+    HealingCoordinator.shared(path).close()
@@ -1,8 +1,10 @@
 import pytest
 import asyncio
+import httpx
 from typing import Any
 from unittest.mock import MagicMock, AsyncMock
 
+from SelfhealingAgents.self_healing_system.event_loop_runner import EventLoopRunner
 from SelfhealingAgents.self_healing_system.kickoff_multi_agent_system import KickoffMultiAgentSystem
 from SelfhealingAgents.self_healing_system.schemas.api.locator_healing import (
     LocatorHealingResponse,
@@ -44,7 +46,7 @@ def patch_factories_and_ctx(
     )
     monkeypatch.setattr(
         "SelfhealingAgents.self_healing_system.context_retrieving.robot_ctx_retriever.RobotCtxRetriever.get_context_payload",
-        lambda data, result, dom_utility: MagicMock(name="FakePromptPayload"),
+        lambda data, result, dom_utility, **kwargs: MagicMock(name="FakePromptPayload"),
         raising=True,
     )
     monkeypatch.setattr(
@@ -132,7 +134,9 @@ def test_kickoff_healing_context_payload_and_tried_locators(
     fake_tried_locators: list[str],
 ) -> None:
     context_payload: MagicMock = MagicMock()
-    def fake_get_context_payload(data: MagicMock, result: MagicMock, dom_utility: MagicMock) -> MagicMock:
+    def fake_get_context_payload(
+        data: MagicMock, result: MagicMock, dom_utility: MagicMock, **kwargs: Any
+    ) -> MagicMock:
         return context_payload
     monkeypatch.setattr(
         "SelfhealingAgents.self_healing_system.context_retrieving.dom_utility_factory.DomUtilityFactory.create_dom_utility",
@@ -201,7 +205,7 @@ def test_kickoff_healing_orchestrator_exception(
     )
     monkeypatch.setattr(
         "SelfhealingAgents.self_healing_system.context_retrieving.robot_ctx_retriever.RobotCtxRetriever.get_context_payload",
-        lambda data, result, dom_utility: MagicMock(),
+        lambda data, result, dom_utility, **kwargs: MagicMock(),
         raising=True,
     )
     monkeypatch.setattr(
@@ -224,3 +228,172 @@ def test_kickoff_healing_orchestrator_exception(
         _ = KickoffMultiAgentSystem.kickoff_healing(
             fake_data, fake_result, cfg=fake_cfg, tried_locator_memory=fake_tried_locators
         )
+
+
+def test_kickoff_healing_captures_dom_snapshot_once(
+    monkeypatch: pytest.MonkeyPatch,
+    fake_data: MagicMock,
+    fake_result: MagicMock,
+    fake_cfg: MagicMock,
+    fake_tried_locators: list[str],
+) -> None:
+    dom_utility: MagicMock = MagicMock()
+    received: dict[str, Any] = {}
+    def fake_get_context_payload(
+        data: MagicMock, result: MagicMock, dom_utility: MagicMock, **kwargs: Any
+    ) -> MagicMock:
+        received.update(kwargs)
+        return MagicMock()
+    patch_factories_and_ctx(monkeypatch, orchestrator_response="ok")
+    monkeypatch.setattr(
+        "SelfhealingAgents.self_healing_system.context_retrieving.dom_utility_factory.DomUtilityFactory.create_dom_utility",
+        lambda agent_type: dom_utility,
+        raising=True,
+    )
+    monkeypatch.setattr(
+        "SelfhealingAgents.self_healing_system.context_retrieving.robot_ctx_retriever.RobotCtxRetriever.get_context_payload",
+        fake_get_context_payload,
+        raising=True,
+    )
+    fake_result.owner = "SeleniumLibrary"
+    _ = KickoffMultiAgentSystem.kickoff_healing(
+        fake_data, fake_result, cfg=fake_cfg, tried_locator_memory=fake_tried_locators
+    )
+    dom_utility.capture_snapshot.assert_called_once_with()
+    assert received["dom_snapshot"] is dom_utility.capture_snapshot.return_value
+
+
+def test_kickoff_healing_reuses_pooled_agents(
+    monkeypatch: pytest.MonkeyPatch,
+    fake_data: MagicMock,
+    fake_result: MagicMock,
+    fake_cfg: MagicMock,
+    fake_tried_locators: list[str],
+) -> None:
+    patch_factories_and_ctx(monkeypatch, agent_type="selenium")
+    created_agents: list[MagicMock] = []
+
+    def fake_create_agent(agent_type: str, cfg: Any, dom_utility: Any) -> MagicMock:
+        created_agents.append(MagicMock(name=f"FakeLocatorAgent[{agent_type}]"))
+        return created_agents[-1]
+
+    monkeypatch.setattr(
+        "SelfhealingAgents.self_healing_system.agents.locator_agent.locator_agent_factory.LocatorAgentFactory.create_agent",
+        fake_create_agent,
+        raising=True,
+    )
+    runner: EventLoopRunner = EventLoopRunner()
+    dom_utilities: list[MagicMock] = [MagicMock(name="FirstDomUtility"), MagicMock(name="SecondDomUtility")]
+    for dom_utility in dom_utilities:
+        KickoffMultiAgentSystem.kickoff_healing(
+            fake_data,
+            fake_result,
+            cfg=fake_cfg,
+            tried_locator_memory=fake_tried_locators,
+            dom_utility=dom_utility,
+            event_loop_runner=runner,
+        )
+    assert len(created_agents) == 1
+    assert created_agents[0].dom_utility is dom_utilities[1]
+
+    fake_result.owner = "Browser"
+    KickoffMultiAgentSystem.kickoff_healing(
+        fake_data, fake_result, cfg=fake_cfg, tried_locator_memory=fake_tried_locators, event_loop_runner=runner
+    )
+    assert len(created_agents) == 2
+    runner.close()
+
+
+def test_kickoff_healing_closes_its_own_runner(
+    monkeypatch: pytest.MonkeyPatch,
+    fake_data: MagicMock,
+    fake_result: MagicMock,
+    fake_cfg: MagicMock,
+    fake_tried_locators: list[str],
+) -> None:
+    patch_factories_and_ctx(monkeypatch, agent_type="selenium")
+    runners: list[EventLoopRunner] = []
+
+    class RecordingRunner(EventLoopRunner):
+        def __init__(self) -> None:
+            super().__init__()
+            self.closed: bool = False
+            runners.append(self)
+
+        def close(self) -> None:
+            super().close()
+            self.closed = True
+
+    monkeypatch.setattr(
+        "SelfhealingAgents.self_healing_system.kickoff_multi_agent_system.EventLoopRunner",
+        RecordingRunner,
+        raising=True,
+    )
+    for _ in range(2):
+        KickoffMultiAgentSystem.kickoff_healing(
+            fake_data, fake_result, cfg=fake_cfg, tried_locator_memory=fake_tried_locators
+        )
+    assert len(runners) == 2
+    assert all(runner.closed and runner.agent_pool == {} for runner in runners)
+
+    owned: EventLoopRunner = EventLoopRunner()
+    KickoffMultiAgentSystem.kickoff_healing(
+        fake_data, fake_result, cfg=fake_cfg, tried_locator_memory=fake_tried_locators, event_loop_runner=owned
+    )
+    assert len(runners) == 2
+    assert len(owned.agent_pool) == 1
+    owned.close()
+
+
+def test_kickoff_healing_scopes_agents_and_http_client_to_the_runner(
+    monkeypatch: pytest.MonkeyPatch,
+    fake_data: MagicMock,
+    fake_result: MagicMock,
+    fake_cfg: MagicMock,
+    fake_tried_locators: list[str],
+) -> None:
+    from SelfhealingAgents.self_healing_system.llm.http_client import get_shared_http_client
+
+    orchestrator: MagicMock = patch_factories_and_ctx(monkeypatch, agent_type="selenium")
+    http_clients: list[Any] = []
+
+    def fake_create_agent(agent_type: str, cfg: Any, dom_utility: Any) -> MagicMock:
+        http_clients.append(get_shared_http_client())
+        return MagicMock(name=f"FakeLocatorAgent[{agent_type}]")
+
+    loops: list[asyncio.AbstractEventLoop] = []
+
+    async def fake_run_async(payload: Any) -> LocatorHealingResponse:
+        loops.append(asyncio.get_running_loop())
+        await http_clients[-1].get("https://provider.test")
+        return LocatorHealingResponse(suggestions=["healing-response"])
+
+    monkeypatch.setattr(
+        "SelfhealingAgents.self_healing_system.agents.locator_agent.locator_agent_factory.LocatorAgentFactory.create_agent",
+        fake_create_agent,
+        raising=True,
+    )
+    monkeypatch.setattr(
+        "SelfhealingAgents.self_healing_system.event_loop_runner.create_http_client",
+        lambda: httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(200))),
+        raising=True,
+    )
+    orchestrator.run_async = fake_run_async
+    runners: list[EventLoopRunner] = [EventLoopRunner(), EventLoopRunner()]
+    for runner in runners:
+        result = KickoffMultiAgentSystem.kickoff_healing(
+            fake_data,
+            fake_result,
+            cfg=fake_cfg,
+            tried_locator_memory=fake_tried_locators,
+            event_loop_runner=runner,
+        )
+        assert result == LocatorHealingResponse(suggestions=["healing-response"])
+
+    assert http_clients == [runners[0].http_client, runners[1].http_client]
+    assert http_clients[0] is not http_clients[1]
+    assert loops[0] is not loops[1]
+    runners[0].close()
+    assert http_clients[0].is_closed and runners[0].agent_pool == {}
+    assert not http_clients[1].is_closed and len(runners[1].agent_pool) == 1
+    runners[1].close()
@@ -71,6 +71,7 @@ def listener(tmp_path: Path) -> Any:
             mock_cfg.enable_self_healing = True
             mock_cfg.is_rerun_activated = False
             mock_cfg.report_directory = tmp_path
+            mock_cfg.report_shard_directory = None
 
             mock_state = MockState.return_value
             mock_state.cfg = mock_cfg
@@ -120,6 +121,16 @@ def test_start_test_delegates_to_engine(listener: Any) -> None:
     engine.start_test.assert_called_once_with(dummy_data, dummy_result)
 
 
+def test_start_keyword_delegates_to_engine(listener: Any) -> None:
+    internals = _get_internals(listener)
+    engine = internals["engine"]
+
+    dummy_data = MagicMock()
+    dummy_result = MagicMock()
+    listener.start_keyword(dummy_data, dummy_result)
+    engine.start_keyword.assert_called_once_with(dummy_data, dummy_result)
+
+
 def test_end_keyword_delegates_to_engine(listener: Any) -> None:
     internals = _get_internals(listener)
     engine = internals["engine"]
@@ -168,7 +179,7 @@ def test_close_no_rerun_report_generation_exception_is_swallowed(listener: Any)
     except Exception:
         pytest.fail("Exception should not propagate from close() when no rerun is activated")
 
-    report_gen.generate_reports.assert_called_once_with(state.report_info)
+    report_gen.generate_reports.assert_called_once_with(state.report_info, memo_stats=state.memo_stats)
 
 
 def test_close_rerun_initial_run_persists_and_generates(listener: Any, tmp_path: Path) -> None:
@@ -189,7 +200,7 @@ def test_close_rerun_initial_run_persists_and_generates(listener: Any, tmp_path:
     listener.close()
 
     save_report_info.assert_called_once_with(state.report_info, json_path)
-    report_gen.generate_reports.assert_called_once_with(state.report_info)
+    report_gen.generate_reports.assert_called_once_with(state.report_info, memo_stats=state.memo_stats)
 
 
 def test_close_rerun_initial_run_no_report_info(listener: Any) -> None:
@@ -245,7 +256,7 @@ def test_close_rerun_second_run_merges_and_generates_and_cleans_up(listener: Any
     dedup.assert_called_once_with(combined)
     sort.assert_called_once_with(deduped)
     save_report_info.assert_called_once_with(ordered, json_path)
-    report_gen.generate_reports.assert_called_once_with(ordered)
+    report_gen.generate_reports.assert_called_once_with(ordered, memo_stats=state.memo_stats)
 
     assert not json_path.exists()
 
@@ -275,4 +286,53 @@ def test_close_rerun_persistence_errors_are_swallowed(listener: Any, monkeypatch
     try:
         listener.close()
     except Exception:
-        pytest.fail("Exception from persistence logic should be swallowed in close() with rerun")
\ No newline at end of file
+        pytest.fail("Exception from persistence logic should be swallowed in close() with rerun")
+
+def test_report_shard_receives_events_per_test_and_memo_stats_on_close(
+    listener: Any, tmp_path: Path
+) -> None:
+    from SelfhealingAgents.self_healing_system.reports.report_shards import load_report_shards
+    from SelfhealingAgents.self_healing_system.schemas.internal_state.healing_memo_stats import HealingMemoStats
+    from SelfhealingAgents.self_healing_system.schemas.internal_state.report_data import ReportData
+
+    internals = _get_internals(listener)
+    state = internals["state"]
+    report_gen = internals["report_gen"]
+    shard_dir = tmp_path / "shards"
+    listener._report_shard = shard_dir / "report_info_worker.jsonl"
+
+    def report(lineno: int) -> ReportData:
+        return ReportData(
+            file="test.robot", keyword_source="test.robot", test_name="T", locator_origin="T",
+            keyword="Click", keyword_args=["#old"], lineno=lineno, failed_locator="#old",
+            healed_locator="#new", tried_locators=["#new"],
+        )
+
+    state.report_info = [report(1)]
+    state.memo_stats = HealingMemoStats(hits=1, misses=2)
+    listener.end_test(object(), object())
+    state.report_info.append(report(2))
+    listener.close()
+
+    report_info, memo_stats = load_report_shards(shard_dir)
+    assert [item.lineno for item in report_info] == [1, 2]
+    assert memo_stats == HealingMemoStats(hits=1, misses=2)
+    report_gen.generate_reports.assert_not_called()
+
+
+def test_consecutive_listener_lifecycles_start_with_fresh_agents(listener: Any) -> None:
+    from SelfhealingAgents.self_healing_system.llm.request_scheduler import RequestScheduler
+
+    mod = importlib.import_module("SelfhealingAgents.listener")
+    clients: list[Any] = []
+    for current in (listener, mod.SelfhealingAgents()):
+        runner = current._event_loop_runner
+        clients.append(runner.http_client)
+        runner.agent_pool[("browser", object())] = (MagicMock(), MagicMock())
+        RequestScheduler.for_model("openai", "gpt-4o-mini")
+
+        current.close()
+        assert clients[-1].is_closed
+        assert runner.agent_pool == {}
+        assert RequestScheduler._schedulers == {}
+    assert clients[0] is not clients[1]
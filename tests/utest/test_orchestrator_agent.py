@@ -24,6 +24,9 @@ class _FakeAgentRunResult:
     def __init__(self, output: str) -> None:
         self.output: str = output
 
+    def usage(self) -> Any:
+        return None
+
 
 class _FakeUsageLimits:
     def __init__(self, request_limit: int, total_tokens_limit: int) -> None:
@@ -61,10 +64,14 @@ class _FakeModelRetry(Exception):
 
 
 class _FakeRunContext:
-    def __init__(self, deps: Any = None) -> None:
+    def __init__(self, deps: Any = None, **kwargs: Any) -> None:
         self.deps: Any = deps
 
 
+class _FakeRunUsage:
+    pass
+
+
 def _ensure_module(name: str, builder: Callable[[], types.ModuleType]) -> None:
     existing = sys.modules.get(name)
     try:
@@ -120,6 +127,7 @@ def _install_stubs() -> _LoggerStub:
     def build_pyd_ai_usage() -> types.ModuleType:
         m = types.ModuleType("pydantic_ai.usage")
         m.UsageLimits = _FakeUsageLimits
+        m.RunUsage = _FakeRunUsage
         return m
 
     def build_pyd_ai_agent() -> types.ModuleType:
@@ -143,6 +151,7 @@ def _install_stubs() -> _LoggerStub:
             return f
 
         logging_mod.log = log
+        logging_mod.log_usage = lambda agent_name, usage: None
         sys.modules["SelfhealingAgents.utils.logging"] = logging_mod
     else:
         logging_mod = sys.modules.get(
@@ -225,6 +234,9 @@ class _FakeLocatorAgent:
     def is_failed_locator_error(self, msg: str) -> bool:
         return self._is_failed
 
+    def is_unambiguous_locator_error(self, msg: str) -> bool:
+        return self._is_failed and "waiting for locator" in msg
+
     async def heal_async(self, ctx: Any) -> str:
         if self._raise:
             raise RuntimeError("heal failed")
@@ -248,6 +260,7 @@ def test_run_async_returns_no_healing_when_not_failed(
         orchestrator_agent_provider: str = "prov"
         orchestrator_agent_model: str = "mod"
         orchestrator_agent_temperature: float = 0.1
+        orchestrator_routing: str = "llm"
 
     orch = OrchestratorAgent(FakeCfg(), _FakeLocatorAgent(is_failed=False))
     payload = PromptPayload(
@@ -279,6 +292,7 @@ def test_run_async_calls_agent_and_logs_on_error(
         orchestrator_agent_provider: str = "prov"
         orchestrator_agent_model: str = "mod"
         orchestrator_agent_temperature: float = 0.1
+        orchestrator_routing: str = "llm"
 
     orch = OrchestratorAgent(FakeCfg(), _FakeLocatorAgent(is_failed=True))
     payload = PromptPayload(
@@ -319,6 +333,7 @@ def test_run_async_calls_agent_no_log_when_ok(
         orchestrator_agent_provider: str = "prov"
         orchestrator_agent_model: str = "mod"
         orchestrator_agent_temperature: float = 0.1
+        orchestrator_routing: str = "llm"
 
     orch = OrchestratorAgent(FakeCfg(), _FakeLocatorAgent(is_failed=True))
     payload = PromptPayload(
@@ -357,6 +372,7 @@ def test_get_healed_locators_success(
         orchestrator_agent_provider: str = "prov"
         orchestrator_agent_model: str = "mod"
         orchestrator_agent_temperature: float = 0.1
+        orchestrator_routing: str = "llm"
 
     orch = OrchestratorAgent(
         FakeCfg(),
@@ -378,6 +394,7 @@ def test_get_healed_locators_raises_modelretry(
         orchestrator_agent_provider: str = "prov"
         orchestrator_agent_model: str = "mod"
         orchestrator_agent_temperature: float = 0.1
+        orchestrator_routing: str = "llm"
 
     orch = OrchestratorAgent(
         FakeCfg(), _FakeLocatorAgent(is_failed=True, raise_on_heal=True)
@@ -395,4 +412,79 @@ def test_catch_token_limit_exceedance_logs(
     assert logger.infos == ["error: out of tokens"]
     logger.infos.clear()
     OrchestratorAgent._catch_token_limit_exceedance("ok")
-    assert logger.infos == []
\ No newline at end of file
+    assert logger.infos == []
+
+@pytest.mark.parametrize(
+    "error_msg, expected_llm_calls",
+    [("waiting for locator '#bad'", 0), ("Element is not an <input>", 1)],
+)
+def test_run_async_rules_routing_skips_orchestrator_llm(
+    orch_setup: Tuple[Any, Any, _LoggerStub, Any, Any],
+    error_msg: str,
+    expected_llm_calls: int,
+) -> None:
+    _, OrchestratorAgent, _, __, PromptPayload = orch_setup
+
+    class FakeCfg:
+        request_limit: int = 10
+        total_tokens_limit: int = 1000
+        orchestrator_agent_provider: str = "prov"
+        orchestrator_agent_model: str = "mod"
+        orchestrator_agent_temperature: float = 0.1
+        orchestrator_routing: str = "rules"
+
+    orch = OrchestratorAgent(
+        FakeCfg(),
+        _FakeLocatorAgent(is_failed=True, heal_result='{"suggestions":["#ok"]}'),
+    )
+    llm_calls: List[Any] = []
+
+    class StubAgent:
+        model: Any = None
+
+        async def run(self, *args: Any, **kwargs: Any) -> _FakeAgentRunResult:
+            llm_calls.append(args)
+            return _FakeAgentRunResult('{"suggestions":["#llm"]}')
+
+    orch._agent = StubAgent()
+    payload = PromptPayload(
+        robot_code_line="Click  #bad",
+        error_msg=error_msg,
+        dom_tree="<body></body>",
+        keyword_name="Click",
+        keyword_args=("css=#bad",),
+        failed_locator="#bad",
+        tried_locator_memory=[],
+    )
+    out = _run(orch.run_async(payload))
+    assert len(llm_calls) == expected_llm_calls
+    assert out == ('{"suggestions":["#ok"]}' if expected_llm_calls == 0 else '{"suggestions":["#llm"]}')
+
+
+def test_route_to_locator_agent_returns_error_message(
+    orch_setup: Tuple[Any, Any, _LoggerStub, Any, Any],
+) -> None:
+    _, OrchestratorAgent, logger, __, PromptPayload = orch_setup
+    logger.infos.clear()
+
+    class FakeCfg:
+        request_limit: int = 10
+        total_tokens_limit: int = 1000
+        orchestrator_agent_provider: str = "prov"
+        orchestrator_agent_model: str = "mod"
+        orchestrator_agent_temperature: float = 0.1
+        orchestrator_routing: str = "rules"
+
+    orch = OrchestratorAgent(FakeCfg(), _FakeLocatorAgent(is_failed=True, raise_on_heal=True))
+    payload = PromptPayload(
+        robot_code_line="Click  #bad",
+        error_msg="waiting for locator '#bad'",
+        dom_tree="<body></body>",
+        keyword_name="Click",
+        keyword_args=("css=#bad",),
+        failed_locator="#bad",
+        tried_locator_memory=[],
+    )
+    out = _run(orch._route_to_locator_agent(payload))
+    assert out == "error: Locator healing failed: heal failed"
+    assert logger.infos == [out]
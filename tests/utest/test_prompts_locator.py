@@ -0,0 +1,70 @@
+from types import SimpleNamespace
+from typing import Any
+
+from SelfhealingAgents.self_healing_system.agents.prompts.locator.prompts_locator import (
+    PromptsLocatorGenerationAgent,
+)
+from SelfhealingAgents.self_healing_system.context_retrieving.dom_snapshot import DomSnapshot
+
+
+_LARGE_DOM: str = (
+    "<body>"
+    + "".join(f"<div class='teaser'><p>Article {i}</p><a href='/article/{i}'>Read</a></div>" for i in range(200))
+    + "<form><input id='user-name'/><button id='sign-in'>Login</button></form>"
+    "</body>"
+)
+
+
+def _ctx(prompt_layout: str) -> Any:
+    deps = SimpleNamespace(
+        locator_type="css",
+        error_msg="Element not found",
+        failed_locator="#login",
+        keyword_name="Click",
+        dom_tree="<body><button id='sign-in'>Login</button></body>",
+        dom_snapshot=None,
+        dom_token_budget=0,
+        tried_locator_memory=["#old"],
+        file_usage_ctx="*** Test Cases ***\nLogin\n    Click    #login\n",
+        prompt_layout=prompt_layout,
+    )
+    return SimpleNamespace(deps=deps)
+
+
+def _positions(msg: str) -> list[int]:
+    return [
+        msg.index(part)
+        for part in ("Test-Suite or Resource-File", "Dom Tree", "Keyword name", "Failed locator", "Error message")
+    ]
+
+
+def test_cache_friendly_layout_puts_stable_content_first() -> None:
+    msg: str = PromptsLocatorGenerationAgent.get_user_msg(_ctx("cache_friendly"))
+    assert _positions(msg) == sorted(_positions(msg))
+    assert msg.rstrip().endswith("['#old']")
+
+
+def test_failure_first_layout_is_unchanged() -> None:
+    msg: str = PromptsLocatorGenerationAgent.get_user_msg(_ctx("failure_first"))
+    assert msg.startswith("Your suggested locators should be only of type: css.")
+    assert msg.index("Error message") < msg.index("Dom Tree") < msg.index("Test-Suite or Resource-File")
+
+
+def test_cache_friendly_layout_prunes_dom_independently_of_the_failure() -> None:
+    snapshot: DomSnapshot = DomSnapshot(_LARGE_DOM)
+    first = _ctx("cache_friendly")
+    first.deps.dom_snapshot = snapshot
+    first.deps.dom_token_budget = 400
+    second = _ctx("cache_friendly")
+    second.deps.dom_snapshot = snapshot
+    second.deps.dom_token_budget = 400
+    second.deps.failed_locator = "#user"
+    second.deps.keyword_name = "Fill Text"
+    second.deps.tried_locator_memory = ["#user-name"]
+
+    first_msg: str = PromptsLocatorGenerationAgent.get_user_msg(first)
+    second_msg: str = PromptsLocatorGenerationAgent.get_user_msg(second)
+    prefix_end: int = first_msg.index("Keyword name")
+    assert first_msg[:prefix_end] == second_msg[:prefix_end]
+    assert second_msg.index("Error message") < second_msg.index("Dom fragments relevant to the failed locator")
+    assert "user-name" in second_msg[second_msg.index("Dom fragments relevant"):]
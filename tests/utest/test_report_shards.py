@@ -0,0 +1,63 @@
+from pathlib import Path
+from unittest.mock import patch
+
+from SelfhealingAgents.self_healing_system.reports.report_shards import (
+    append_report_shard,
+    load_report_shards,
+    merge_report_shards,
+)
+from SelfhealingAgents.self_healing_system.schemas.internal_state.healing_memo_stats import HealingMemoStats
+from SelfhealingAgents.self_healing_system.schemas.internal_state.report_data import ReportData
+
+
+def _report(file: str, lineno: int, healed_locator: str = "#new") -> ReportData:
+    return ReportData(
+        file=file,
+        keyword_source=file,
+        test_name="Login",
+        locator_origin="Login",
+        keyword="Click",
+        keyword_args=["#old"],
+        lineno=lineno,
+        failed_locator="#old",
+        healed_locator=healed_locator,
+        tried_locators=[healed_locator],
+    )
+
+
+def test_load_combines_workers_and_skips_broken_lines(tmp_path: Path) -> None:
+    append_report_shard(tmp_path / "report_info_a.jsonl", [_report("a.robot", 3)])
+    append_report_shard(
+        tmp_path / "report_info_a.jsonl", [], memo_stats=HealingMemoStats(hits=1, misses=1)
+    )
+    append_report_shard(
+        tmp_path / "report_info_b.jsonl", [_report("b.robot", 1)], memo_stats=HealingMemoStats(hits=2)
+    )
+    with (tmp_path / "report_info_b.jsonl").open("a", encoding="utf-8") as f:
+        f.write('{"report": {"file": "trunc')
+
+    report_info, memo_stats = load_report_shards(tmp_path)
+
+    assert sorted(item.file for item in report_info) == ["a.robot", "b.robot"]
+    assert memo_stats == HealingMemoStats(hits=3, misses=1)
+
+
+def test_merge_deduplicates_sorts_generates_once_and_removes_shards(tmp_path: Path) -> None:
+    shard_dir = tmp_path / "shards"
+    append_report_shard(shard_dir / "report_info_a.jsonl", [_report("b.robot", 5), _report("a.robot", 9)])
+    append_report_shard(shard_dir / "report_info_b.jsonl", [_report("a.robot", 9, "#other"), _report("a.robot", 2)])
+
+    with patch(
+        "SelfhealingAgents.self_healing_system.reports.report_shards.ReportGenerator"
+    ) as report_generator:
+        count: int = merge_report_shards(shard_dir, str(tmp_path))
+
+    report_generator.assert_called_once_with(base_dir=str(tmp_path))
+    merged = report_generator.return_value.generate_reports.call_args.args[0]
+    assert count == 3
+    assert [(item.file, item.lineno, item.healed_locator) for item in merged] == [
+        ("a.robot", 2, "#new"),
+        ("a.robot", 9, "#new"),
+        ("b.robot", 5, "#new"),
+    ]
+    assert not list(shard_dir.glob("*.jsonl"))
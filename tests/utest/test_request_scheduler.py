@@ -0,0 +1,120 @@
+import asyncio
+from typing import Any
+
+import httpx
+import pytest
+from pydantic_ai.exceptions import ModelAPIError, ModelHTTPError
+
+import SelfhealingAgents.self_healing_system.llm.request_scheduler as request_scheduler
+from SelfhealingAgents.self_healing_system.llm.request_scheduler import (
+    ProviderUnavailableError,
+    RequestScheduler,
+    TokenBucket,
+)
+
+
+class _ProviderError(Exception):
+    def __init__(self, status_code: int, headers: dict[str, str]) -> None:
+        super().__init__(f"status {status_code}")
+        self.response: httpx.Response = httpx.Response(status_code, headers=headers)
+
+
+def _http_error(status_code: int, headers: dict[str, str] | None = None) -> ModelHTTPError:
+    error: ModelHTTPError = ModelHTTPError(status_code=status_code, model_name="gpt-4o-mini")
+    error.__cause__ = _ProviderError(status_code, headers or {})
+    return error
+
+
+class _Provider:
+    def __init__(self, *outcomes: Any) -> None:
+        self.outcomes: list[Any] = list(outcomes)
+        self.calls: int = 0
+
+    async def send(self) -> Any:
+        self.calls += 1
+        outcome: Any = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+@pytest.fixture
+def sleeps(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    recorded: list[float] = []
+
+    async def sleep(delay: float) -> None:
+        recorded.append(delay)
+
+    monkeypatch.setattr(request_scheduler.asyncio, "sleep", sleep)
+    return recorded
+
+
+def test_rate_limit_is_retried_after_the_retry_after_delay(sleeps: list[float]) -> None:
+    provider: _Provider = _Provider(_http_error(429, {"retry-after": "2"}), _http_error(503), "ok")
+    scheduler: RequestScheduler = RequestScheduler(max_retries=2, backoff_max=10)
+
+    assert asyncio.run(scheduler.run(provider.send)) == "ok"
+    assert provider.calls == 3
+    assert sleeps[0] == 2.0
+    assert 0 <= sleeps[1] <= 2.0
+
+
+def test_client_errors_and_long_retry_after_are_not_retried(sleeps: list[float]) -> None:
+    scheduler: RequestScheduler = RequestScheduler(max_retries=3, backoff_max=10)
+    with pytest.raises(ModelHTTPError):
+        asyncio.run(scheduler.run(_Provider(_http_error(400), "ok").send))
+    with pytest.raises(ModelHTTPError):
+        asyncio.run(scheduler.run(_Provider(_http_error(429, {"retry-after-ms": "60000"}), "ok").send))
+    assert sleeps == []
+
+
+def _api_error(cause: Exception) -> ModelAPIError:
+    error: ModelAPIError = ModelAPIError(model_name="gpt-4o-mini", message=str(cause))
+    error.__cause__ = cause
+    return error
+
+
+def test_only_connection_errors_and_timeouts_are_retried(sleeps: list[float]) -> None:
+    scheduler: RequestScheduler = RequestScheduler(max_retries=3, backoff_max=10)
+    connection_error: ModelAPIError = _api_error(RuntimeError("connection error"))
+    connection_error.__cause__.__cause__ = httpx.ConnectError("refused")
+    provider: _Provider = _Provider(connection_error, _api_error(httpx.ReadTimeout("timed out")), "ok")
+    assert asyncio.run(scheduler.run(provider.send)) == "ok"
+    assert provider.calls == 3
+
+    provider = _Provider(_api_error(ValueError("invalid response")), "ok")
+    with pytest.raises(ModelAPIError):
+        asyncio.run(scheduler.run(provider.send))
+    assert provider.calls == 1
+    assert len(sleeps) == 2
+
+
+def test_circuit_breaker_stops_requests_until_the_cooldown_elapsed(
+    sleeps: list[float], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(RequestScheduler, "_schedulers", {})
+    scheduler: RequestScheduler = RequestScheduler.for_model(
+        "azure", "gpt-4o-mini", max_retries=5, breaker_threshold=2, breaker_cooldown=60
+    )
+    provider: _Provider = _Provider(_http_error(500), _http_error(500), "ok")
+
+    with pytest.raises(ModelHTTPError):
+        asyncio.run(scheduler.run(provider.send))
+    assert provider.calls == 2
+    assert not RequestScheduler.is_available("azure", "gpt-4o-mini")
+    assert RequestScheduler.is_available("openai", "gpt-4o-mini")
+    with pytest.raises(ProviderUnavailableError):
+        asyncio.run(scheduler.run(provider.send))
+    assert provider.calls == 2
+
+    monkeypatch.setattr(scheduler._breaker, "_opened_until", 0.0)
+    assert asyncio.run(scheduler.run(provider.send)) == "ok"
+    assert RequestScheduler.is_available("azure", "gpt-4o-mini")
+
+
+def test_token_bucket_queues_requests_beyond_the_burst() -> None:
+    bucket: TokenBucket = TokenBucket(requests_per_minute=60, capacity=2)
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == pytest.approx(1.0, abs=0.05)
+    assert bucket.reserve() == pytest.approx(2.0, abs=0.05)
@@ -0,0 +1,61 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+from pydantic_ai.messages import (
+    ModelMessage,
+    ModelMessagesTypeAdapter,
+    ModelRequest,
+    ModelResponse,
+    TextPart,
+)
+from pydantic_ai.models import ModelRequestParameters
+from pydantic_ai.models.function import AgentInfo, FunctionModel
+
+from SelfhealingAgents.self_healing_system.llm.response_cache import CachingModel
+
+# Build the message schema while the real pydantic_ai modules are loaded; other tests replace them with stubs
+ModelMessagesTypeAdapter.dump_python([])
+
+
+def _counting_model(calls: list[str]) -> FunctionModel:
+    def respond(messages: list[ModelMessage], info: AgentInfo) -> ModelResponse:
+        calls.append("request")
+        return ModelResponse(parts=[TextPart(f"answer {len(calls)}")])
+
+    return FunctionModel(respond)
+
+
+def _request(model: CachingModel, prompt: str) -> ModelResponse:
+    messages: list[ModelMessage] = [ModelRequest.user_text_prompt(prompt)]
+    return asyncio.run(model.request(messages, None, ModelRequestParameters()))
+
+
+def test_record_stores_responses_and_serves_repeated_requests(tmp_path: Path) -> None:
+    calls: list[str] = []
+    model: CachingModel = CachingModel(_counting_model(calls), cache_dir=tmp_path, mode="record")
+
+    first: ModelResponse = _request(model, "heal css=#login")
+    repeated: ModelResponse = _request(model, "heal css=#login")
+    other: ModelResponse = _request(model, "heal css=#logout")
+
+    assert calls == ["request", "request"]
+    assert repeated.parts[0].content == first.parts[0].content == "answer 1"
+    assert other.parts[0].content == "answer 2"
+    assert len(list(tmp_path.glob("*/*.json"))) == 2
+
+
+def test_replay_serves_recorded_responses_without_the_wrapped_model(tmp_path: Path) -> None:
+    _request(CachingModel(_counting_model([]), cache_dir=tmp_path, mode="record"), "heal css=#login")
+    calls: list[str] = []
+    replay: CachingModel = CachingModel(_counting_model(calls), cache_dir=tmp_path, mode="replay")
+
+    assert _request(replay, "heal css=#login").parts[0].content == "answer 1"
+    with pytest.raises(LookupError):
+        _request(replay, "heal css=#logout")
+    assert calls == []
+
+
+def test_unknown_mode_is_rejected(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        CachingModel(_counting_model([]), cache_dir=tmp_path, mode="bypass")
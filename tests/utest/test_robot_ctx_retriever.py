@@ -2,6 +2,8 @@ import importlib
 from dataclasses import dataclass
 from typing import Any, List, Optional
 
+from SelfhealingAgents.self_healing_system.context_retrieving.dom_snapshot import DomSnapshot
+
 
 MODULE_PATH: str = "SelfhealingAgents.self_healing_system.context_retrieving.robot_ctx_retriever"
 robot_ctx_module = importlib.import_module(MODULE_PATH)
@@ -29,6 +31,9 @@ class FakeDomUtils:
         self.get_dom_tree_calls += 1
         return self._dom
 
+    def capture_snapshot(self) -> DomSnapshot:
+        return DomSnapshot(self.get_dom_tree())
+
 
 class DummyBuiltIn:
     def __init__(self) -> None:
@@ -50,13 +55,14 @@ class FakePromptPayload:
     tried_locator_memory: List[Any]
     locator_type: str
     file_usage_ctx: str
+    dom_snapshot: Any = None
 
 
 def fake_seq2str(items: List[Any], quote: str = "", sep: str = " ", lastsep: str = " ") -> str:
     return sep.join(str(x) for x in items) + lastsep
 
 
-def _fake_file_usage_ctx(data: Any) -> str:
+def _fake_file_usage_ctx(data: Any, **kwargs: Any) -> str:
     return getattr(data, "file_usage_ctx", "")
 
 
@@ -7,6 +7,7 @@ from typing import Any, Callable, Dict, List, Tuple, Optional
 
 
 MODULE_PATH: str = "SelfhealingAgents.self_healing_system.context_retrieving.library_dom_utils.selenium_dom_utils"
+BASE_MODULE_PATH: str = "SelfhealingAgents.self_healing_system.context_retrieving.library_dom_utils.base_dom_utils"
 
 
 def _install_stub_logging_if_needed() -> None:
@@ -29,8 +30,9 @@ def _install_stub_logging_if_needed() -> None:
 
 
 def _import_module_fresh() -> Any:
-    if MODULE_PATH in sys.modules:
-        del sys.modules[MODULE_PATH]
+    for name in (MODULE_PATH, BASE_MODULE_PATH):
+        if name in sys.modules:
+            del sys.modules[name]
     return importlib.import_module(MODULE_PATH)
 
 
@@ -223,8 +225,8 @@ def test_get_locator_proposals_input_text(monkeypatch: Any, mod_and_cls: Tuple[A
     """
     monkeypatch.setattr(
         getattr(mod, "SeleniumDomUtils"),
-        "get_dom_tree",
-        lambda self: html,
+        "capture_snapshot",
+        lambda self: mod.DomSnapshot(html),
         raising=False,
     )
     class SDU:
@@ -367,3 +369,117 @@ def test__get_locator_returns_none_when_no_selector(monkeypatch: Any, mod_and_cl
     elem: Tag = soup.select_one("#x")
     out: Optional[str] = getattr(mod, "SeleniumDomUtils")._get_locator(elem, soup)
     assert out is None
+
+
+def test_validate_locators_single_script(monkeypatch: Any, mod_and_cls: Tuple[Any, Any]) -> None:
+    mod, SeleniumDomUtils = mod_and_cls
+    calls: List[Tuple[Any, ...]] = []
+    class Lib:
+        def get_webelements(self, loc: str) -> List[str]:
+            calls.append(("get_webelements", loc))
+            return ["E1"]
+        def execute_javascript(self, *code: Any) -> Any:
+            calls.append(("execute_javascript",) + code[1:])
+            return [
+                {"count": 1, "clickable": True, "visible": True, "metadata": [{"tagName": "BUTTON"}]},
+                {"count": 2, "clickable": False, "visible": False, "metadata": [{"tagName": "DIV"}]},
+                {"count": None, "clickable": False, "visible": False, "metadata": []},
+            ]
+    _patch_built_in(monkeypatch, mod, Lib())
+    inst = SeleniumDomUtils()
+    out = inst.validate_locators(["css:#ok", "id:multi", "//*["], include_metadata=True)
+    assert [c[0] for c in calls] == ["get_webelements", "execute_javascript"]
+    assert calls[1][1:] == ("ARGUMENTS", [{"css": "#ok"}, ["E1"], {"xpath": "//*["}], True)
+    assert [(s.count, s.valid, s.unique, s.clickable, s.visible, s.metadata) for s in out] == [
+        (1, True, True, True, True, [{"tagName": "BUTTON"}]),
+        (2, True, False, False, False, [{"tagName": "DIV"}]),
+        (0, False, False, False, False, []),
+    ]
+
+
+def test_validate_locators_falls_back_per_locator(monkeypatch: Any, mod_and_cls: Tuple[Any, Any]) -> None:
+    mod, SeleniumDomUtils = mod_and_cls
+    class Element:
+        tag_name: str = "button"
+        def get_attribute(self, name: str) -> Optional[str]:
+            return None
+        def is_displayed(self) -> bool:
+            return True
+        def is_enabled(self) -> bool:
+            return True
+        def is_selected(self) -> bool:
+            return False
+    class Lib:
+        def get_webelement(self, loc: str) -> Any:
+            return Element()
+        def get_webelements(self, loc: str) -> List[Any]:
+            return [Element()]
+        def execute_javascript(self, *code: Any) -> Any:
+            if len(code) > 3:
+                raise RuntimeError("script failed")
+            return None
+    _patch_built_in(monkeypatch, mod, Lib())
+    inst = SeleniumDomUtils()
+    out = inst.validate_locators(["css:button"])
+    assert [(s.locator, s.valid, s.unique, s.clickable) for s in out] == [("css:button", True, True, True)]
+
+
+@pytest.mark.parametrize(
+    "locator, expected",
+    [
+        ("css:div.a", {"css": "div.a"}),
+        ("CSS = div", {"css": "div"}),
+        ("xpath=//a", {"xpath": "//a"}),
+        ("(//a)[1]", {"xpath": "(//a)[1]"}),
+        ("id:login", None),
+        ("css:div >> xpath:a", None),
+        ("login", None),
+    ],
+)
+def test__get_script_query(mod_and_cls: Tuple[Any, Any], locator: str, expected: Optional[Dict[str, str]]) -> None:
+    _, SeleniumDomUtils = mod_and_cls
+    assert SeleniumDomUtils._get_script_query(locator) == expected
+
+
+def test_validate_locators_offline_against_snapshot(monkeypatch: Any, mod_and_cls: Tuple[Any, Any]) -> None:
+    mod, SeleniumDomUtils = mod_and_cls
+    queries: List[Any] = []
+    class Lib:
+        def get_webelements(self, loc: str) -> List[str]:
+            return ["E1"]
+        def execute_javascript(self, *code: Any) -> Any:
+            queries.append(code[2])
+            return [{"count": 1, "clickable": False, "metadata": []} for _ in code[2]]
+    _patch_built_in(monkeypatch, mod, Lib())
+    inst = SeleniumDomUtils()
+    snapshot = mod.DomSnapshot(
+        '<body><button id="ok">Go</button><div class="c">x</div><div class="c">y</div></body>'
+    )
+    locators: List[str] = ["css:#ok", "xpath://div[@class='c']", "css:#missing", "id:foo"]
+    out = inst.validate_locators(locators, dom_snapshot=snapshot, check_clickable=False)
+    assert [(s.locator, s.count, s.unique, s.offline) for s in out] == [
+        ("css:#ok", 1, True, True),
+        ("xpath://div[@class='c']", 2, False, True),
+        ("css:#missing", 1, True, False),
+        ("id:foo", 1, True, False),
+    ]
+    assert queries == [[{"css": "#missing"}, ["E1"]]]
+    out = inst.validate_locators(locators, dom_snapshot=snapshot, check_clickable=True)
+    assert [s.offline for s in out] == [True, False, False, False]
+    assert out[0].clickable is True
+
+
+def test_get_region_fingerprint(monkeypatch: Any, mod_and_cls: Tuple[Any, Any]) -> None:
+    mod, SeleniumDomUtils = mod_and_cls
+    _patch_built_in(monkeypatch, mod, object())
+    inst = SeleniumDomUtils()
+    page = '<body><form id="f"><button class="b" type="submit">{}</button></form></body>'
+    snapshot = mod.DomSnapshot(page.format("Go"))
+    fingerprint = inst.get_region_fingerprint("css:#f > button", snapshot)
+    assert fingerprint
+    assert inst.get_region_fingerprint("css:#f > button", mod.DomSnapshot(page.format("Los"))) == fingerprint
+    moved = mod.DomSnapshot('<body><div id="f"><button class="b" type="submit">Go</button></div></body>')
+    assert inst.get_region_fingerprint("css:#f > button", moved) != fingerprint
+    assert inst.get_region_fingerprint("xpath://form/button", snapshot)
+    assert inst.get_region_fingerprint("css:#missing", snapshot) is None
+    assert inst.get_region_fingerprint("id:f", snapshot) == ""
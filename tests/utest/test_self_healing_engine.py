@@ -4,6 +4,7 @@ import pytest
 from unittest.mock import MagicMock, patch
 
 from SelfhealingAgents.self_healing_system.self_healing_engine import SelfHealingEngine
+from SelfhealingAgents.self_healing_system.schemas.internal_state.healing_memo_stats import HealingMemoStats
 
 
 @pytest.fixture
@@ -11,6 +12,10 @@ def listener_state():
     mock_cfg = MagicMock()
     mock_cfg.enable_self_healing = True
     mock_cfg.max_retries = 2
+    mock_cfg.healing_cache_path = None
+    mock_cfg.healing_coordination_path = None
+    mock_cfg.fast_fail_probe = False
+    mock_cfg.speculative_healing = False
     state = MagicMock()
     state.cfg = mock_cfg
     state.context = {}
@@ -20,6 +25,8 @@ def listener_state():
     state.suggestions = ["locator1", "locator2"]
     state.tried_locators = []
     state.report_info = []
+    state.healing_memo = {}
+    state.memo_stats = HealingMemoStats()
     return state
 
 
@@ -125,6 +132,15 @@ def test_try_locator_suggestions_success(engine, listener_state):
     assert listener_state.suggestions == ["locator2"]
 
 
+def test_try_locator_suggestions_last_suggestion_requests_new_locators(engine, listener_state):
+    listener_state.suggestions = ["locator1"]
+    listener_state.should_generate_locators = False
+    with patch.object(engine, "_rerun_keyword_with_suggested_locator", return_value="result"):
+        engine._try_locator_suggestions(MagicMock())
+    assert listener_state.suggestions == []
+    assert listener_state.should_generate_locators is True
+
+
 def test_try_locator_suggestions_empty(engine, listener_state):
     listener_state.suggestions = []
     data = MagicMock()
@@ -166,3 +182,498 @@ def test_rerun_keyword_with_suggested_locator_exception(mock_built_in, engine):
     mock_built_in().run_keyword.side_effect = Exception("fail")
     with pytest.raises(Exception):
         engine._rerun_keyword_with_suggested_locator(data, suggested_locator="locator")
+
+
+@patch("SelfhealingAgents.self_healing_system.self_healing_engine.BuiltIn")
+def test_initiate_healing_uses_cached_healings(mock_built_in, monkeypatch, tmp_path, listener_state):
+    from SelfhealingAgents.self_healing_system.healing_cache import HealingCache
+    from SelfhealingAgents.self_healing_system.schemas.internal_state.locator_status import LocatorStatus
+
+    listener_state.cfg.healing_cache_path = str(tmp_path / "healings.sqlite")
+    listener_state.cfg.healing_cache_ttl_days = 30
+    listener_state.cfg.healing_cache_max_entries = 10
+    listener_state.suggestions = None
+    mock_built_in().replace_variables.side_effect = lambda value: value
+
+    dom_utility = MagicMock()
+    dom_utility.get_region_fingerprint.return_value = "fp"
+    dom_utility.validate_locators.side_effect = lambda locators: [
+        LocatorStatus(locator=locator, valid=locator != "#stale") for locator in locators
+    ]
+    monkeypatch.setattr(
+        "SelfhealingAgents.self_healing_system.self_healing_engine.DomUtilityFactory.create_dom_utility",
+        lambda agent_type: dom_utility,
+    )
+    kickoff = MagicMock()
+    monkeypatch.setattr(
+        "SelfhealingAgents.self_healing_system.self_healing_engine.KickoffMultiAgentSystem.kickoff_healing",
+        kickoff,
+    )
+
+    cache = HealingCache(listener_state.cfg.healing_cache_path)
+    cache.store("Browser", "Click", "#login", "fp", "#stale")
+    cache.store("Browser", "Click", "#login", "other-fp", "#moved")
+    cache.store("Browser", "Click", "#login", "fp", "#sign-in")
+    cache.close()
+
+    engine = SelfHealingEngine(listener_state)
+    data = MagicMock()
+    data.name = "Click"
+    data.args = ["#login"]
+    result_ = MagicMock()
+    result_.owner = "Browser"
+    engine._initiate_healing(data, result_)
+
+    kickoff.assert_not_called()
+    assert listener_state.suggestions == ["#sign-in"]
+    assert listener_state.should_generate_locators is False
+    assert listener_state.retry_count == 0
+    assert [entry.healed_locator for entry in engine._healing_cache.lookup("Browser", "Click", "#login")] == [
+        "#sign-in",
+        "#moved",
+    ]
+
+    data.args = ["#sign-in"]
+    engine._discard_failed_reuse(data)
+    assert [entry.healed_locator for entry in engine._healing_cache.lookup("Browser", "Click", "#login")] == [
+        "#moved"
+    ]
+
+
+@patch("SelfhealingAgents.self_healing_system.self_healing_engine.BuiltIn")
+def test_failed_cached_healing_falls_back_to_agents_with_one_retry(
+    mock_built_in, monkeypatch, tmp_path, listener_state
+):
+    from SelfhealingAgents.self_healing_system.healing_cache import HealingCache
+    from SelfhealingAgents.self_healing_system.schemas.api.locator_healing import LocatorHealingResponse
+    from SelfhealingAgents.self_healing_system.schemas.internal_state.locator_status import LocatorStatus
+
+    listener_state.cfg.max_retries = 1
+    listener_state.cfg.healing_cache_path = str(tmp_path / "healings.sqlite")
+    listener_state.cfg.healing_cache_ttl_days = 30
+    listener_state.cfg.healing_cache_max_entries = 10
+    listener_state.suggestions = None
+    mock_built_in().replace_variables.side_effect = lambda value: value
+    mock_built_in().run_keyword.return_value = None
+    dom_utility = MagicMock()
+    dom_utility.get_region_fingerprint.return_value = "fp"
+    dom_utility.validate_locators.side_effect = lambda locators: [
+        LocatorStatus(locator=locator, valid=True, unique=True, clickable=True) for locator in locators
+    ]
+    monkeypatch.setattr(
+        "SelfhealingAgents.self_healing_system.self_healing_engine.DomUtilityFactory.create_dom_utility",
+        lambda agent_type: dom_utility,
+    )
+    kickoff = MagicMock(return_value=LocatorHealingResponse(suggestions=["#agent"]))
+    monkeypatch.setattr(
+        "SelfhealingAgents.self_healing_system.self_healing_engine.KickoffMultiAgentSystem.kickoff_healing",
+        kickoff,
+    )
+    cache = HealingCache(listener_state.cfg.healing_cache_path)
+    cache.store("Browser", "Click", "#login", "fp", "#sign-in")
+    cache.close()
+
+    engine = SelfHealingEngine(listener_state)
+    data = MagicMock()
+    data.name = "Click"
+    data.args = ["#login"]
+    result_ = MagicMock()
+    result_.owner = "Browser"
+    result_.failed = True
+    result_.assign = []
+    engine._initiate_healing(data, result_)
+    kickoff.assert_not_called()
+    assert listener_state.suggestions == ["#sign-in"]
+
+    # The rerun with the cached locator failed as well
+    listener_state.suggestions = []
+    listener_state.tried_locators.append("#sign-in")
+    rerun = MagicMock()
+    rerun.name = "Click"
+    rerun.args = ["#sign-in"]
+    with patch.object(engine, "_record_report") as record_report:
+        engine.end_keyword(rerun, result_)
+    kickoff.assert_called_once()
+    assert record_report.call_args.args[1] == "#agent"
+    engine.close()
+
+
+@patch("SelfhealingAgents.self_healing_system.self_healing_engine.BuiltIn")
+def test_initiate_healing_retries_memoized_locator(mock_built_in, monkeypatch, engine, listener_state):
+    from SelfhealingAgents.self_healing_system.schemas.api.locator_healing import LocatorHealingResponse
+
+    mock_built_in().replace_variables.side_effect = lambda value: value
+    kickoff = MagicMock(return_value=LocatorHealingResponse(suggestions=["#agent"]))
+    monkeypatch.setattr(
+        "SelfhealingAgents.self_healing_system.self_healing_engine.KickoffMultiAgentSystem.kickoff_healing",
+        kickoff,
+    )
+    listener_state.healing_memo = {("Browser", "Click", "#login"): "#sign-in"}
+    data = MagicMock()
+    data.name = "Click"
+    data.args = ["#login"]
+    data.deepcopy.return_value = "original keyword"
+    result_ = MagicMock()
+    result_.owner = "Browser"
+
+    engine._initiate_healing(data, result_)
+    kickoff.assert_not_called()
+    assert listener_state.suggestions == ["#sign-in"]
+    assert listener_state.retry_count == 0
+
+    listener_state.suggestions = []
+    rerun = MagicMock()
+    rerun.args = ["#sign-in"]
+    engine._discard_failed_reuse(rerun)
+    assert listener_state.healing_memo == {}
+    assert listener_state.memo_stats.misses == 1
+    assert listener_state.should_generate_locators is True
+
+    engine._initiate_healing(rerun, result_)
+    assert kickoff.call_args.args[0] == "original keyword"
+    assert listener_state.suggestions == ["#agent"]
+
+    engine._remember_healing("#agent")
+    assert listener_state.healing_memo == {("Browser", "Click", "#login"): "#agent"}
+    assert listener_state.memo_stats.hits == 0
+
+
+def _memo_setup(monkeypatch, mock_built_in, listener_state, valid_locators):
+    from SelfhealingAgents.self_healing_system.schemas.api.locator_healing import LocatorHealingResponse
+    from SelfhealingAgents.self_healing_system.schemas.internal_state.locator_status import LocatorStatus
+
+    mock_built_in().replace_variables.side_effect = lambda value: value
+    mock_built_in().run_keyword.return_value = None
+    dom_utility = MagicMock()
+    dom_utility.validate_locators.side_effect = lambda locators: [
+        LocatorStatus(locator=locator, valid=locator in valid_locators, unique=True, clickable=True)
+        for locator in locators
+    ]
+    monkeypatch.setattr(
+        "SelfhealingAgents.self_healing_system.self_healing_engine.DomUtilityFactory.create_dom_utility",
+        lambda agent_type: dom_utility,
+    )
+    kickoff = MagicMock(return_value=LocatorHealingResponse(suggestions=["#agent"]))
+    monkeypatch.setattr(
+        "SelfhealingAgents.self_healing_system.self_healing_engine.KickoffMultiAgentSystem.kickoff_healing",
+        kickoff,
+    )
+    listener_state.healing_memo = {("Browser", "Click", "#login"): "#sign-in"}
+    data = MagicMock()
+    data.name = "Click"
+    data.args = ["#login"]
+    data.deepcopy.return_value = "original keyword"
+    result_ = MagicMock()
+    result_.owner = "Browser"
+    result_.failed = True
+    result_.assign = []
+    return kickoff, data, result_
+
+
+@patch("SelfhealingAgents.self_healing_system.self_healing_engine.BuiltIn")
+def test_failed_memoized_locator_falls_back_to_agents_with_one_retry(
+    mock_built_in, monkeypatch, engine, listener_state
+):
+    kickoff, data, result_ = _memo_setup(monkeypatch, mock_built_in, listener_state, {"#sign-in", "#agent"})
+    listener_state.cfg.max_retries = 1
+    listener_state.suggestions = None
+
+    engine._initiate_healing(data, result_)
+    kickoff.assert_not_called()
+    assert listener_state.suggestions == ["#sign-in"]
+
+    # The rerun with the memoized locator failed as well
+    listener_state.suggestions = []
+    listener_state.tried_locators.append("#sign-in")
+    rerun = MagicMock()
+    rerun.name = "Click"
+    rerun.args = ["#sign-in"]
+    with patch.object(engine, "_record_report") as record_report:
+        engine.end_keyword(rerun, result_)
+    kickoff.assert_called_once()
+    assert record_report.call_args.args[1] == "#agent"
+
+
+@patch("SelfhealingAgents.self_healing_system.self_healing_engine.BuiltIn")
+def test_stale_memoized_locator_is_not_rerun(mock_built_in, monkeypatch, engine, listener_state):
+    kickoff, data, result_ = _memo_setup(monkeypatch, mock_built_in, listener_state, {"#agent"})
+    listener_state.suggestions = None
+
+    engine._initiate_healing(data, result_)
+    kickoff.assert_called_once()
+    assert listener_state.suggestions == ["#agent"]
+    assert listener_state.healing_memo == {}
+    assert listener_state.memo_stats.misses == 1
+    assert listener_state.tried_locators == ["#sign-in"]
+
+
+@patch("SelfhealingAgents.self_healing_system.self_healing_engine.BuiltIn")
+def test_memoized_locator_hit_is_counted(mock_built_in, monkeypatch, engine, listener_state):
+    mock_built_in().replace_variables.side_effect = lambda value: value
+    listener_state.healing_memo = {("Browser", "Click", "#login"): "#sign-in"}
+    data = MagicMock()
+    data.name = "Click"
+    data.args = ["#login"]
+    result_ = MagicMock()
+    result_.owner = "Browser"
+
+    engine._initiate_healing(data, result_)
+    engine._remember_healing("#sign-in")
+    assert listener_state.memo_stats.hits == 1
+    assert listener_state.memo_stats.misses == 0
+
+
+def test_initiate_healing_ranks_verified_suggestions(monkeypatch, engine, listener_state):
+    from SelfhealingAgents.self_healing_system.schemas.api.locator_healing import LocatorHealingResponse
+    from SelfhealingAgents.self_healing_system.schemas.internal_state.locator_status import LocatorStatus
+
+    statuses = {
+        "#missing": LocatorStatus(locator="#missing"),
+        "#label": LocatorStatus(locator="#label", valid=True, unique=True, visible=True),
+        "#hidden": LocatorStatus(locator="#hidden", valid=True, unique=True, clickable=True),
+        "#button": LocatorStatus(locator="#button", valid=True, unique=True, clickable=True, visible=True),
+    }
+    dom_utility = MagicMock()
+    dom_utility.validate_locators.side_effect = lambda locators: [statuses[loc] for loc in locators]
+    monkeypatch.setattr(
+        "SelfhealingAgents.self_healing_system.self_healing_engine.DomUtilityFactory.create_dom_utility",
+        lambda agent_type: dom_utility,
+    )
+    kickoff = MagicMock(
+        side_effect=[
+            LocatorHealingResponse(suggestions=["#missing", "#label"]),
+            LocatorHealingResponse(suggestions=["#hidden", "#button", "#missing"]),
+        ]
+    )
+    monkeypatch.setattr(
+        "SelfhealingAgents.self_healing_system.self_healing_engine.KickoffMultiAgentSystem.kickoff_healing",
+        kickoff,
+    )
+    listener_state.suggestions = []
+    data = MagicMock()
+    data.name = "Click"
+    result_ = MagicMock()
+    result_.owner = "Browser"
+
+    engine._initiate_healing(data, result_)
+    assert kickoff.call_count == 2
+    assert kickoff.call_args.kwargs["dom_utility"] is dom_utility
+    assert listener_state.suggestions == ["#button", "#hidden"]
+    assert listener_state.retry_count == 2
+    assert listener_state.tried_locators == ["#missing", "#label", "#missing"]
+
+
+def _fast_fail_setup(monkeypatch, mock_built_in, listener_state, absent):
+    from SelfhealingAgents.self_healing_system.schemas.api.locator_healing import LocatorHealingResponse
+    from SelfhealingAgents.self_healing_system.schemas.internal_state.locator_status import LocatorStatus
+
+    class Library:
+        def click(self, selector, button="left"):
+            pass
+
+        def page_should_not_contain_element(self, locator, message=None):
+            pass
+
+        def wait_for_elements_state(self, selector, state="visible", timeout=None):
+            pass
+
+    listener_state.cfg.fast_fail_probe = True
+    listener_state.cfg.fast_fail_probe_timeout = 0
+    listener_state.suggestions = None
+    mock_built_in().replace_variables.side_effect = lambda value: value
+    mock_built_in().get_library_instance.return_value = Library()
+    dom_utility = MagicMock()
+    dom_utility.is_locator_absent.return_value = absent
+    dom_utility.validate_locators.side_effect = lambda locators: [
+        LocatorStatus(locator=locator, valid=True, unique=True, clickable=True) for locator in locators
+    ]
+    monkeypatch.setattr(
+        "SelfhealingAgents.self_healing_system.self_healing_engine.DomUtilityFactory.create_dom_utility",
+        lambda agent_type: dom_utility,
+    )
+    kickoff = MagicMock(return_value=LocatorHealingResponse(suggestions=["#sign-in"]))
+    kickoff.dom_utility = dom_utility
+    kickoff.messages = []
+    def fake_kickoff(data, result_, **kwargs):
+        kickoff.messages.append(result_.message)
+        return kickoff(data, result_, **kwargs)
+    monkeypatch.setattr(
+        "SelfhealingAgents.self_healing_system.self_healing_engine.KickoffMultiAgentSystem.kickoff_healing",
+        fake_kickoff,
+    )
+    return kickoff
+
+
+@patch("SelfhealingAgents.self_healing_system.self_healing_engine.BuiltIn")
+def test_start_keyword_heals_absent_locator_before_run(mock_built_in, monkeypatch, engine, listener_state):
+    kickoff = _fast_fail_setup(monkeypatch, mock_built_in, listener_state, absent=True)
+    data = MagicMock()
+    data.name = "Click"
+    data.args = ["#login", "left"]
+    data.deepcopy.return_value = "original keyword"
+    result_ = MagicMock()
+    result_.owner = "Browser"
+    result_.message = ""
+
+    engine.start_keyword(data, result_)
+    assert kickoff.messages == ["Element with locator '#login' not found."]
+    assert result_.message == ""
+    assert data.args == ["#sign-in", "left"]
+    assert result_.args == ("#sign-in", "left")
+
+    result_.failed = False
+    result_.status = "PASS"
+    with patch.object(engine, "_record_report") as record_report:
+        engine.end_keyword(data, result_)
+    record_report.assert_called_once_with("original keyword", "#sign-in", "PASS")
+    assert listener_state.healing_memo == {("Browser", "Click", "#login"): "#sign-in"}
+    assert engine._fast_fail_data is None
+
+
+@patch("SelfhealingAgents.self_healing_system.self_healing_engine.BuiltIn")
+def test_start_keyword_leaves_present_locator(mock_built_in, monkeypatch, engine, listener_state):
+    kickoff = _fast_fail_setup(monkeypatch, mock_built_in, listener_state, absent=False)
+    data = MagicMock()
+    data.name = "Click"
+    data.args = ["#login"]
+    result_ = MagicMock()
+    result_.owner = "Browser"
+
+    engine.start_keyword(data, result_)
+    kickoff.assert_not_called()
+    assert data.args == ["#login"]
+    assert engine._fast_fail_data is None
+
+
+@pytest.mark.parametrize(
+    "keyword_name, args",
+    [
+        ("Page Should Not Contain Element", ["#spinner"]),
+        ("Browser.Wait For Elements State", ["#spinner", "detached"]),
+    ],
+)
+@patch("SelfhealingAgents.self_healing_system.self_healing_engine.BuiltIn")
+def test_start_keyword_does_not_probe_assertions_and_waits(
+    mock_built_in, monkeypatch, engine, listener_state, keyword_name, args
+):
+    kickoff = _fast_fail_setup(monkeypatch, mock_built_in, listener_state, absent=True)
+    data = MagicMock()
+    data.name = keyword_name
+    data.args = list(args)
+    result_ = MagicMock()
+    result_.owner = "Browser"
+
+    engine.start_keyword(data, result_)
+    kickoff.assert_not_called()
+    kickoff.dom_utility.is_locator_absent.assert_not_called()
+    assert data.args == args
+
+
+@patch("SelfhealingAgents.self_healing_system.self_healing_engine.BuiltIn")
+def test_start_keyword_keeps_locator_of_element_appearing_while_healing(
+    mock_built_in, monkeypatch, engine, listener_state
+):
+    kickoff = _fast_fail_setup(monkeypatch, mock_built_in, listener_state, absent=True)
+    kickoff.dom_utility.is_locator_absent.side_effect = [True, False]
+    data = MagicMock()
+    data.name = "Click"
+    data.args = ["#login"]
+    result_ = MagicMock()
+    result_.owner = "Browser"
+    result_.message = ""
+
+    engine.start_keyword(data, result_)
+    kickoff.assert_called_once()
+    assert data.args == ["#login"]
+    assert engine._fast_fail_data is None
+    assert listener_state.suggestions is None
+
+
+@patch("SelfhealingAgents.self_healing_system.self_healing_engine.BuiltIn")
+def test_end_keyword_remembers_upcoming_locators(mock_built_in, monkeypatch, listener_state):
+    class Library:
+        def click(self, selector):
+            pass
+
+        def fill_text(self, selector, txt):
+            pass
+
+        def go_to(self, url):
+            pass
+
+    listener_state.cfg.speculative_healing = True
+    mock_built_in().replace_variables.side_effect = lambda value: value
+    mock_built_in().get_library_instance.return_value = Library()
+    dom_utility = MagicMock()
+    dom_utility.capture_snapshot.return_value = "snapshot"
+    monkeypatch.setattr(
+        "SelfhealingAgents.self_healing_system.self_healing_engine.DomUtilityFactory.create_dom_utility",
+        lambda agent_type: dom_utility,
+    )
+    engine = SelfHealingEngine(listener_state)
+    engine._speculative_healer = MagicMock()
+
+    def keyword(name, *args):
+        return types.SimpleNamespace(type="KEYWORD", name=name, args=list(args), parent=test)
+
+    test = types.SimpleNamespace(body=[])
+    submit = keyword("Click", "#open")
+    test.body.extend(
+        [
+            submit,
+            keyword("Fill Text", "#user", "demo"),
+            types.SimpleNamespace(type="IF"),
+            keyword("Go To", "https://example.com"),
+            keyword("Browser.Click", "#login"),
+        ]
+    )
+    result_ = MagicMock()
+    result_.failed = False
+    result_.owner = "Browser"
+
+    engine.end_keyword(submit, result_)
+    assert engine._speculative_targets == [("#user", "Fill Text"), ("#login", "Click")]
+    dom_utility.capture_snapshot.assert_not_called()
+    engine._speculative_healer.prepare.assert_not_called()
+
+
+@patch("SelfhealingAgents.self_healing_system.self_healing_engine.BuiltIn")
+def test_initiate_healing_claims_locator_for_coordinated_workers(
+    mock_built_in, monkeypatch, tmp_path, listener_state
+):
+    from SelfhealingAgents.self_healing_system.healing_coordinator import HealingCoordinator
+    from SelfhealingAgents.self_healing_system.schemas.api.locator_healing import LocatorHealingResponse
+
+    listener_state.cfg.healing_coordination_path = str(tmp_path / "coordination.sqlite")
+    listener_state.cfg.healing_cache_ttl_days = 30
+    listener_state.cfg.healing_cache_max_entries = 10
+    listener_state.cfg.healing_coordination_requests_per_minute = 0
+    listener_state.cfg.healing_claim_timeout = 1
+    listener_state.cfg.healing_claim_wait = 1
+    listener_state.suggestions = None
+    mock_built_in().replace_variables.side_effect = lambda value: value
+    monkeypatch.setattr(
+        "SelfhealingAgents.self_healing_system.self_healing_engine.KickoffMultiAgentSystem.kickoff_healing",
+        MagicMock(return_value=LocatorHealingResponse(suggestions=["#agent"])),
+    )
+    monkeypatch.setattr(
+        "SelfhealingAgents.self_healing_system.self_healing_engine.DomUtilityFactory.create_dom_utility",
+        MagicMock(side_effect=ValueError("no library")),
+    )
+    other_worker = HealingCoordinator(listener_state.cfg.healing_coordination_path, claim_timeout=1)
+
+    engine = SelfHealingEngine(listener_state)
+    data = MagicMock()
+    data.name = "Click"
+    data.args = ["#login"]
+    result_ = MagicMock()
+    result_.owner = "Browser"
+    engine._initiate_healing(data, result_)
+
+    claim_key = "Browser\x1fClick\x1f#login"
+    assert listener_state.suggestions == ["#agent"]
+    assert not other_worker.claim(claim_key)
+    engine._reset_state()
+    assert other_worker.claim(claim_key)
+    other_worker.close()
+    engine.close()
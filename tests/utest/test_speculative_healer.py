@@ -0,0 +1,56 @@
+from typing import List, Tuple
+from unittest.mock import MagicMock
+
+from SelfhealingAgents.self_healing_system.context_retrieving.dom_snapshot import DomSnapshot
+from SelfhealingAgents.self_healing_system.speculative_healer import SpeculativeHealer
+
+
+def _dom_utility() -> MagicMock:
+    dom_utility: MagicMock = MagicMock()
+    dom_utility.get_locator_proposals.side_effect = (
+        lambda locator, keyword_name, dom_snapshot: [f"{locator}-proposal", keyword_name]
+    )
+    return dom_utility
+
+
+def test_resolve_returns_copy_of_prepared_snapshot_with_proposals() -> None:
+    healer: SpeculativeHealer = SpeculativeHealer()
+    prepared: DomSnapshot = DomSnapshot("<body><button>Login</button></body>")
+    targets: List[Tuple[str, str]] = [("#login", "Click"), ("#login", "Click"), ("#user", "Fill Text")]
+    healer.prepare(_dom_utility(), prepared, targets)
+
+    resolved: DomSnapshot = healer.resolve(DomSnapshot("<body><button>Login</button></body>"))
+    assert resolved is not prepared
+    assert resolved.simplified_dom == prepared.simplified_dom
+    assert resolved.locator_proposals == {
+        ("#login", "Click"): ["#login-proposal", "Click"],
+        ("#user", "Fill Text"): ["#user-proposal", "Fill Text"],
+    }
+    healer.close()
+
+
+def test_resolve_ignores_proposals_of_a_changed_page() -> None:
+    healer: SpeculativeHealer = SpeculativeHealer()
+    healer.prepare(_dom_utility(), DomSnapshot("<body><button>Login</button></body>"), [("#login", "Click")])
+
+    current: DomSnapshot = DomSnapshot("<body><button>Logout</button></body>")
+    assert healer.resolve(current) is current
+    assert current.locator_proposals == {}
+    healer.close()
+
+
+def test_prepare_leaves_snapshot_of_caller_untouched() -> None:
+    healer: SpeculativeHealer = SpeculativeHealer()
+    snapshot: DomSnapshot = DomSnapshot("<body><button>Login</button></body>")
+    healer.prepare(_dom_utility(), snapshot, [("#login", "Click")])
+
+    healer.resolve(DomSnapshot("<body><button>Login</button></body>"))
+    assert snapshot.locator_proposals == {}
+    assert snapshot._soup is None
+    healer.close()
+
+
+def test_resolve_without_preparation() -> None:
+    healer: SpeculativeHealer = SpeculativeHealer()
+    current: DomSnapshot = DomSnapshot("<body></body>")
+    assert healer.resolve(current) is current